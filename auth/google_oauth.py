@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
 
+from fastapi.concurrency import run_in_threadpool
 from google.auth.transport.requests import Request as GoogleAuthRequest
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
@@ -19,18 +24,53 @@ SCOPES = [
     "https://www.googleapis.com/auth/documents",
 ]
 
+# Serialises token refreshes so concurrent requests share one upstream call. Created lazily per event
+# loop: on Python 3.9 a lock built at import binds to whatever loop get_event_loop() returned then
+_refresh_lock: asyncio.Lock | None = None
+_refresh_lock_loop: asyncio.AbstractEventLoop | None = None
+_cached_creds: Credentials | None = None
 
-def build_flow(state: str | None = None) -> Flow:
-    """Build a Google OAuth2 flow from client secrets file or config."""
-    client_config = {
-        "web": {
-            "client_id": settings.google_client_id,
-            "client_secret": settings.google_client_secret,
-            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-            "token_uri": "https://oauth2.googleapis.com/token",
-            "redirect_uris": [settings.google_redirect_uri],
+# Background refresher: renew this long before expiry, re-check the stored token at least this often
+_REFRESH_LEAD_SECONDS = 300
+_REFRESH_POLL_SECONDS = 300
+_REFRESH_RETRY_SECONDS = 60
+_refresher_task: asyncio.Task | None = None
+
+
+def _get_refresh_lock() -> asyncio.Lock:
+    """Return the refresh lock for the running event loop, creating it on first use."""
+    global _refresh_lock, _refresh_lock_loop
+    loop = asyncio.get_running_loop()
+    if _refresh_lock is None or _refresh_lock_loop is not loop:
+        _refresh_lock, _refresh_lock_loop = asyncio.Lock(), loop
+    return _refresh_lock
+
+
+@lru_cache(maxsize=4)
+def _client_config(client_id: str, client_secret: str, redirect_uri: str) -> MappingProxyType:
+    """Build and validate the OAuth client config once per distinct setting values."""
+    if not redirect_uri.startswith(("https://", "http://")):
+        raise ValueError(f"GOOGLE_REDIRECT_URI must be an http(s) URL: {redirect_uri!r}")
+    return MappingProxyType(
+        {
+            "web": MappingProxyType(
+                {
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                    "token_uri": "https://oauth2.googleapis.com/token",
+                    "redirect_uris": (redirect_uri,),
+                }
+            )
         }
-    }
+    )
+
+
+def build_flow(state: str | None = None) -> Flow:
+    """Build a Google OAuth2 flow from the cached client config."""
+    client_config = _client_config(
+        settings.google_client_id, settings.google_client_secret, settings.google_redirect_uri
+    )
     flow = Flow.from_client_config(client_config, scopes=SCOPES, state=state)
     flow.redirect_uri = settings.google_redirect_uri
     return flow
@@ -45,18 +85,50 @@ def credentials_from_token_row(token_row: dict) -> Credentials:
         client_id=settings.google_client_id,
         client_secret=settings.google_client_secret,
         scopes=token_row["scopes"].split(","),
+        expiry=_parse_expiry(token_row.get("token_expiry")),
     )
 
 
-def refresh_if_needed(creds: Credentials) -> tuple[bool, Credentials]:
-    """Refresh credentials if expired. Returns (was_refreshed, creds)."""
+def _parse_expiry(value: str | None) -> datetime | None:
+    """Parse a stored expiry timestamp into the naive UTC datetime google-auth expects."""
+    if not value:
+        return None
+    try:
+        expiry = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        logger.warning("Unparseable token expiry: %s", value)
+        return None
+    if expiry.tzinfo is not None:
+        expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+    return expiry
+
+
+async def refresh_if_needed(creds: Credentials) -> tuple[bool, Credentials]:
+    """Refresh credentials if expired. Returns (was_refreshed, creds).
+
+    The token endpoint call is blocking, so it runs in a worker thread.
+    Concurrent callers wait on a shared lock; whoever refreshes first caches
+    the result and the others reuse it instead of refreshing again. Only that
+    first caller gets was_refreshed=True and needs to persist the new token.
+    """
     if creds.valid:
         return False, creds
-    if creds.refresh_token:
-        creds.refresh(GoogleAuthRequest())
-        logger.info("OAuth token refreshed")
-        return True, creds
-    raise ValueError("Token expired and no refresh_token available")
+    if not creds.refresh_token:
+        raise ValueError("Token expired and no refresh_token available")
+    async with _get_refresh_lock():
+        cached = _cached_creds
+        if cached is not None and cached.valid and cached.refresh_token == creds.refresh_token:
+            return False, cached
+        await _refresh_locked(creds)
+    return True, creds
+
+
+async def _refresh_locked(creds: Credentials) -> None:
+    """Refresh credentials unconditionally. Caller must hold the refresh lock."""
+    global _cached_creds
+    await run_in_threadpool(creds.refresh, GoogleAuthRequest())
+    _cached_creds = creds
+    logger.info("OAuth token refreshed")
 
 
 def token_expiry_iso(creds: Credentials) -> str:
@@ -64,3 +136,58 @@ def token_expiry_iso(creds: Credentials) -> str:
     if creds.expiry:
         return creds.expiry.isoformat()
     return (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+
+
+async def refresh_stored_token(repo: Any) -> float:
+    """Refresh the stored token if it is close to expiry.
+
+    Args:
+        repo: Repository holding the OAuth token row.
+
+    Returns:
+        Seconds to wait before checking again.
+    """
+    token_row = await repo.get_token()
+    if not token_row or not token_row["refresh_token"]:
+        return _REFRESH_POLL_SECONDS
+
+    creds = credentials_from_token_row(token_row)
+    if creds.expiry is not None:
+        remaining = (creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+        if remaining > _REFRESH_LEAD_SECONDS:
+            return min(remaining - _REFRESH_LEAD_SECONDS, _REFRESH_POLL_SECONDS)
+
+    async with _get_refresh_lock():
+        await _refresh_locked(creds)
+    await repo.update_token("default", creds.token, token_expiry_iso(creds))
+    return _REFRESH_POLL_SECONDS
+
+
+async def _refresher_loop(repo: Any) -> None:
+    """Keep the stored token fresh so request handlers rarely refresh inline."""
+    logger.info("OAuth token refresher started (lead=%ds)", _REFRESH_LEAD_SECONDS)
+    while True:
+        try:
+            delay = await refresh_stored_token(repo)
+        except Exception:
+            logger.exception("Background OAuth token refresh failed")
+            delay = _REFRESH_RETRY_SECONDS
+        await asyncio.sleep(delay)
+
+
+def start_token_refresher(repo: Any) -> None:
+    """Start the background token refresh task."""
+    global _refresher_task
+    if _refresher_task is not None:
+        logger.warning("Token refresher already running")
+        return
+    _refresher_task = asyncio.create_task(_refresher_loop(repo))
+
+
+def stop_token_refresher() -> None:
+    """Cancel the background token refresh task."""
+    global _refresher_task
+    if _refresher_task is not None:
+        _refresher_task.cancel()
+        _refresher_task = None
+        logger.info("Token refresher stopped")
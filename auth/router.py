@@ -1,6 +1,7 @@
 """OAuth2 flow endpoints for Google account linking."""
 
 import logging
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
@@ -18,6 +19,9 @@ logger = logging.getLogger("meeting-proxy.auth")
 
 router = APIRouter(prefix="/auth/google", tags=["auth"])
 
+# Status checks re-read the DB once the cached token is this close to expiry
+_CACHE_EXPIRY_MARGIN = timedelta(minutes=5)
+
 
 def _get_repo(request: Request) -> Any:
     repo = getattr(request.app.state, "repo", None)
@@ -26,6 +30,24 @@ def _get_repo(request: Request) -> Any:
     return repo
 
 
+def _get_cached_credentials(request: Request) -> tuple[Any, str] | None:
+    """Return (creds, scopes) cached on app state if still comfortably valid."""
+    state = request.app.state
+    creds = getattr(state, "cached_creds", None)
+    if creds is None or not creds.valid or creds.expiry is None:
+        return None
+    if creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None) < _CACHE_EXPIRY_MARGIN:
+        return None
+    return creds, state.cached_creds_scopes
+
+
+def _invalidate_cached_credentials(request: Request) -> None:
+    """Drop cached credentials and bump the version so in-flight reads don't repopulate it."""
+    state = request.app.state
+    state.cached_creds = None
+    state.cached_creds_version = getattr(state, "cached_creds_version", 0) + 1
+
+
 @router.get("/login")
 async def google_login(request: Request) -> RedirectResponse:
     """Redirect user to Google OAuth consent screen."""
@@ -57,6 +79,7 @@ async def google_callback(request: Request, code: str, state: str) -> RedirectRe
         token_expiry=token_expiry_iso(creds),
         scopes=",".join(SCOPES),
     )
+    _invalidate_cached_credentials(request)
     logger.info("OAuth tokens saved for default user")
     return RedirectResponse(url="/static/index.html?auth=success")
 
@@ -64,16 +87,25 @@ async def google_callback(request: Request, code: str, state: str) -> RedirectRe
 @router.get("/status")
 async def google_auth_status(request: Request) -> JSONResponse:
     """Check current authentication status."""
+    cached = _get_cached_credentials(request)
+    if cached is not None:
+        creds, scopes = cached
+        return JSONResponse({"authenticated": True, "scopes": scopes, "expires": token_expiry_iso(creds)})
+
     repo = _get_repo(request)
+    version = getattr(request.app.state, "cached_creds_version", 0)
     token_row = await repo.get_token()
     if not token_row:
         return JSONResponse({"authenticated": False})
 
     try:
         creds = credentials_from_token_row(token_row)
-        refreshed, creds = refresh_if_needed(creds)
+        refreshed, creds = await refresh_if_needed(creds)
         if refreshed:
             await repo.update_token("default", creds.token, token_expiry_iso(creds))
+        if getattr(request.app.state, "cached_creds_version", 0) == version:
+            request.app.state.cached_creds = creds
+            request.app.state.cached_creds_scopes = token_row["scopes"]
         return JSONResponse(
             {
                 "authenticated": True,
@@ -95,16 +127,15 @@ async def google_revoke(request: Request) -> JSONResponse:
         return JSONResponse({"detail": "No tokens to revoke"})
 
     try:
-        import httpx
-
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                "https://oauth2.googleapis.com/revoke",
-                params={"token": token_row["access_token"]},
-            )
+        client = request.app.state.http_client
+        await client.post(
+            "https://oauth2.googleapis.com/revoke",
+            params={"token": token_row["access_token"]},
+        )
     except Exception:
         logger.warning("Remote token revocation failed (continuing with local delete)")
 
     await repo.delete_token()
+    _invalidate_cached_credentials(request)
     logger.info("OAuth tokens revoked and deleted")
     return JSONResponse({"detail": "Tokens revoked"})
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import hmac
 import logging
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -20,14 +22,30 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 _FILENAME_RE = re.compile(r"^[a-zA-Z0-9_\-]+\.(md|txt)$")
 
 
+@lru_cache(maxsize=2)
+def _encoded_api_key(api_key: str) -> bytes:
+    """UTF-8 bytes of the configured API key, encoded once per key value."""
+    return api_key.encode("utf-8")
+
+
+def require_api_key(x_api_key: str | None) -> None:
+    """Raise 401 unless the header matches the configured API key (no-op when unset).
+
+    Both sides are compared as bytes, so non-ASCII header values are rejected
+    instead of making compare_digest raise.
+    """
+    api_key = settings.api_key
+    if not api_key:
+        return
+    if not x_api_key or not hmac.compare_digest(x_api_key.encode("utf-8"), _encoded_api_key(api_key)):
+        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+
+
 def _admin_auth_guard(
     x_api_key: str | None = Header(default=None, alias="X-API-Key"),
 ) -> None:
-    """HMAC API key guard for admin endpoints (same pattern as main app)."""
-    if not settings.api_key:
-        return
-    if not x_api_key or not hmac.compare_digest(x_api_key, settings.api_key):
-        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+    """HMAC API key guard for admin endpoints (same check as the main app)."""
+    require_api_key(x_api_key)
 
 
 def _validate_filename(filename: str) -> Path:
@@ -37,13 +55,40 @@ def _validate_filename(filename: str) -> Path:
             status_code=400,
             detail="Invalid filename. Use alphanumeric, dash, underscore with .md or .txt extension",
         )
-    knowledge_dir = Path(settings.knowledge_dir).resolve()
+    knowledge_dir = _resolved_knowledge_dir(settings.knowledge_dir)
     target = (knowledge_dir / filename).resolve()
-    if not str(target).startswith(str(knowledge_dir)):
-        raise HTTPException(status_code=400, detail="Path traversal detected")
+    try:
+        target.relative_to(knowledge_dir)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Path traversal detected") from None
     return target
 
 
+@lru_cache(maxsize=4)
+def _resolved_knowledge_dir(knowledge_dir: str) -> Path:
+    """Resolve the knowledge dir once per configured value."""
+    return Path(knowledge_dir).resolve()
+
+
+def _file_etag(path: Path) -> str:
+    """Weak ETag derived from mtime and size, so no file read is needed."""
+    st = path.stat()
+    return f'W/"{st.st_mtime_ns}-{st.st_size}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header lists the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
+
+
+def _not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
 def _get_singletons() -> tuple[Any, Any, Any]:
     """Get persona, knowledge_base, conversation_manager from bot.router."""
     from bot.router import get_conversation_manager, get_knowledge_base, get_persona
@@ -75,13 +120,20 @@ def admin_status(_: None = Depends(_admin_auth_guard)) -> JSONResponse:
 
 
 @router.get("/profile")
-def get_profile(_: None = Depends(_admin_auth_guard)) -> JSONResponse:
-    """Get persona profile content."""
+def get_profile(request: Request, _: None = Depends(_admin_auth_guard)) -> Response:
+    """Get persona profile content (304 if the client's ETag is current)."""
     profile_path = Path(settings.persona_profile_path)
-    if not profile_path.exists():
+    try:
+        etag = _file_etag(profile_path)
+    except FileNotFoundError:
         return JSONResponse({"content": "", "path": str(profile_path)})
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
     content = profile_path.read_text(encoding="utf-8")
-    return JSONResponse({"content": content, "path": str(profile_path)})
+    return JSONResponse(
+        {"content": content, "path": str(profile_path)},
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 @router.put("/profile")
@@ -175,12 +227,14 @@ async def tts_preview(
         raise HTTPException(status_code=400, detail="text too long (max 500 chars)")
 
     from bot.tts import is_available as tts_available
-    from bot.tts import synthesize_japanese
 
     if not tts_available():
         raise HTTPException(status_code=503, detail="TTS is not available")
 
-    audio_bytes = synthesize_japanese(text)
+    from bot.tts import synthesize_japanese
+
+    # synthesize_japanese caches per text, voice and rate, so repeated previews are not re-synthesized
+    audio_bytes = await synthesize_japanese(text)
     return Response(content=audio_bytes, media_type="audio/mpeg")
 
 
@@ -194,29 +248,36 @@ def list_knowledge(_: None = Depends(_admin_auth_guard)) -> JSONResponse:
     if not knowledge_dir.exists():
         return JSONResponse({"documents": []})
 
-    documents: list[dict[str, Any]] = []
-    for path in sorted(knowledge_dir.glob("*")):
-        if path.is_file() and path.suffix.lower() in {".md", ".txt"}:
-            documents.append(
-                {
-                    "filename": path.name,
-                    "size": path.stat().st_size,
-                }
-            )
+    # DirEntry caches file type and stat from the directory read
+    with os.scandir(knowledge_dir) as it:
+        entries = sorted(
+            (entry.name, entry.stat().st_size)
+            for entry in it
+            if entry.is_file() and entry.name.lower().endswith((".md", ".txt"))
+        )
+    documents: list[dict[str, Any]] = [{"filename": name, "size": size} for name, size in entries]
     return JSONResponse({"documents": documents})
 
 
 @router.get("/knowledge/{filename}")
 def get_knowledge_doc(
     filename: str,
+    request: Request,
     _: None = Depends(_admin_auth_guard),
-) -> JSONResponse:
-    """Get a knowledge base document content."""
+) -> Response:
+    """Get a knowledge base document content (304 if the client's ETag is current)."""
     target = _validate_filename(filename)
-    if not target.exists():
-        raise HTTPException(status_code=404, detail="Document not found")
+    try:
+        etag = _file_etag(target)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Document not found") from None
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
     content = target.read_text(encoding="utf-8")
-    return JSONResponse({"filename": filename, "content": content})
+    return JSONResponse(
+        {"filename": filename, "content": content},
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 @router.put("/knowledge/{filename}")
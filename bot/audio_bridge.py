@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
+from fractions import Fraction
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -18,29 +20,162 @@ logger = logging.getLogger("meeting-proxy.audio-bridge")
 # BlackHole typically operates at 48kHz; Gemini expects 16kHz mono PCM
 _BLACKHOLE_NATIVE_RATE = 48000
 
+# Capture queue holds at most this much audio; older chunks are dropped when the consumer stalls
+_AUDIO_QUEUE_SECONDS = 1.0
 
-def _find_device_index(name: str, kind: str) -> int | None:
-    """Find a sounddevice device index by name substring.
+# Filter length on each side of the centre tap, in zero crossings of the sinc kernel
+_HALF_ZERO_CROSSINGS = 8
+
+
+def _find_device_index(name: str, kind: str, devices: Sequence[dict[str, Any]] | None = None) -> int | None:
+    """Find a sounddevice device index by name.
+
+    An exact (case-insensitive) name match wins over a substring match.
 
     Args:
-        name: Device name substring to search for.
+        name: Device name or name substring to search for.
         kind: "input" or "output".
+        devices: Result of ``sd.query_devices()`` to search; queried if omitted.
 
     Returns:
         Device index or None if not found.
     """
-    devices = sd.query_devices()
+    if devices is None:
+        devices = sd.query_devices()
+    if kind not in ("input", "output"):
+        return None
+    channels_key = f"max_{kind}_channels"
+    needle = name.lower()
+    by_name: dict[str, int] = {}
     for i, dev in enumerate(devices):
-        if name.lower() in dev["name"].lower():
-            if kind == "input" and dev["max_input_channels"] > 0:
-                return i
-            if kind == "output" and dev["max_output_channels"] > 0:
-                return i
+        if dev[channels_key] > 0:
+            by_name.setdefault(dev["name"].lower(), i)
+    if needle in by_name:
+        return by_name[needle]
+    for dev_name, i in by_name.items():
+        if needle in dev_name:
+            return i
     return None
 
 
+@lru_cache(maxsize=8)
+def _design_polyphase_filter(src_rate: int, dst_rate: int) -> tuple[int, int, np.ndarray]:
+    """Design a Hann-windowed sinc low-pass split into polyphase branches.
+
+    The returned array is shared between resamplers via the cache and is
+    therefore marked read-only.
+
+    Args:
+        src_rate: Source sample rate.
+        dst_rate: Destination sample rate.
+
+    Returns:
+        (up, down, phases) where phases has shape (up, taps_per_phase).
+    """
+    up, down = Fraction(dst_rate, src_rate).limit_denominator(1000).as_integer_ratio()
+    taps_per_phase = -(-2 * _HALF_ZERO_CROSSINGS * max(up, down) // up)
+    num_taps = taps_per_phase * up
+    cutoff = 1.0 / max(up, down)
+    # Odd length so the group delay is a whole number of samples; any spare tap stays zero
+    length = num_taps - 1 + num_taps % 2
+    n = np.arange(length) - (length - 1) / 2
+    taps = np.zeros(num_taps)
+    taps[:length] = cutoff * np.sinc(cutoff * n) * np.hanning(length)
+    taps *= up / taps.sum()
+    # phases[p, j] = taps[p + j * up]
+    phases = np.ascontiguousarray(taps.reshape(taps_per_phase, up).T, dtype=np.float32)
+    phases.flags.writeable = False
+    return up, down, phases
+
+
+class _PolyphaseResampler:
+    """Streaming rational resampler using a precomputed polyphase FIR.
+
+    Keeps the tail of the previous block so consecutive chunks are filtered
+    continuously instead of being zero-padded at every boundary. Each output
+    sample is the dot product of one polyphase branch with a window of input
+    samples; outputs sharing a branch are computed together on a strided view.
+
+    With ``compensate_delay`` the filter's group delay is removed, so output
+    sample ``k`` lines up with input time ``k * down / up``. This holds back
+    the last few outputs until :meth:`flush` is called.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int, compensate_delay: bool = False) -> None:
+        self._passthrough = src_rate == dst_rate
+        self._up, self._down, phases = _design_polyphase_filter(src_rate, dst_rate)
+        self._taps_per_phase = phases.shape[1]
+        # Reversed so that x[q - j] * phases[p, j] becomes a forward dot product
+        self._kernels = phases[:, ::-1]
+        self._offset = (phases.size - 1) // 2 if compensate_delay else 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all buffered input and restart the stream."""
+        self._history = np.zeros(self._taps_per_phase - 1, dtype=np.float32)
+        self._in_count = 0
+        self._out_count = 0
+        self._fed = 0
+        self._emitted = 0
+
+    def process(self, data: np.ndarray) -> np.ndarray:
+        """Resample one block of mono float32 samples."""
+        if self._passthrough:
+            return data
+
+        up, down = self._up, self._down
+        total_in = self._in_count + len(data)
+        # Output k needs x[(k * down + offset) // up], so stop at the last one whose input has arrived
+        out_end = max(self._out_count, -(-(total_in * up - self._offset) // down))
+        n_out = out_end - self._out_count
+        out = np.empty(n_out, dtype=np.float32)
+
+        ext = np.concatenate((self._history, data))
+        step = ext.strides[0]
+        for i in range(min(up, n_out)):
+            q, phase = divmod((self._out_count + i) * down + self._offset, up)
+            # Row r is the input window x[q + r*down - taps_per_phase + 1 : q + r*down + 1];
+            # ext[0] holds x[in_count - taps_per_phase + 1], so the first window starts at q - in_count
+            windows = np.ndarray(
+                (len(range(i, n_out, up)), self._taps_per_phase),
+                dtype=ext.dtype,
+                buffer=ext,
+                offset=(q - self._in_count) * step,
+                strides=(down * step, step),
+            )
+            out[i::up] = windows @ self._kernels[phase]
+
+        self._history = ext[len(ext) - (self._taps_per_phase - 1) :].copy()
+        self._in_count = total_in
+        self._out_count = out_end
+        self._fed += len(data)
+        self._emitted += n_out
+        # Rebase counters to keep them small on long-running streams
+        cycles = self._out_count // up
+        self._out_count -= cycles * up
+        self._in_count -= cycles * down
+        return out
+
+    def flush(self) -> np.ndarray:
+        """Emit the outputs still held back by the filter delay and reset the stream.
+
+        Returns:
+            The remaining samples, so that everything emitted since the last
+            reset totals ``ceil(samples_in * dst_rate / src_rate)``.
+        """
+        if self._passthrough:
+            return np.zeros(0, dtype=np.float32)
+        pending = -(-self._fed * self._up // self._down) - self._emitted
+        tail = self.process(np.zeros(-(-self._offset // self._up), dtype=np.float32))[:pending]
+        self.reset()
+        return tail
+
+
 def _resample(data: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
-    """Simple linear interpolation resampling.
+    """Resample a complete (non-streaming) buffer with the polyphase FIR.
+
+    The filter delay is compensated, so the result is time-aligned with the
+    input and keeps its final samples.
 
     Args:
         data: 1D float32 numpy array.
@@ -52,10 +187,8 @@ def _resample(data: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
     """
     if src_rate == dst_rate:
         return data
-    ratio = dst_rate / src_rate
-    n_samples = int(len(data) * ratio)
-    indices = np.linspace(0, len(data) - 1, n_samples)
-    return np.interp(indices, np.arange(len(data)), data).astype(np.float32)
+    resampler = _PolyphaseResampler(src_rate, dst_rate, compensate_delay=True)
+    return np.concatenate((resampler.process(data), resampler.flush()))
 
 
 class AudioBridge:
@@ -83,10 +216,21 @@ class AudioBridge:
         self._loop: asyncio.AbstractEventLoop | None = None
         self._audio_queue: asyncio.Queue[bytes] | None = None
         self._consumer_task: asyncio.Task[None] | None = None
+        self._playback_queue: asyncio.Queue[np.ndarray] | None = None
+        self._playback_task: asyncio.Task[None] | None = None
+        # Device write running in a worker thread; stop() waits for it before closing the stream
+        self._playback_write: asyncio.Future[Any] | None = None
 
         # Device indices (resolved at start)
         self._capture_idx: int | None = None
         self._playback_idx: int | None = None
+        self._playback_rate: int | None = None
+        # Playback resamplers keyed by source sample rate, reused across turns
+        self._playback_resamplers: dict[int, _PolyphaseResampler] = {}
+        self._dropped_chunks = 0
+        # Reusable capture callback buffers (sized at start)
+        self._mono_buf = np.empty(0, dtype=np.float32)
+        self._pcm_buf = np.empty(0, dtype=np.int16)
 
     async def start(self, on_audio_chunk: Callable[[bytes], Awaitable[None]]) -> None:
         """Start audio capture and set up playback.
@@ -95,16 +239,18 @@ class AudioBridge:
             on_audio_chunk: Async callback receiving PCM 16kHz 16-bit mono bytes.
         """
         self._loop = asyncio.get_running_loop()
-        self._audio_queue = asyncio.Queue()
+        self._audio_queue = asyncio.Queue(maxsize=max(1, int(_AUDIO_QUEUE_SECONDS * 1000 / self._chunk_ms)))
+        self._dropped_chunks = 0
         self._running = True
 
-        # Resolve device indices
-        self._capture_idx = _find_device_index(self._capture_device_name, "input")
+        # Resolve device indices from a single PortAudio enumeration
+        devices = sd.query_devices()
+        self._capture_idx = _find_device_index(self._capture_device_name, "input", devices)
         if self._capture_idx is None:
             raise RuntimeError(f"Capture device not found: {self._capture_device_name}")
         logger.info("Capture device: %s (index=%d)", self._capture_device_name, self._capture_idx)
 
-        self._playback_idx = _find_device_index(self._playback_device_name, "output")
+        self._playback_idx = _find_device_index(self._playback_device_name, "output", devices)
         if self._playback_idx is None:
             raise RuntimeError(f"Playback device not found: {self._playback_device_name}")
         logger.info("Playback device: %s (index=%d)", self._playback_device_name, self._playback_idx)
@@ -113,6 +259,10 @@ class AudioBridge:
         dev_info = sd.query_devices(self._capture_idx, "input")
         native_rate = int(dev_info["default_samplerate"])
         blocksize = int(native_rate * self._chunk_ms / 1000)
+        resampler = _PolyphaseResampler(native_rate, self._target_rate)
+        self._mono_buf = np.empty(blocksize, dtype=np.float32)
+        # The resampler emits at most one extra sample per block
+        self._pcm_buf = np.empty(-(-blocksize * self._target_rate // native_rate) + 1, dtype=np.int16)
 
         # Audio callback runs in a separate thread
         def _capture_callback(
@@ -126,19 +276,29 @@ class AudioBridge:
             if not self._running:
                 return
 
-            # Convert to mono float32
-            audio = indata[:, 0].copy() if indata.ndim > 1 else indata.flatten().copy()
+            # Take the first channel into a reusable buffer (indata must not outlive the callback)
+            if frames > len(self._mono_buf):
+                self._mono_buf = np.empty(frames, dtype=np.float32)
+            audio = self._mono_buf[:frames]
+            np.copyto(audio, indata[:, 0] if indata.ndim > 1 else indata.reshape(-1))
 
             # Resample to target rate
-            audio = _resample(audio, native_rate, self._target_rate)
-
-            # Convert float32 [-1.0, 1.0] to int16 PCM bytes
-            pcm_int16 = (audio * 32767).clip(-32768, 32767).astype(np.int16)
+            audio = resampler.process(audio)
+
+            # Convert float32 [-1.0, 1.0] to int16 PCM bytes in place, without temporaries
+            np.multiply(audio, 32767.0, out=audio)
+            np.clip(audio, -32768, 32767, out=audio)
+            np.rint(audio, out=audio)
+            n = len(audio)
+            if n > len(self._pcm_buf):
+                self._pcm_buf = np.empty(n, dtype=np.int16)
+            pcm_int16 = self._pcm_buf[:n]
+            pcm_int16[:] = audio
             pcm_bytes = pcm_int16.tobytes()
 
             # Thread-safe put to asyncio queue
             if self._loop is not None and self._audio_queue is not None:
-                self._loop.call_soon_threadsafe(self._audio_queue.put_nowait, pcm_bytes)
+                self._loop.call_soon_threadsafe(self._enqueue_dropping, pcm_bytes)
 
         self._capture_stream = sd.InputStream(
             device=self._capture_idx,
@@ -166,49 +326,97 @@ class AudioBridge:
             dtype="float32",
         )
         self._playback_stream.start()
+        self._playback_rate = playback_native_rate
+        self._playback_queue = asyncio.Queue()
+        self._playback_task = asyncio.create_task(self._write_playback())
         logger.info("Audio playback stream opened (rate=%d)", playback_native_rate)
 
         # Start async consumer that feeds audio to callback
         self._consumer_task = asyncio.create_task(self._consume_audio(on_audio_chunk))
 
+    def _enqueue_dropping(self, pcm_bytes: bytes) -> None:
+        """Queue a captured chunk, discarding the oldest one if the consumer has fallen behind."""
+        queue = self._audio_queue
+        if queue is None:
+            return
+        if queue.full():
+            queue.get_nowait()
+            self._dropped_chunks += 1
+            if self._dropped_chunks % 50 == 1:
+                logger.warning("Audio queue overflow, dropped %d stale chunk(s) so far", self._dropped_chunks)
+        queue.put_nowait(pcm_bytes)
+
     async def _consume_audio(self, on_audio_chunk: Callable[[bytes], Awaitable[None]]) -> None:
         """Consume audio chunks from the queue and forward to callback."""
+        # stop() cancels this task, so a plain get() needs no polling timeout
         while self._running:
             try:
-                pcm_bytes = await asyncio.wait_for(self._audio_queue.get(), timeout=1.0)
+                pcm_bytes = await self._audio_queue.get()
                 await on_audio_chunk(pcm_bytes)
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Error in audio consumer")
 
-    def play_audio(self, pcm_data: bytes, sample_rate: int) -> None:
-        """Play PCM audio data through the playback device.
+    async def play_audio(self, pcm_data: bytes, sample_rate: int) -> None:
+        """Queue PCM audio for playback through the playback device.
+
+        Returns once the audio is queued; a background writer feeds it to the
+        device in ``chunk_ms`` blocks from a worker thread, so neither the
+        caller nor the event loop waits for the clip to play out.
 
         Args:
             pcm_data: Raw PCM 16-bit mono audio bytes.
             sample_rate: Sample rate of the input PCM data.
         """
-        if self._playback_stream is None or not self._running:
+        if (
+            self._playback_stream is None
+            or self._playback_rate is None
+            or self._playback_queue is None
+            or not self._running
+        ):
             logger.warning("Playback stream not available")
             return
 
         try:
-            # Convert PCM bytes to float32
-            audio = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32) / 32768.0
+            # Convert PCM bytes to float32 in one fused cast-and-scale pass
+            audio = np.multiply(np.frombuffer(pcm_data, dtype=np.int16), np.float32(1 / 32768), dtype=np.float32)
+
+            # Resample to playback device rate (resolved once at start)
+            playback_rate = self._playback_rate
+            resampler = self._playback_resamplers.get(sample_rate)
+            if resampler is None:
+                resampler = _PolyphaseResampler(sample_rate, playback_rate, compensate_delay=True)
+                self._playback_resamplers[sample_rate] = resampler
+            audio = np.concatenate((resampler.process(audio), resampler.flush()))
+        except Exception:
+            logger.exception("Error preparing audio for playback")
+            return
 
-            # Resample to playback device rate
-            playback_dev_info = sd.query_devices(self._playback_idx, "output")
-            playback_rate = int(playback_dev_info["default_samplerate"])
-            audio = _resample(audio, sample_rate, playback_rate)
+        await self._playback_queue.put(audio)
 
-            # Write to playback stream
-            self._playback_stream.write(audio.reshape(-1, 1))
-            logger.debug("Played %d samples at %dHz", len(audio), playback_rate)
-        except Exception:
-            logger.exception("Error playing audio")
+    async def _write_playback(self) -> None:
+        """Write queued playback audio to the device in short blocks off the event loop."""
+        while True:
+            audio = await self._playback_queue.get()
+            try:
+                stream = self._playback_stream
+                if stream is None or self._playback_rate is None:
+                    continue
+                block = max(1, self._playback_rate * self._chunk_ms // 1000)
+                for offset in range(0, len(audio), block):
+                    # write() blocks until PortAudio's ring buffer has room. Shielded: cancelling this
+                    # task cannot stop the thread, so stop() awaits the write itself before closing
+                    self._playback_write = asyncio.ensure_future(
+                        asyncio.to_thread(stream.write, audio[offset : offset + block].reshape(-1, 1))
+                    )
+                    await asyncio.shield(self._playback_write)
+                    self._playback_write = None
+                logger.debug("Played %d samples at %dHz", len(audio), self._playback_rate)
+            except Exception:
+                logger.exception("Error playing audio")
+            finally:
+                self._playback_queue.task_done()
 
     async def stop(self) -> None:
         """Stop capture and playback streams."""
@@ -220,6 +428,18 @@ class AudioBridge:
                 await self._consumer_task
             self._consumer_task = None
 
+        if self._playback_task is not None:
+            self._playback_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._playback_task
+            self._playback_task = None
+            self._playback_queue = None
+        if self._playback_write is not None:
+            # A block (at most chunk_ms of audio) may still be in stream.write(); let it return first
+            with contextlib.suppress(Exception):
+                await self._playback_write
+            self._playback_write = None
+
         if self._capture_stream is not None:
             try:
                 self._capture_stream.stop()
@@ -235,5 +455,7 @@ class AudioBridge:
             except Exception:
                 logger.debug("Playback stream close error", exc_info=True)
             self._playback_stream = None
+            self._playback_rate = None
+            self._playback_resamplers.clear()
 
         logger.info("Audio bridge stopped")
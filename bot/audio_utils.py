@@ -2,15 +2,45 @@
 
 from __future__ import annotations
 
-import base64
-import io
 import logging
 
-from pydub import AudioSegment
+import lameenc
+
+try:  # SIMD-accelerated base64 with the stdlib API (pybase64, in requirements.txt); stdlib if missing
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 logger = logging.getLogger("meeting-proxy.audio")
 
 
+def pcm_to_mp3(pcm_bytes: bytes, sample_rate: int = 24000, channels: int = 1) -> bytearray:
+    """Convert raw PCM bytes to MP3.
+
+    Args:
+        pcm_bytes: Raw PCM 16-bit signed little-endian audio data.
+        sample_rate: Sample rate of the PCM data (default 24000 for Gemini output).
+        channels: Number of audio channels (default 1 / mono).
+
+    Recall.ai's output_audio endpoint only accepts ``kind: "mp3"``, so raw PCM
+    or Opus cannot be sent instead; the in-process LAME encode costs about
+    1-2 ms per second of 24 kHz audio.
+
+    Returns:
+        MP3 data suitable for Recall.ai output_audio API, as the encoder's own
+        buffer (a bytearray) so the whole MP3 is never copied into ``bytes``.
+    """
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(64)
+    encoder.set_in_sample_rate(sample_rate)
+    encoder.set_channels(channels)
+    encoder.set_quality(7)
+    # encode() returns a bytearray: extend it in place rather than concatenating into a copy
+    mp3 = encoder.encode(pcm_bytes)
+    mp3 += encoder.flush()
+    return mp3
+
+
 def pcm_to_mp3_b64(pcm_bytes: bytes, sample_rate: int = 24000, channels: int = 1) -> str:
     """Convert raw PCM bytes to a base64-encoded MP3 string.
 
@@ -20,17 +50,9 @@ def pcm_to_mp3_b64(pcm_bytes: bytes, sample_rate: int = 24000, channels: int = 1
         channels: Number of audio channels (default 1 / mono).
 
     Returns:
-        Base64-encoded MP3 string suitable for Recall.ai output_audio API.
+        Base64-encoded MP3 string.
     """
-    segment = AudioSegment(
-        data=pcm_bytes,
-        sample_width=2,  # 16-bit
-        frame_rate=sample_rate,
-        channels=channels,
-    )
-    buf = io.BytesIO()
-    segment.export(buf, format="mp3", bitrate="64k")
-    return base64.b64encode(buf.getvalue()).decode("ascii")
+    return base64.b64encode(pcm_to_mp3(pcm_bytes, sample_rate, channels)).decode("ascii")
 
 
 def decode_b64_pcm(b64_data: str) -> bytes:
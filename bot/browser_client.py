@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import os
 import uuid
+from weakref import WeakKeyDictionary
 
 from config import settings
 
 logger = logging.getLogger("meeting-proxy.browser-client")
 
+
+def _is(*selectors: str) -> str:
+    """Combine selectors into a single ``:is(...)`` union."""
+    return f":is({', '.join(selectors)})"
+
+
 # Selectors for Google Meet UI elements
-_SEL_CAMERA_OFF = '[aria-label*="カメラ"][aria-label*="オフ"], [aria-label*="camera"][aria-label*="off"]'
-_SEL_MIC_ON = '[aria-label*="マイク"][aria-label*="オン"], [aria-label*="microphone"][aria-label*="on"]'
-_SEL_JOIN_BTN = 'button:has-text("今すぐ参加"), button:has-text("Join now"), button:has-text("参加")'
-_SEL_ASK_JOIN = 'button:has-text("参加をリクエスト"), button:has-text("Ask to join")'
-_SEL_IN_MEETING = "[data-meeting-title], [data-self-name]"
-_SEL_NAME_INPUT = 'input[aria-label*="名前"], input[aria-label*="name"]'
-_SEL_LEAVE_BTN = '[aria-label*="通話から退出"], [aria-label*="Leave call"]'
-_SEL_END_FOR_ALL = 'button:has-text("通話から退出"), button:has-text("Leave call"), button:has-text("退出")'
+_SEL_CAMERA_OFF = _is('[aria-label*="カメラ"][aria-label*="オフ"]', '[aria-label*="camera"][aria-label*="off"]')
+_SEL_CAMERA_TOGGLE = _is('[aria-label*="カメラ"]', '[aria-label*="camera"]')
+_SEL_MIC_ON = _is('[aria-label*="マイク"][aria-label*="オン"]', '[aria-label*="microphone"][aria-label*="on"]')
+_SEL_JOIN_BTN = _is('button:has-text("今すぐ参加")', 'button:has-text("Join now")', 'button:has-text("参加")')
+_SEL_ASK_JOIN = _is('button:has-text("参加をリクエスト")', 'button:has-text("Ask to join")')
+_SEL_JOIN_UNION = _is(_SEL_JOIN_BTN, _SEL_ASK_JOIN)
+_SEL_IN_MEETING = _is("[data-meeting-title]", "[data-self-name]")
+_SEL_NAME_INPUT = _is('input[aria-label*="名前"]', 'input[aria-label*="name"]')
+_SEL_LEAVE_BTN = _is('[aria-label*="通話から退出"]', '[aria-label*="Leave call"]')
+_SEL_END_FOR_ALL = _is('button:has-text("通話から退出")', 'button:has-text("Leave call")', 'button:has-text("退出")')
+# Any of these means the pre-join (or in-call) UI has rendered
+_SEL_MEET_READY = _is(_SEL_NAME_INPUT, _SEL_JOIN_UNION, _SEL_IN_MEETING)
 
 
 class BrowserClient:
@@ -28,11 +42,26 @@ class BrowserClient:
         self._browser: object | None = None
         self._context: object | None = None
         self._pages: dict[str, object] = {}  # bot_id -> Page
+        # Page -> selector -> Locator, dropped automatically when the page goes away
+        self._locator_cache: WeakKeyDictionary[object, dict[str, object]] = WeakKeyDictionary()
+
+    def _loc(self, page: object, selector: str) -> object:
+        """Return the Locator for ``selector`` on ``page``, building it once per page."""
+        locators = self._locator_cache.get(page)
+        if locators is None:
+            locators = self._locator_cache[page] = {}
+        locator = locators.get(selector)
+        if locator is None:
+            locator = locators[selector] = page.locator(selector)
+        return locator
 
     async def launch(self) -> None:
         """Launch a persistent Chromium browser context with audio routing."""
         from playwright.async_api import async_playwright
 
+        if settings.playwright_browsers_path:
+            # Playwright's driver reads this from the process environment; a value from .env wouldn't reach it
+            os.environ["PLAYWRIGHT_BROWSERS_PATH"] = settings.playwright_browsers_path
         self._playwright = await async_playwright().start()
 
         launch_args = [
@@ -41,13 +70,21 @@ class BrowserClient:
             "--disable-features=WebRtcHideLocalIpsWithMdns",
             "--no-first-run",
             "--disable-default-apps",
+            "--disable-dev-shm-usage",
+            "--disable-background-networking",
+            "--disable-renderer-backgrounding",
+            "--disable-extensions",
+            "--disable-blink-features=AutomationControlled",
         ]
+        headless = settings.browser_headless
+        if headless:
+            launch_args.append("--disable-gpu")
 
         profile_dir = settings.chrome_profile_dir
         if profile_dir:
             self._context = await self._playwright.chromium.launch_persistent_context(
                 profile_dir,
-                headless=False,
+                headless=headless,
                 args=launch_args,
                 ignore_default_args=["--mute-audio"],
                 permissions=["microphone", "camera"],
@@ -57,8 +94,9 @@ class BrowserClient:
             logger.info("Persistent browser context launched (profile=%s)", profile_dir)
         else:
             self._browser = await self._playwright.chromium.launch(
-                headless=False,
+                headless=headless,
                 args=launch_args,
+                ignore_default_args=["--mute-audio"],
             )
             self._context = await self._browser.new_context(
                 ignore_https_errors=True,
@@ -83,36 +121,59 @@ class BrowserClient:
         bot_id = str(uuid.uuid4())
         page = await self._context.new_page()
         self._pages[bot_id] = page
+        try:
+            await self._enter_meeting(page, bot_id, meeting_url, bot_name)
+        except BaseException:
+            # Don't leave a half-joined page registered (and open) for a bot nobody will stop
+            self._pages.pop(bot_id, None)
+            self._locator_cache.pop(page, None)
+            with contextlib.suppress(Exception):
+                await page.close()
+            raise
+        return bot_id
+
+    async def _enter_meeting(self, page: object, bot_id: str, meeting_url: str, bot_name: str) -> None:
+        """Navigate ``page`` to the meeting, fill the pre-join form and wait for admission."""
 
         logger.info("Navigating to %s (bot=%s)", meeting_url, bot_id)
-        await page.goto(meeting_url, wait_until="domcontentloaded", timeout=30_000)
+        await page.goto(meeting_url, wait_until="commit", timeout=settings.browser_goto_timeout_ms)
 
-        # Wait for Meet to load
-        await page.wait_for_timeout(3000)
+        # goto only waits for the response to commit; readiness is gated on Meet's own UI
+        try:
+            await page.wait_for_selector(_SEL_MEET_READY, state="attached", timeout=15_000)
+        except Exception:
+            logger.warning("Meet UI did not appear in time, probing anyway (bot=%s)", bot_id)
+
+        # Probe the pre-join UI concurrently so the CDP round-trips overlap
+        name_input = self._loc(page, _SEL_NAME_INPUT)
+        camera_toggle = self._loc(page, _SEL_CAMERA_TOGGLE).first
+        join_btn = self._loc(page, _SEL_JOIN_BTN)
+        ask_btn = self._loc(page, _SEL_ASK_JOIN)
+        name_count, cam_off_count, cam_toggle_count, join_count, ask_count = await asyncio.gather(
+            name_input.count(),
+            self._loc(page, _SEL_CAMERA_OFF).count(),
+            camera_toggle.count(),
+            join_btn.count(),
+            ask_btn.count(),
+        )
 
         # Enter display name if prompted (non-logged-in or guest mode)
-        name_input = page.locator(_SEL_NAME_INPUT)
-        if await name_input.count() > 0:
+        if name_count > 0:
             await name_input.first.fill(bot_name)
             logger.info("Entered bot name: %s", bot_name)
 
         # Turn camera OFF if it's on
-        try:
-            camera_btn = page.locator(_SEL_CAMERA_OFF)
-            if await camera_btn.count() == 0:
-                # Camera is ON — find and click the camera toggle
-                camera_toggle = page.locator('[aria-label*="カメラ"], [aria-label*="camera"]').first
-                if await camera_toggle.count() > 0:
-                    await camera_toggle.click()
-                    logger.info("Camera turned off")
-        except Exception:
-            logger.debug("Camera toggle not found, skipping")
+        if cam_off_count == 0 and cam_toggle_count > 0:
+            try:
+                await camera_toggle.click()
+                logger.info("Camera turned off")
+            except Exception:
+                logger.debug("Camera toggle click failed, skipping")
 
         # Click "Join now" or "Ask to join"
         joined = False
-        for selector in [_SEL_JOIN_BTN, _SEL_ASK_JOIN]:
-            btn = page.locator(selector)
-            if await btn.count() > 0:
+        for btn, count in ((join_btn, join_count), (ask_btn, ask_count)):
+            if count > 0:
                 await btn.first.click()
                 logger.info("Clicked join button (bot=%s)", bot_id)
                 joined = True
@@ -121,11 +182,11 @@ class BrowserClient:
         if not joined:
             logger.warning("No join button found, attempting to proceed (bot=%s)", bot_id)
 
-        # Wait for admission (up to 60 seconds)
+        # Wait for admission
         try:
             await page.wait_for_selector(
                 _SEL_IN_MEETING,
-                timeout=60_000,
+                timeout=settings.browser_admission_timeout_ms,
                 state="attached",
             )
             logger.info("Successfully joined meeting (bot=%s)", bot_id)
@@ -133,8 +194,6 @@ class BrowserClient:
             # Even if selector not found, the bot may still be in the meeting
             logger.warning("Meeting join confirmation timeout, may still be in meeting (bot=%s)", bot_id)
 
-        return bot_id
-
     async def leave_meeting(self, bot_id: str) -> None:
         """Leave the meeting and close the page for the given bot_id."""
         page = self._pages.pop(bot_id, None)
@@ -144,20 +203,24 @@ class BrowserClient:
 
         try:
             # Try clicking the leave button
-            leave_btn = page.locator(_SEL_LEAVE_BTN)
+            leave_btn = self._loc(page, _SEL_LEAVE_BTN)
             if await leave_btn.count() > 0:
                 await leave_btn.first.click()
-                await page.wait_for_timeout(500)
 
-                # Click "Leave call" in confirmation dialog if present
-                end_btn = page.locator(_SEL_END_FOR_ALL)
-                if await end_btn.count() > 0:
-                    await end_btn.first.click()
+                # Click "Leave call" in confirmation dialog if it shows up
+                end_btn = self._loc(page, _SEL_END_FOR_ALL).first
+                try:
+                    await end_btn.wait_for(state="visible", timeout=1000)
+                except Exception:
+                    logger.debug("No leave confirmation dialog (bot=%s)", bot_id)
+                else:
+                    await end_btn.click()
 
             logger.info("Left meeting (bot=%s)", bot_id)
         except Exception:
             logger.warning("Error clicking leave button (bot=%s)", bot_id, exc_info=True)
         finally:
+            self._locator_cache.pop(page, None)
             try:
                 await page.close()
             except Exception:
@@ -165,8 +228,7 @@ class BrowserClient:
 
     async def shutdown(self) -> None:
         """Close all pages and shut down the browser."""
-        for bot_id in list(self._pages):
-            await self.leave_meeting(bot_id)
+        await asyncio.gather(*(self.leave_meeting(bot_id) for bot_id in list(self._pages)), return_exceptions=True)
 
         if self._context is not None:
             try:
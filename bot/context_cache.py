@@ -0,0 +1,103 @@
+"""Per-meeting Vertex AI context caching for the static part of the avatar system prompt."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+import time
+from typing import Any
+
+from config import settings
+
+logger = logging.getLogger("meeting-proxy.context-cache")
+
+
+def _create_cached_content(model_name: str, system_instruction: str, ttl_seconds: int) -> Any:
+    """Upload ``system_instruction`` as a CachedContent resource (blocking)."""
+    from vertexai.preview import caching
+
+    return caching.CachedContent.create(
+        model_name=model_name,
+        system_instruction=system_instruction,
+        ttl=datetime.timedelta(seconds=ttl_seconds),
+    )
+
+
+def _model_from_cached_content(cached_content: Any) -> Any:
+    """Return a GenerativeModel bound to ``cached_content``."""
+    from vertexai.preview.generative_models import GenerativeModel
+
+    return GenerativeModel.from_cached_content(cached_content=cached_content)
+
+
+class MeetingContextCache:
+    """Keeps one CachedContent per bot for its meeting-level system instruction.
+
+    The instruction (persona, meeting rules, materials) is uploaded once and
+    reused while it stays the same; its TTL is extended once half of it has
+    elapsed. Instructions the service refuses to cache (e.g. below the minimum
+    token count) are remembered so the caller falls back without retrying each
+    turn. All methods block on the network and are meant for a worker thread;
+    each bot has its own lock, so one bot's Vertex round-trip never delays another's.
+    """
+
+    def __init__(self) -> None:
+        # bot_id -> (system_instruction, cached_content or None if uncacheable, bound model, expires_at)
+        self._entries: dict[str, tuple[str, Any, Any, float]] = {}
+        # bot_id -> lock held across that bot's network calls; _locks_guard protects the mapping only
+        self._bot_locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, bot_id: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._bot_locks.setdefault(bot_id, threading.Lock())
+
+    def get_model(self, bot_id: str, system_instruction: str) -> Any:
+        """Return a model bound to the cached ``system_instruction``, or ``None`` to use a plain prompt."""
+        ttl = settings.gemini_context_cache_ttl_seconds
+        with self._lock_for(bot_id):
+            entry = self._entries.get(bot_id)
+            if entry is not None and entry[0] == system_instruction:
+                _, cached_content, model, expires_at = entry
+                if cached_content is None:
+                    return None
+                if expires_at - time.monotonic() < ttl / 2:
+                    try:
+                        cached_content.update(ttl=datetime.timedelta(seconds=ttl))
+                        self._entries[bot_id] = (system_instruction, cached_content, model, time.monotonic() + ttl)
+                    except Exception:
+                        logger.warning("Failed to extend context cache TTL (bot=%s)", bot_id, exc_info=True)
+                return model
+
+            if entry is not None:
+                self._delete(bot_id, entry[1])
+            try:
+                cached_content = _create_cached_content(settings.gemini_model, system_instruction, ttl)
+            except Exception as exc:
+                logger.info("System prompt not cacheable, using plain prompts (bot=%s): %s", bot_id, exc)
+                self._entries[bot_id] = (system_instruction, None, None, 0.0)
+                return None
+            # One model per cached content, reused for every turn of the meeting
+            model = _model_from_cached_content(cached_content)
+            self._entries[bot_id] = (system_instruction, cached_content, model, time.monotonic() + ttl)
+            logger.info("Context cache created (bot=%s, name=%s)", bot_id, getattr(cached_content, "name", ""))
+            return model
+
+    def drop(self, bot_id: str) -> None:
+        """Delete the bot's cached content, if any."""
+        with self._lock_for(bot_id):
+            entry = self._entries.pop(bot_id, None)
+            if entry is not None:
+                self._delete(bot_id, entry[1])
+        with self._locks_guard:
+            self._bot_locks.pop(bot_id, None)
+
+    @staticmethod
+    def _delete(bot_id: str, cached_content: Any) -> None:
+        if cached_content is None:
+            return
+        try:
+            cached_content.delete()
+        except Exception:
+            logger.warning("Failed to delete context cache (bot=%s)", bot_id, exc_info=True)
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import logging
+import re
 import time
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 
 from config import settings
 
 logger = logging.getLogger("meeting-proxy.conversation")
 
+_PROMPT_HISTORY_HEADER = "--- 会話履歴 ---"
+_PROMPT_LATEST_HEADER = "--- 最新の発言 ---"
+_PROMPT_HISTORY_TURNS = 10
+
+_QUESTION_ENDINGS = ("か", "か。")
+_REQUEST_PATTERNS = ("教えて", "お願い", "ください", "して", "説明")
+
 
 @dataclass
 class Utterance:
@@ -20,15 +30,22 @@ class Utterance:
     timestamp: float = field(default_factory=time.time)
 
 
+def _history_limit() -> int:
+    """Return the configured history size (at least one entry)."""
+    return max(settings.max_conversation_history, 1)
+
+
 class ConversationSession:
     """Manages state for a single meeting session."""
 
     def __init__(self, bot_id: str, bot_name: str | None = None) -> None:
         self.bot_id = bot_id
         self.bot_name = bot_name or settings.bot_display_name
-        self._history: list[Utterance] = []
+        self._response_instruction = f"上記の発言に対して、{self.bot_name}として簡潔に応答してください。"
+        self._history: deque[Utterance] = deque(maxlen=_history_limit())
         self._is_responding: bool = False
         self._triggers: list[str] = self._parse_triggers()
+        self._trigger_re: re.Pattern[str] = re.compile("|".join(map(re.escape, self._triggers)), re.IGNORECASE)
 
     def _parse_triggers(self) -> list[str]:
         """Parse response trigger words from settings."""
@@ -39,11 +56,12 @@ class ConversationSession:
         return triggers
 
     def add_utterance(self, speaker: str, text: str) -> None:
-        """Record an utterance and trim history to max size."""
+        """Record an utterance; the bounded history evicts the oldest entry."""
+        limit = _history_limit()
+        if self._history.maxlen != limit:
+            # MAX_CONVERSATION_HISTORY can be changed at runtime from the admin API
+            self._history = deque(self._history, maxlen=limit)
         self._history.append(Utterance(speaker=speaker, text=text))
-        max_hist = settings.max_conversation_history
-        if len(self._history) > max_hist:
-            self._history = self._history[-max_hist:]
 
     def add_bot_response(self, text: str) -> None:
         """Record the bot's own response in history."""
@@ -54,46 +72,50 @@ class ConversationSession:
         if self._is_responding:
             return False
 
-        text_lower = text.lower().strip()
+        text = text.strip()
 
         # Trigger 1: Bot name mentioned
-        for trigger in self._triggers:
-            if trigger in text_lower:
-                logger.info("Response trigger: name/keyword '%s' in text", trigger)
-                return True
+        match = self._trigger_re.search(text)
+        if match:
+            logger.info("Response trigger: name/keyword '%s' in text", match.group(0))
+            return True
 
         # Trigger 2: Direct question (Japanese question markers anywhere in text)
-        if "？" in text_lower or "?" in text_lower:
+        if "？" in text or "?" in text:
             logger.info("Response trigger: question mark detected")
             return True
-        if text_lower.endswith("か") or text_lower.endswith("か。"):
+        if text.endswith(_QUESTION_ENDINGS):
             logger.info("Response trigger: Japanese question ending detected")
             return True
 
         # Trigger 3: Request patterns (Japanese)
-        request_patterns = ["教えて", "お願い", "ください", "して", "説明"]
-        for pattern in request_patterns:
-            if pattern in text_lower:
+        for pattern in _REQUEST_PATTERNS:
+            if pattern in text:
                 logger.info("Response trigger: request pattern '%s' detected", pattern)
                 return True
 
         return False
 
-    def build_conversation_prompt(self, current_speaker: str, current_text: str) -> str:
-        """Build a conversation prompt including history for Gemini."""
-        lines: list[str] = []
-
-        if self._history:
-            lines.append("--- 会話履歴 ---")
-            for utterance in self._history[-10:]:
-                lines.append(f"{utterance.speaker}: {utterance.text}")
+    @property
+    def response_instruction(self) -> str:
+        """Static instruction telling the model to answer as this bot; belongs in the system prompt."""
+        return self._response_instruction
 
-        lines.append("")
-        lines.append("--- 最新の発言 ---")
-        lines.append(f"{current_speaker}: {current_text}")
-        lines.append("")
-        lines.append(f"上記の発言に対して、{self.bot_name}として簡潔に応答してください。")
+    def build_conversation_prompt(self, current_speaker: str, current_text: str, knowledge_section: str = "") -> str:
+        """Build the dynamic part of the Gemini prompt: history, per-turn knowledge, then the latest utterance.
 
+        Static instructions live in the system prompt (see ``response_instruction``) so that
+        successive prompts share the longest possible prefix for provider-side prefix caching.
+        """
+        recent = list(islice(self._history, max(len(self._history) - _PROMPT_HISTORY_TURNS, 0), None))
+        lines: list[str] = []
+        if recent:
+            lines.append(_PROMPT_HISTORY_HEADER)
+            lines.extend(f"{utterance.speaker}: {utterance.text}" for utterance in recent)
+            lines.append("")
+        if knowledge_section:
+            lines += [knowledge_section, ""]
+        lines += [_PROMPT_LATEST_HEADER, f"{current_speaker}: {current_text}"]
         return "\n".join(lines)
 
     @property
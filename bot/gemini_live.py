@@ -20,6 +20,61 @@ AudioChunkCallback = Callable[[bytes], None]
 TextChunkCallback = Callable[[str], None]
 TurnCompleteCallback = Callable[[bytes, str], Any]
 
+# Coalesce inbound PCM into ~100 ms frames (16 kHz, 16-bit mono) before sending
+_SEND_FLUSH_BYTES = 3200
+_INPUT_MIME_TYPE = "audio/pcm;rate=16000"
+
+
+def _build_client() -> genai.Client:
+    """Create a Vertex AI genai client configured for long-lived Live sessions."""
+    http_options = types.HttpOptions(
+        async_client_args={
+            "ping_interval": 30,
+            "ping_timeout": 120,
+        },
+    )
+    return genai.Client(
+        vertexai=True,
+        project=settings.gcp_project_id,
+        location=settings.gcp_location,
+        http_options=http_options,
+    )
+
+
+# Tags for the events _classify() extracts from a server message
+_KIND_AUDIO, _KIND_TRANSCRIPT, _KIND_TURN_END, _KIND_RESUME = range(4)
+
+
+def _classify(response: types.LiveServerMessage) -> list[tuple[int, Any]]:
+    """Flatten a Live API server message into ``(kind, payload)`` events, in dispatch order.
+
+    Message fields are always present (``None`` when unset), so they are read
+    directly; an unexpected shape surfaces as ``AttributeError``.
+    """
+    server_content = response.server_content
+    if server_content is None:
+        update = response.session_resumption_update
+        if update and update.new_handle:
+            return [(_KIND_RESUME, update.new_handle)]
+        return []
+
+    events: list[tuple[int, Any]] = []
+    model_turn = server_content.model_turn
+    if model_turn and model_turn.parts:
+        for part in model_turn.parts:
+            inline_data = part.inline_data
+            if inline_data and inline_data.data:
+                events.append((_KIND_AUDIO, inline_data.data))
+
+    # Output audio transcription text
+    transcription = server_content.output_transcription
+    if transcription and transcription.text:
+        events.append((_KIND_TRANSCRIPT, transcription.text))
+
+    if server_content.turn_complete:
+        events.append((_KIND_TURN_END, None))
+    return events
+
 
 class GeminiLiveSession:
     """Manages a single Gemini Live API session for one bot/meeting.
@@ -35,6 +90,7 @@ class GeminiLiveSession:
         on_audio_chunk: AudioChunkCallback,
         on_turn_complete: TurnCompleteCallback,
         on_text_chunk: TextChunkCallback,
+        client: genai.Client | None = None,
     ) -> None:
         self.bot_id = bot_id
         self._system_instruction = system_instruction
@@ -42,19 +98,26 @@ class GeminiLiveSession:
         self._on_turn_complete = on_turn_complete
         self._on_text_chunk = on_text_chunk
 
-        self._client: genai.Client | None = None
+        self._client: genai.Client | None = client
         self._session: Any = None
         self._session_ctx: Any = None  # async context manager from live.connect()
         self._receive_task: asyncio.Task[None] | None = None
         self._reconnect_task: asyncio.Task[None] | None = None
+        self._reconnect_in_progress = False
+        self._teardown_tasks: set[asyncio.Task[None]] = set()  # old sessions closing after a reconnect
         self._connected = False
         self._session_start: float = 0.0
         self._resumption_handle: str | None = None
+        self._config: types.LiveConnectConfig | None = None
 
         # Accumulation buffers for current turn
-        self._audio_buffer = bytearray()
+        self._audio_buffer: list[bytes] = []
         self._text_buffer: list[str] = []
 
+        # Outgoing PCM waiting to be sent as one realtime-input frame
+        self._send_accum: list[bytes] = []
+        self._send_accum_size = 0
+
         # Diagnostic counters
         self._audio_chunks_sent = 0
         self._audio_bytes_sent = 0
@@ -66,18 +129,8 @@ class GeminiLiveSession:
 
     async def connect(self) -> None:
         """Establish connection to Gemini Live API."""
-        http_options = types.HttpOptions(
-            async_client_args={
-                "ping_interval": 30,
-                "ping_timeout": 120,
-            },
-        )
-        self._client = genai.Client(
-            vertexai=True,
-            project=settings.gcp_project_id,
-            location=settings.gcp_location,
-            http_options=http_options,
-        )
+        if self._client is None:
+            self._client = _build_client()
 
         config = self._build_config()
 
@@ -94,12 +147,20 @@ class GeminiLiveSession:
         self._reconnect_task = asyncio.create_task(self._reconnect_timer())
 
     def _build_config(self) -> types.LiveConnectConfig:
-        """Build the LiveConnectConfig with current settings."""
+        """Return the LiveConnectConfig for this session.
+
+        Everything except the resumption handle is fixed for the session's
+        lifetime, so the config is built once and only ``session_resumption``
+        is refreshed on reconnect.
+        """
         resumption_config = types.SessionResumptionConfig(
             handle=self._resumption_handle,
         )
+        if self._config is not None:
+            self._config.session_resumption = resumption_config
+            return self._config
 
-        return types.LiveConnectConfig(
+        self._config = types.LiveConnectConfig(
             response_modalities=["AUDIO"],
             output_audio_transcription=types.AudioTranscriptionConfig(),
             system_instruction=types.Content(parts=[types.Part(text=self._system_instruction)]),
@@ -117,6 +178,7 @@ class GeminiLiveSession:
             session_resumption=resumption_config,
             enable_affective_dialog=settings.gemini_live_enable_affective_dialog,
         )
+        return self._config
 
     def set_mute_duration(self, seconds: float) -> None:
         """Mute audio input for the given duration to suppress echo."""
@@ -132,6 +194,9 @@ class GeminiLiveSession:
         if not self._connected or self._session is None:
             return
 
+        # Keep the audio that preceded this turn ahead of it
+        await self.flush_audio()
+
         try:
             await self._session.send_client_content(
                 turns=types.Content(role="user", parts=[types.Part(text=text)]),
@@ -142,7 +207,7 @@ class GeminiLiveSession:
             logger.warning("Gemini send_text failed (bot=%s)", self.bot_id, exc_info=True)
 
     async def send_audio(self, pcm_bytes: bytes) -> None:
-        """Send PCM audio data to Gemini Live API.
+        """Queue PCM audio for Gemini Live API, sending it in ~100 ms frames.
 
         Args:
             pcm_bytes: Raw PCM 16kHz 16-bit mono audio data from Recall.ai.
@@ -154,14 +219,29 @@ class GeminiLiveSession:
         if time.monotonic() < self._mute_until:
             return
 
+        self._send_accum.append(pcm_bytes)
+        self._send_accum_size += len(pcm_bytes)
+        if self._send_accum_size >= _SEND_FLUSH_BYTES:
+            await self.flush_audio()
+
+    async def flush_audio(self) -> None:
+        """Send any PCM audio still held back by ``send_audio``."""
+        if not self._send_accum:
+            return
+        payload = self._send_accum[0] if len(self._send_accum) == 1 else b"".join(self._send_accum)
+        self._send_accum.clear()
+        self._send_accum_size = 0
+        if not self._connected or self._session is None:
+            return
+
         self._audio_chunks_sent += 1
-        self._audio_bytes_sent += len(pcm_bytes)
+        self._audio_bytes_sent += len(payload)
 
         try:
-            await self._session.send_realtime_input(audio=types.Blob(data=pcm_bytes, mime_type="audio/pcm;rate=16000"))
+            await self._session.send_realtime_input(audio=types.Blob(data=payload, mime_type=_INPUT_MIME_TYPE))
             self._send_error_logged = False
             if self._audio_chunks_sent == 1:
-                logger.info("First audio chunk sent to Gemini (bot=%s, %d bytes)", self.bot_id, len(pcm_bytes))
+                logger.info("First audio chunk sent to Gemini (bot=%s, %d bytes)", self.bot_id, len(payload))
             elif self._audio_chunks_sent % 100 == 0:
                 logger.info(
                     "Audio stats (bot=%s): %d chunks sent, %d bytes total",
@@ -178,81 +258,78 @@ class GeminiLiveSession:
 
     async def _receive_loop(self) -> None:
         """Receive responses from Gemini Live API and dispatch callbacks."""
-        if self._session is None:
+        session = self._session
+        if session is None:
             return
 
         logger.info("Receive loop started for bot %s", self.bot_id)
+        # Hot path: bind per-message lookups once. _on_turn_complete is read per turn
+        # because the WebSocket bridge swaps it while the loop is running.
+        bot_id = self.bot_id
+        on_audio_chunk = self._on_audio_chunk
+        on_text_chunk = self._on_text_chunk
+        audio_buffer = self._audio_buffer
+        text_buffer = self._text_buffer
         try:
-            async for response in self._session.receive():
-                server_content = getattr(response, "server_content", None)
-                if server_content is None:
-                    # Check for session resumption update
-                    resumption_update = getattr(response, "session_resumption_update", None)
-                    if resumption_update:
-                        handle = getattr(resumption_update, "handle", None)
-                        if handle:
-                            self._resumption_handle = handle
-                            logger.info("Session resumption handle received (bot=%s)", self.bot_id)
+            async for response in session.receive():
+                try:
+                    events = _classify(response)
+                except AttributeError:
+                    logger.warning("Unexpected Gemini message shape (bot=%s)", bot_id, exc_info=True)
                     continue
 
-                model_turn = getattr(server_content, "model_turn", None)
-                if model_turn and model_turn.parts:
-                    for part in model_turn.parts:
-                        inline_data = getattr(part, "inline_data", None)
-                        if inline_data and inline_data.data:
-                            self._audio_chunks_received += 1
-                            self._audio_buffer.extend(inline_data.data)
-                            if self._audio_chunks_received == 1:
-                                logger.info(
-                                    "First audio chunk from Gemini (bot=%s, %d bytes)",
-                                    self.bot_id,
-                                    len(inline_data.data),
-                                )
-                            try:
-                                self._on_audio_chunk(inline_data.data)
-                            except Exception:
-                                logger.exception("on_audio_chunk callback error (bot=%s)", self.bot_id)
-
-                # Capture output audio transcription text
-                output_transcription = getattr(server_content, "output_transcription", None)
-                if output_transcription:
-                    transcript_text = getattr(output_transcription, "text", None)
-                    if transcript_text:
-                        self._text_buffer.append(transcript_text)
-                        logger.debug("Gemini transcription chunk (bot=%s): %s", self.bot_id, transcript_text[:80])
+                for kind, data in events:
+                    if kind == _KIND_AUDIO:
+                        self._audio_chunks_received += 1
+                        audio_buffer.append(data)
+                        if self._audio_chunks_received == 1:
+                            logger.info("First audio chunk from Gemini (bot=%s, %d bytes)", bot_id, len(data))
                         try:
-                            self._on_text_chunk(transcript_text)
+                            on_audio_chunk(data)
                         except Exception:
-                            logger.exception("on_text_chunk callback error (bot=%s)", self.bot_id)
-
-                turn_complete = getattr(server_content, "turn_complete", False)
-                if turn_complete:
-                    audio_data = bytes(self._audio_buffer)
-                    text_data = "".join(self._text_buffer)
-                    self._audio_buffer.clear()
-                    self._text_buffer.clear()
-
-                    logger.info(
-                        "Turn complete (bot=%s): %d bytes audio, text=%s",
-                        self.bot_id,
-                        len(audio_data),
-                        text_data[:120] if text_data else "(none)",
-                    )
-
-                    if audio_data or text_data:
+                            logger.exception("on_audio_chunk callback error (bot=%s)", bot_id)
+
+                    elif kind == _KIND_TRANSCRIPT:
+                        text_buffer.append(data)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Gemini transcription chunk (bot=%s): %s", bot_id, data[:80])
                         try:
-                            result = self._on_turn_complete(audio_data, text_data)
-                            if asyncio.iscoroutine(result):
-                                await result
+                            on_text_chunk(data)
                         except Exception:
-                            logger.exception("on_turn_complete callback error (bot=%s)", self.bot_id)
+                            logger.exception("on_text_chunk callback error (bot=%s)", bot_id)
+
+                    elif kind == _KIND_TURN_END:
+                        audio_data = b"".join(audio_buffer)
+                        text_data = "".join(text_buffer)
+                        audio_buffer.clear()
+                        text_buffer.clear()
+
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info(
+                                "Turn complete (bot=%s): %d bytes audio, text=%s",
+                                bot_id,
+                                len(audio_data),
+                                text_data[:120] if text_data else "(none)",
+                            )
+
+                        if audio_data or text_data:
+                            try:
+                                result = self._on_turn_complete(audio_data, text_data)
+                                if asyncio.iscoroutine(result):
+                                    await result
+                            except Exception:
+                                logger.exception("on_turn_complete callback error (bot=%s)", bot_id)
+
+                    else:  # _KIND_RESUME
+                        self._resumption_handle = data
+                        logger.info("Session resumption handle received (bot=%s)", bot_id)
 
         except asyncio.CancelledError:
             logger.info("Receive loop cancelled for bot %s", self.bot_id)
         except Exception:
             logger.exception("Receive loop error for bot %s", self.bot_id)
-            # Auto-reconnect on unexpected disconnection
-            if self._connected:
+            # Auto-reconnect on unexpected disconnection (unless a reconnect already replaced this session)
+            if self._connected and self._session is session:
                 logger.info("Triggering auto-reconnect after receive loop error (bot=%s)", self.bot_id)
                 asyncio.create_task(self._reconnect())
 
@@ -273,31 +350,40 @@ class GeminiLiveSession:
             logger.exception("Reconnect timer error (bot=%s)", self.bot_id)
 
     async def _reconnect(self) -> None:
-        """Reconnect to Gemini Live API using session resumption."""
-        self._connected = False
+        """Reconnect to Gemini Live API using session resumption.
 
-        # Close existing session via context manager
-        if self._session_ctx is not None:
-            try:
-                await self._session_ctx.__aexit__(None, None, None)
-            except Exception:
-                logger.warning("Error closing old session (bot=%s)", self.bot_id, exc_info=True)
-            self._session = None
-            self._session_ctx = None
+        The new session is opened first and the old one is torn down in the
+        background, so the handshake isn't delayed by closing the old socket.
+        Single-flight: send failures, receive-loop errors and the rollover timer
+        may all trigger this at once, and only the first caller reconnects.
+        """
+        if self._reconnect_in_progress:
+            logger.debug("Reconnect already in progress (bot=%s)", self.bot_id)
+            return
+        self._reconnect_in_progress = True
+        try:
+            await self._reconnect_once()
+        finally:
+            self._reconnect_in_progress = False
 
-        if self._receive_task and not self._receive_task.done():
-            self._receive_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._receive_task
+    async def _reconnect_once(self) -> None:
+        """Replace the current session with a resumed one."""
+        self._connected = False
+
+        old_ctx, old_task = self._session_ctx, self._receive_task
+        self._session = None
+        self._session_ctx = None
+        self._receive_task = None
 
         # Reconnect with resumption handle
         try:
             config = self._build_config()
-            self._session_ctx = self._client.aio.live.connect(
+            session_ctx = self._client.aio.live.connect(
                 model=settings.gemini_live_model,
                 config=config,
             )
-            self._session = await self._session_ctx.__aenter__()
+            self._session = await session_ctx.__aenter__()
+            self._session_ctx = session_ctx
             self._connected = True
             self._send_error_logged = False
             self._session_start = time.monotonic()
@@ -308,18 +394,37 @@ class GeminiLiveSession:
             )
         except Exception:
             logger.exception("Failed to reconnect Gemini session (bot=%s)", self.bot_id)
+            await self._close_old_session(old_ctx, old_task)
             return
 
         self._receive_task = asyncio.create_task(self._receive_loop())
+        teardown = asyncio.create_task(self._close_old_session(old_ctx, old_task))
+        self._teardown_tasks.add(teardown)
+        teardown.add_done_callback(self._teardown_tasks.discard)
 
         # Reset reconnect timer
         if self._reconnect_task and not self._reconnect_task.done():
             self._reconnect_task.cancel()
         self._reconnect_task = asyncio.create_task(self._reconnect_timer())
 
+    async def _close_old_session(self, session_ctx: Any, receive_task: asyncio.Task[None] | None) -> None:
+        """Stop a replaced session's receive loop, then close its connection."""
+        if receive_task is not None and not receive_task.done():
+            receive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await receive_task
+
+        if session_ctx is not None:
+            try:
+                await session_ctx.__aexit__(None, None, None)
+            except Exception:
+                logger.warning("Error closing old session (bot=%s)", self.bot_id, exc_info=True)
+
     async def disconnect(self) -> None:
         """Close the session and cancel background tasks."""
         self._connected = False
+        self._send_accum.clear()
+        self._send_accum_size = 0
 
         if self._reconnect_task and not self._reconnect_task.done():
             self._reconnect_task.cancel()
@@ -337,6 +442,9 @@ class GeminiLiveSession:
             except Exception:
                 logger.warning("Error closing session (bot=%s)", self.bot_id, exc_info=True)
 
+        if self._teardown_tasks:
+            await asyncio.gather(*self._teardown_tasks, return_exceptions=True)
+
         self._session = None
         self._session_ctx = None
         logger.info("Gemini Live session disconnected for bot %s", self.bot_id)
@@ -351,6 +459,11 @@ class GeminiLiveManager:
 
     def __init__(self) -> None:
         self._sessions: dict[str, GeminiLiveSession] = {}
+        # One client (and its channel/credentials) shared by every session, built on first use
+        self._client: genai.Client | None = None
+        # Serializes create/remove so concurrent lifecycle calls can't orphan a session;
+        # get_session/has_session stay lock-free
+        self._lock = asyncio.Lock()
 
     async def create_session(
         self,
@@ -361,23 +474,36 @@ class GeminiLiveManager:
         on_text_chunk: TextChunkCallback,
     ) -> GeminiLiveSession:
         """Create and connect a new Gemini Live session for a bot."""
-        if bot_id in self._sessions:
-            await self.remove_session(bot_id)
-
-        session = GeminiLiveSession(
-            bot_id=bot_id,
-            system_instruction=system_instruction,
-            on_audio_chunk=on_audio_chunk,
-            on_turn_complete=on_turn_complete,
-            on_text_chunk=on_text_chunk,
-        )
-        await session.connect()
-        self._sessions[bot_id] = session
-        logger.info("Live session created for bot %s (total=%d)", bot_id, len(self._sessions))
-        return session
+        async with self._lock:
+            if bot_id in self._sessions:
+                await self._remove_locked(bot_id)
+
+            session = GeminiLiveSession(
+                bot_id=bot_id,
+                system_instruction=system_instruction,
+                on_audio_chunk=on_audio_chunk,
+                on_turn_complete=on_turn_complete,
+                on_text_chunk=on_text_chunk,
+                client=self._get_client(),
+            )
+            await session.connect()
+            self._sessions[bot_id] = session
+            logger.info("Live session created for bot %s (total=%d)", bot_id, len(self._sessions))
+            return session
+
+    def _get_client(self) -> genai.Client:
+        """Return the shared genai client, creating it on first use."""
+        if self._client is None:
+            self._client = _build_client()
+        return self._client
 
     async def remove_session(self, bot_id: str) -> None:
         """Disconnect and remove a session."""
+        async with self._lock:
+            await self._remove_locked(bot_id)
+
+    async def _remove_locked(self, bot_id: str) -> None:
+        """Disconnect and remove a session; the caller must hold ``_lock``."""
         session = self._sessions.pop(bot_id, None)
         if session:
             await session.disconnect()
@@ -393,7 +519,7 @@ class GeminiLiveManager:
 
     async def shutdown(self) -> None:
         """Disconnect all sessions."""
-        bot_ids = list(self._sessions.keys())
-        for bot_id in bot_ids:
-            await self.remove_session(bot_id)
+        async with self._lock:
+            for bot_id in list(self._sessions):
+                await self._remove_locked(bot_id)
         logger.info("All Gemini Live sessions shut down")
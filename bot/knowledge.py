@@ -2,67 +2,155 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
+import os
+import re
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 from config import settings
 
 logger = logging.getLogger("meeting-proxy.knowledge")
 
-
-class KnowledgeBase:
-    """Loads markdown/text files from a directory and provides keyword search."""
-
-    def __init__(self, knowledge_dir: str | None = None) -> None:
-        self._dir = Path(knowledge_dir or settings.knowledge_dir)
-        self._documents: list[dict[str, str]] = []
-        self._load_documents()
-
-    def _load_documents(self) -> None:
-        if not self._dir.exists():
-            logger.warning("Knowledge directory does not exist: %s", self._dir)
-            return
-
-        for path in sorted(self._dir.glob("**/*")):
-            if path.is_file() and path.suffix.lower() in {".md", ".txt"}:
-                try:
-                    content = path.read_text(encoding="utf-8").strip()
-                    if content:
-                        self._documents.append(
-                            {
-                                "filename": path.name,
-                                "path": str(path),
-                                "content": content,
-                            }
-                        )
-                        logger.info("Loaded knowledge: %s (%d chars)", path.name, len(content))
-                except Exception:
-                    logger.exception("Failed to load knowledge file: %s", path)
-
-        logger.info("Knowledge base loaded: %d documents", len(self._documents))
-
-    def search(self, query: str, max_results: int = 3) -> list[dict[str, str]]:
-        """Search documents by keyword matching. Returns top matches."""
-        if not query.strip() or not self._documents:
-            return []
-
-        keywords = [k.lower() for k in query.split() if len(k) >= 2]
-        if not keywords:
-            return []
-
-        scored: list[tuple[int, dict[str, str]]] = []
-        for doc in self._documents:
-            content_lower = doc["content"].lower()
-            score = sum(content_lower.count(kw) for kw in keywords)
-            if score > 0:
-                scored.append((score, doc))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [doc for _, doc in scored[:max_results]]
-
-    def get_context(self, query: str, max_chars: int = 2000) -> str:
-        """Build a context string from relevant documents for LLM prompt."""
-        results = self.search(query)
+_LOAD_WORKERS = 8
+_DOCUMENT_SUFFIXES = (".md", ".txt")
+# Query words: runs of 2+ word characters (\w covers kana/kanji), so attached punctuation is dropped
+_TOKEN_RE = re.compile(r"\w{2,}")
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase, tokenize, drop 1-char words and sort, so equivalent queries share a cache entry."""
+    return " ".join(sorted(_TOKEN_RE.findall(query.lower())))
+
+
+def _iter_document_paths(root: Path) -> Iterator[Path]:
+    """Yield knowledge files under ``root``, using the type info scandir already has for each entry."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.name.lower().endswith(_DOCUMENT_SUFFIXES) and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _fingerprint(paths: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    """Stat-only signature of a document set: any add, remove, rename or edit changes it."""
+    signature = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            signature.append((str(path), -1, -1))
+        else:
+            signature.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _read_document(path: Path) -> str | None:
+    """Read and strip one knowledge file; ``None`` if it can't be read."""
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except Exception:
+        logger.exception("Failed to load knowledge file: %s", path)
+        return None
+
+
+def _bigrams(text: str) -> set[str]:
+    """Return the set of 2-character substrings of ``text``."""
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+class _DocumentSet:
+    """One immutable load of the knowledge documents, with its own query caches.
+
+    ``KnowledgeBase.reload`` builds a new set and swaps it in with a single
+    assignment, so a search running in a worker thread during a reload sees
+    either the old documents or the new ones, never a half-built index, and
+    whatever it caches stays attached to the set it was computed from.
+    """
+
+    def __init__(self, paths: list[Path] | None = None) -> None:
+        # Documents as parallel lists indexed by document number; search touches only contents_lower
+        self.filenames: list[str] = []
+        self.paths: list[str] = []
+        self.contents: list[str] = []
+        self.contents_lower: list[str] = []
+        # Character bigram -> indices of documents containing it (prefilter for substring search)
+        self.postings: dict[str, set[int]] = {}
+        # Meetings repeat similar utterances; the caches are dropped with the set on reload
+        self.search_cached = lru_cache(maxsize=256)(self._rank)
+        self.context_cached = lru_cache(maxsize=256)(self._build_context)
+        if paths is not None:
+            self._load(paths)
+
+    def _load(self, paths: list[Path]) -> None:
+        # Read concurrently: wall time tracks the slowest file rather than the sum of all reads
+        with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as pool:
+            contents = list(pool.map(_read_document, paths))
+
+        for path, content in zip(paths, contents):
+            if content:
+                # Lowercased once here; search() reads it on every query
+                content_lower = content.lower()
+                doc_index = len(self.contents)
+                for bigram in _bigrams(content_lower):
+                    self.postings.setdefault(bigram, set()).add(doc_index)
+                self.filenames.append(path.name)
+                self.paths.append(str(path))
+                self.contents.append(content)
+                self.contents_lower.append(content_lower)
+                logger.info("Loaded knowledge: %s (%d chars)", path.name, len(content))
+
+    def _rank(self, query_norm: str, max_results: int) -> tuple[dict[str, str], ...]:
+        """Score every document against a normalized query (see ``_normalize_query``)."""
+        keywords = query_norm.split()
+
+        # Repeated query words count once per repetition, as with per-keyword counting
+        weights = Counter(keywords)
+
+        # Each keyword is counted on its own (str.count), so nested keywords such as 会議/会議室 both
+        # score; it is only counted in documents holding every one of its bigrams
+        contents_lower = self.contents_lower
+        scores: dict[int, int] = {}
+        for keyword, weight in weights.items():
+            for doc_index in self.candidates(keyword):
+                count = contents_lower[doc_index].count(keyword)
+                if count:
+                    scores[doc_index] = scores.get(doc_index, 0) + weight * count
+        scored = [(score, doc_index) for doc_index, score in sorted(scores.items())]
+
+        # nlargest keeps a k-sized heap and, like a stable sort, preserves index order on ties
+        top = heapq.nlargest(max_results, scored, key=itemgetter(0))
+        return tuple(self._document(doc_index) for _, doc_index in top)
+
+    def _document(self, doc_index: int) -> dict[str, str]:
+        """Materialize the result record for one document."""
+        return {
+            "filename": self.filenames[doc_index],
+            "path": self.paths[doc_index],
+            "content": self.contents[doc_index],
+        }
+
+    def candidates(self, keyword: str) -> set[int]:
+        """Return indices of documents that contain every character bigram of ``keyword``."""
+        postings = []
+        for bigram in _bigrams(keyword):
+            docs = self.postings.get(bigram)
+            if not docs:
+                return set()
+            postings.append(docs)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def _build_context(self, query_norm: str, max_chars: int) -> str:
+        results = self.search_cached(query_norm, 3)
         if not results:
             return ""
 
@@ -80,11 +168,64 @@ class KnowledgeBase:
 
         return "\n\n".join(parts)
 
+
+class KnowledgeBase:
+    """Loads markdown/text files from a directory and provides keyword search.
+
+    Safe to search from worker threads while ``reload`` runs: see ``_DocumentSet``.
+    """
+
+    def __init__(self, knowledge_dir: str | None = None) -> None:
+        self._dir = Path(knowledge_dir or settings.knowledge_dir)
+        # Signature of the files last loaded; reload() is a no-op while it still matches
+        self._fingerprint: tuple[tuple[str, int, int], ...] | None = None
+        self._documents = _DocumentSet()
+        self._load_documents(self._scan())
+
+    def _scan(self) -> list[Path] | None:
+        """List document paths in load order, or ``None`` if the directory is missing."""
+        if not self._dir.exists():
+            return None
+        return sorted(_iter_document_paths(self._dir))
+
+    def _load_documents(self, paths: list[Path] | None) -> None:
+        if paths is None:
+            logger.warning("Knowledge directory does not exist: %s", self._dir)
+            documents = _DocumentSet()
+            fingerprint = None
+        else:
+            fingerprint = _fingerprint(paths)
+            documents = _DocumentSet(paths)
+            logger.info("Knowledge base loaded: %d documents", len(documents.contents))
+        # Swap in the fully built set (and its empty caches) in one step
+        self._documents = documents
+        self._fingerprint = fingerprint
+
+    def search(self, query: str, max_results: int = 3) -> list[dict[str, str]]:
+        """Search documents by keyword matching. Returns top matches."""
+        documents = self._documents
+        query_norm = _normalize_query(query)
+        if not query_norm or not documents.contents:
+            return []
+        return list(documents.search_cached(query_norm, max_results))
+
+    def get_context(self, query: str, max_chars: int = 2000) -> str:
+        """Build a context string from relevant documents for LLM prompt."""
+        documents = self._documents
+        query_norm = _normalize_query(query)
+        if not query_norm or not documents.contents:
+            return ""
+        return documents.context_cached(query_norm, max_chars)
+
     @property
     def document_count(self) -> int:
-        return len(self._documents)
+        return len(self._documents.contents)
 
     def reload(self) -> None:
-        """Reload all documents from disk."""
-        self._documents.clear()
-        self._load_documents()
+        """Reload all documents from disk, skipping the work if no file has changed."""
+        paths = self._scan()
+        fingerprint = None if paths is None else _fingerprint(paths)
+        if fingerprint == self._fingerprint:
+            logger.info("Knowledge base unchanged, skipping reload: %s", self._dir)
+            return
+        self._load_documents(paths)
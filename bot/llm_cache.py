@@ -0,0 +1,82 @@
+"""In-memory LRU + TTL cache for text generation responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from config import settings
+
+
+def cache_key(model: str, prompt: str, **params: Any) -> str:
+    """Build a stable cache key from the model, prompt and generation parameters."""
+    payload = json.dumps({"model": model, "prompt": prompt, "params": params}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Bounded response cache with least-recently-used eviction and a per-entry TTL.
+
+    Operations never await and are guarded by a lock, so the cache is safe to
+    share between the event loop and threadpool workers.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 300.0) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()  # key -> (expires_at, response)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or ``None`` on a miss or expired entry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, response: str) -> None:
+        """Store ``response`` under ``key``, evicting the least recently used entries past capacity."""
+        if self._max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self._ttl
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current entry count."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+_shared_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = LLMCache(settings.llm_cache_max_entries, settings.llm_cache_ttl_seconds)
+    return _shared_cache
@@ -48,6 +48,9 @@ class LocalMeetingSession:
         self.meeting_id = meeting_id
         self._audio_bridge: Any = None
         self._gemini_session: Any = None
+        # Fixed for the session: resolve once instead of going through settings on every turn
+        self._output_sample_rate = settings.gemini_live_output_sample_rate
+        self._inv_bytes_per_second = 1.0 / (self._output_sample_rate * 2)  # 16-bit mono PCM
 
     async def start(self, system_instruction: str) -> None:
         """Start the local meeting session.
@@ -92,14 +95,14 @@ class LocalMeetingSession:
         """Handle Gemini turn completion: play audio and persist response."""
         if audio_data and self._audio_bridge is not None:
             # Echo suppression: mute input while playing response
-            playback_seconds = len(audio_data) / (settings.gemini_live_output_sample_rate * 2)
+            playback_seconds = len(audio_data) * self._inv_bytes_per_second
             mute_seconds = min(max(playback_seconds + 0.6, 0.5), 12.0)
 
             if self._gemini_session is not None:
                 self._gemini_session.set_mute_duration(0.5)  # Pre-mute
 
             # Play audio through BlackHole 16ch -> Meet microphone
-            self._audio_bridge.play_audio(audio_data, settings.gemini_live_output_sample_rate)
+            await self._audio_bridge.play_audio(audio_data, self._output_sample_rate)
 
             if self._gemini_session is not None:
                 self._gemini_session.set_mute_duration(mute_seconds)
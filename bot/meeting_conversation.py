@@ -3,14 +3,30 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any
 
 from bot.conversation import ConversationSession
 
 logger = logging.getLogger("meeting-proxy.bot.meeting")
 
-_CATEGORY_PATTERN = re.compile(r"\[(ANSWERED|TAKEN_BACK)\]\s*", re.IGNORECASE)
+# Tags are only recognized at the very start of a response (case-insensitive)
+_CATEGORY_TAGS = (("[answered]", "answered"), ("[taken_back]", "taken_back"))
+_CATEGORY_TAG_MAX_LEN = max(len(tag) for tag, _ in _CATEGORY_TAGS)
+
+# Static prompt blocks, joined once at import
+_MATERIALS_HEADER = "\n--- 添付資料 ---"
+_MEETING_RULES = "\n".join(
+    [
+        "",
+        "--- 行動ルール ---",
+        "1. 資料について質問されたら、添付資料に基づいて説明",
+        "2. 資料に答えがある → [ANSWERED] を回答の先頭に付けて直接回答",
+        "3. 判断が必要な事項（予算承認、方針決定等）→ [TAKEN_BACK]「持ち帰って確認します」",
+        "4. 資料にない情報 →「確認して後日回答します」",
+        "5. 2〜3文の簡潔な回答（音声読み上げのため）",
+        "6. [ANSWERED] または [TAKEN_BACK] タグは必ず回答の先頭に付けること",
+    ]
+)
 
 
 class MeetingConversationSession(ConversationSession):
@@ -38,29 +54,9 @@ class MeetingConversationSession(ConversationSession):
     def build_meeting_system_prompt(self, base_persona_prompt: str) -> str:
         """Build an enhanced system prompt with material context and behavior rules."""
         parts = [base_persona_prompt]
-
         if self._materials_context:
-            parts.extend(
-                [
-                    "",
-                    "--- 添付資料 ---",
-                    self._materials_context,
-                ]
-            )
-
-        parts.extend(
-            [
-                "",
-                "--- 行動ルール ---",
-                "1. 資料について質問されたら、添付資料に基づいて説明",
-                "2. 資料に答えがある → [ANSWERED] を回答の先頭に付けて直接回答",
-                "3. 判断が必要な事項（予算承認、方針決定等）→ [TAKEN_BACK]「持ち帰って確認します」",
-                "4. 資料にない情報 →「確認して後日回答します」",
-                "5. 2〜3文の簡潔な回答（音声読み上げのため）",
-                "6. [ANSWERED] または [TAKEN_BACK] タグは必ず回答の先頭に付けること",
-            ]
-        )
-
+            parts += [_MATERIALS_HEADER, self._materials_context]
+        parts.append(_MEETING_RULES)
         return "\n".join(parts)
 
     @staticmethod
@@ -69,12 +65,12 @@ class MeetingConversationSession(ConversationSession):
 
         Returns (clean_text, category) where category is 'answered', 'taken_back', or None.
         """
-        match = _CATEGORY_PATTERN.match(text)
-        if match:
-            tag = match.group(1).lower()
-            category = tag.replace("_", "_")  # 'answered' or 'taken_back'
-            clean_text = text[match.end() :].strip()
-            return clean_text, category
+        if not text.startswith("["):
+            return text, None
+        head = text[:_CATEGORY_TAG_MAX_LEN].lower()
+        for tag, category in _CATEGORY_TAGS:
+            if head.startswith(tag):
+                return text[len(tag) :].strip(), category
         return text, None
 
     def build_materials_context_from_list(self, materials: list[dict[str, Any]]) -> str:
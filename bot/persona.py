@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 from config import settings
@@ -16,6 +17,109 @@ _DEFAULT_PROFILE = {
     "language": "Japanese",
 }
 
+_NAME_PREFIXES = ("- Name:", "- name:")
+
+# Static prompt blocks, pre-joined so each build only concatenates a handful of strings
+_SYSTEM_INTRO = "\n".join(
+    [
+        "あなたは以下のペルソナとして会議に参加しています。",
+        "ペルソナになりきって、自然な日本語で応答してください。",
+        "応答は音声で読み上げられるため、2〜3文程度の簡潔な回答を心がけてください。",
+        "",
+        "--- ペルソナ情報 ---",
+    ]
+)
+_SYSTEM_KNOWLEDGE_HEADER = "\n".join(["", "--- 参考資料 ---", "以下の資料を参考にして回答してください:"])
+_SYSTEM_RULES = "\n".join(
+    [
+        "",
+        "--- 応答ルール ---",
+        "1. ペルソナの口調・専門性に合わせて応答する",
+        "2. 知らないことは正直に「わかりません」と答える",
+        "3. 音声出力のため、簡潔に2〜3文で回答する",
+        "4. 自然な会話体で話す（書き言葉は避ける）",
+    ]
+)
+
+_MEETING_INTRO_TEMPLATE = "\n".join(
+    [
+        "あなたは{name}の代理として会議に出席しています。",
+        "ペルソナになりきって、自然な日本語で応答してください。",
+        "",
+        "--- ペルソナ情報 ---",
+    ]
+)
+_MEETING_KNOWLEDGE_HEADER = "\n--- ナレッジベース ---"
+_MEETING_MATERIALS_HEADER = "\n--- 添付資料 ---"
+_MEETING_RULES = "\n".join(
+    [
+        "",
+        "--- 行動ルール ---",
+        "1. 資料について質問されたら、添付資料に基づいて説明",
+        "2. 資料に答えがある → [ANSWERED] を回答の先頭に付けて直接回答",
+        "3. 判断が必要な事項（予算承認、方針決定等）→ [TAKEN_BACK]「持ち帰って確認します」",
+        "4. 資料にない情報 →「確認して後日回答します」",
+        "5. 2〜3文の簡潔な回答（音声読み上げのため）",
+    ]
+)
+
+_LIVE_KNOWLEDGE_HEADER = "\n【ナレッジベース】"
+_LIVE_MATERIALS_HEADER = "\n".join(
+    [
+        "",
+        "【添付資料】",
+        "以下の資料の内容を把握しています。質問されたら具体的な数値や内容を引用して回答してください。",
+    ]
+)
+_LIVE_RULES_TEMPLATE = "\n".join(
+    [
+        "",
+        "【応答ルール】",
+        "1. {name}の口調・専門性に合わせて応答する",
+        "2. 資料について質問されたら、添付資料の具体的な内容を引用して回答する",
+        "3. 判断が必要な事項（予算承認、方針決定等）は「持ち帰って本人に確認します」と答える",
+        "4. 資料にない情報は「確認して後日回答します」と答える",
+        "5. 知らないことは正直に「わかりません」と答える",
+        "6. 2〜3文の簡潔な回答を心がける",
+        "7. 自然な会話体で話す（書き言葉は避ける）",
+        "",
+        "【禁止事項】",
+        "以下のような曖昧・汎用的な応答は絶対に避けてください:",
+        "「はい、何でしょうか」「どのようなご用件でしょうか」「何かお手伝いできますか」",
+        "「ご質問をどうぞ」「お聞きしています」",
+        "会議の参加者として、具体的な議題や資料に基づいて積極的に会話に参加してください。",
+    ]
+)
+_LIVE_INTRO_TEMPLATE = "\n".join(
+    [
+        "あなたは{name}の代理として会議に出席しています。",
+        "{name}になりきって、自然な日本語で音声応答してください。",
+        "",
+        "【ペルソナ情報】",
+    ]
+)
+
+
+@lru_cache(maxsize=8)
+def _fill_name(template: str, name: str) -> str:
+    """Fill a block template's ``{name}`` placeholder (memoized: the name rarely changes)."""
+    return template.format(name=name)
+
+
+@lru_cache(maxsize=32)
+def _compose(intro: str, profile: str, sections: tuple[tuple[str, str], ...], rules: str) -> str:
+    """Join a system prompt: intro, persona profile, each non-empty ``(header, body)`` section, then rules.
+
+    Shared by every prompt flavour and cached on all of its inputs, so a changed
+    profile or context simply misses the cache.
+    """
+    parts = [intro, profile]
+    for header, body in sections:
+        if body:
+            parts += [header, body]
+    parts.append(rules)
+    return "\n".join(parts)
+
 
 class Persona:
     """Loads persona profile from markdown and builds system prompts."""
@@ -43,7 +147,7 @@ class Persona:
     def _extract_name(self) -> str:
         for line in self._raw_profile.splitlines():
             stripped = line.strip()
-            if stripped.startswith("- Name:") or stripped.startswith("- name:"):
+            if stripped.startswith(_NAME_PREFIXES):
                 return stripped.split(":", 1)[1].strip()
         return settings.bot_display_name
 
@@ -58,38 +162,10 @@ class Persona:
 
     def build_system_prompt(self, knowledge_context: str = "") -> str:
         """Build a system prompt for Gemini with persona and optional knowledge."""
-        parts = [
-            "あなたは以下のペルソナとして会議に参加しています。",
-            "ペルソナになりきって、自然な日本語で応答してください。",
-            "応答は音声で読み上げられるため、2〜3文程度の簡潔な回答を心がけてください。",
-            "",
-            "--- ペルソナ情報 ---",
-            self._raw_profile,
-        ]
-
-        if knowledge_context:
-            parts.extend(
-                [
-                    "",
-                    "--- 参考資料 ---",
-                    "以下の資料を参考にして回答してください:",
-                    knowledge_context,
-                ]
-            )
-
-        parts.extend(
-            [
-                "",
-                "--- 応答ルール ---",
-                "1. ペルソナの口調・専門性に合わせて応答する",
-                "2. 知らないことは正直に「わかりません」と答える",
-                "3. 音声出力のため、簡潔に2〜3文で回答する",
-                "4. 自然な会話体で話す（書き言葉は避ける）",
-            ]
+        return _compose(
+            _SYSTEM_INTRO, self._raw_profile, ((_SYSTEM_KNOWLEDGE_HEADER, knowledge_context),), _SYSTEM_RULES
         )
 
-        return "\n".join(parts)
-
     @property
     def name(self) -> str:
         return self._name
@@ -100,45 +176,20 @@ class Persona:
 
     def build_meeting_system_prompt(self, knowledge_context: str = "", materials_context: str = "") -> str:
         """Build a system prompt for meeting attendance with materials support."""
-        parts = [
-            f"あなたは{self._name}の代理として会議に出席しています。",
-            "ペルソナになりきって、自然な日本語で応答してください。",
-            "",
-            "--- ペルソナ情報 ---",
-            self._raw_profile,
-        ]
-
-        if knowledge_context:
-            parts.extend(
-                [
-                    "",
-                    "--- ナレッジベース ---",
-                    knowledge_context,
-                ]
-            )
-
-        if materials_context:
-            parts.extend(
-                [
-                    "",
-                    "--- 添付資料 ---",
-                    materials_context,
-                ]
-            )
-
-        parts.extend(
-            [
-                "",
-                "--- 行動ルール ---",
-                "1. 資料について質問されたら、添付資料に基づいて説明",
-                "2. 資料に答えがある → [ANSWERED] を回答の先頭に付けて直接回答",
-                "3. 判断が必要な事項（予算承認、方針決定等）→ [TAKEN_BACK]「持ち帰って確認します」",
-                "4. 資料にない情報 →「確認して後日回答します」",
-                "5. 2〜3文の簡潔な回答（音声読み上げのため）",
-            ]
-        )
+        sections = ((_MEETING_KNOWLEDGE_HEADER, knowledge_context), (_MEETING_MATERIALS_HEADER, materials_context))
+        return _compose(_fill_name(_MEETING_INTRO_TEMPLATE, self._name), self._raw_profile, sections, _MEETING_RULES)
+
+    def build_knowledge_section(self, knowledge_context: str) -> str:
+        """Return build_system_prompt()'s knowledge section alone, to place after the static prompt."""
+        if not knowledge_context:
+            return ""
+        return f"{_SYSTEM_KNOWLEDGE_HEADER.lstrip()}\n{knowledge_context}"
 
-        return "\n".join(parts)
+    def build_meeting_knowledge_section(self, knowledge_context: str) -> str:
+        """Return the meeting prompt's knowledge section alone, for prompts whose system part is cached."""
+        if not knowledge_context:
+            return ""
+        return f"{_MEETING_KNOWLEDGE_HEADER.lstrip()}\n{knowledge_context}"
 
     def build_live_system_prompt(self, knowledge_context: str = "", materials_context: str = "") -> str:
         """Build a system prompt optimized for Gemini Live API voice output.
@@ -149,55 +200,14 @@ class Persona:
         - Explicitly prohibits vague/generic responses
         - Encourages proactive, material-based answers
         """
-        parts = [
-            f"あなたは{self._name}の代理として会議に出席しています。",
-            f"{self._name}になりきって、自然な日本語で音声応答してください。",
-            "",
-            "【ペルソナ情報】",
+        sections = ((_LIVE_KNOWLEDGE_HEADER, knowledge_context), (_LIVE_MATERIALS_HEADER, materials_context))
+        return _compose(
+            _fill_name(_LIVE_INTRO_TEMPLATE, self._name),
             self._raw_profile,
-        ]
-
-        if knowledge_context:
-            parts.extend(
-                [
-                    "",
-                    "【ナレッジベース】",
-                    knowledge_context,
-                ]
-            )
-
-        if materials_context:
-            parts.extend(
-                [
-                    "",
-                    "【添付資料】",
-                    "以下の資料の内容を把握しています。質問されたら具体的な数値や内容を引用して回答してください。",
-                    materials_context,
-                ]
-            )
-
-        parts.extend(
-            [
-                "",
-                "【応答ルール】",
-                f"1. {self._name}の口調・専門性に合わせて応答する",
-                "2. 資料について質問されたら、添付資料の具体的な内容を引用して回答する",
-                "3. 判断が必要な事項（予算承認、方針決定等）は「持ち帰って本人に確認します」と答える",
-                "4. 資料にない情報は「確認して後日回答します」と答える",
-                "5. 知らないことは正直に「わかりません」と答える",
-                "6. 2〜3文の簡潔な回答を心がける",
-                "7. 自然な会話体で話す（書き言葉は避ける）",
-                "",
-                "【禁止事項】",
-                "以下のような曖昧・汎用的な応答は絶対に避けてください:",
-                "「はい、何でしょうか」「どのようなご用件でしょうか」「何かお手伝いできますか」",
-                "「ご質問をどうぞ」「お聞きしています」",
-                "会議の参加者として、具体的な議題や資料に基づいて積極的に会話に参加してください。",
-            ]
+            sections,
+            _fill_name(_LIVE_RULES_TEMPLATE, self._name),
         )
 
-        return "\n".join(parts)
-
     def reload(self) -> None:
         """Reload persona profile from disk."""
         self._load_profile()
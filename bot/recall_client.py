@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import binascii
+import importlib.util
+import json
 import logging
 from typing import Any
 
@@ -7,13 +11,52 @@ import httpx
 
 from config import settings
 
+try:  # Faster JSON encode/decode (orjson, in requirements.txt); stdlib json if missing
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # SIMD-accelerated base64 for output audio (pybase64, in requirements.txt); binascii if missing
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 logger = logging.getLogger("meeting-proxy.recall")
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _dumps(payload: dict[str, Any]) -> bytes:
+    """Serialize a request body to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads(resp: httpx.Response) -> dict[str, Any]:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        data: dict[str, Any] = orjson.loads(resp.content)
+    else:
+        data = json.loads(resp.content)
+    return data
+
+
+def _output_audio_body(mp3_bytes: bytes | bytearray) -> bytes:
+    """Serialize an output_audio request body (base64 MP3 in JSON).
+
+    The base64 alphabet needs no JSON escaping, so the encoded bytes are spliced
+    in directly instead of being decoded to str and copied again by a serializer.
+    """
+    encoded = pybase64.b64encode(mp3_bytes) if pybase64 is not None else binascii.b2a_base64(mp3_bytes, newline=False)
+    return b'{"kind":"mp3","b64_data":"' + encoded + b'"}'
+
 
 class RecallClient:
     """Thin wrapper around the Recall.ai REST API."""
 
-    def __init__(self) -> None:
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
         if not settings.recall_api_key:
             raise RuntimeError("RECALL_API_KEY is not configured")
         self._base_url = settings.recall_base_url.rstrip("/")
@@ -21,6 +64,26 @@ class RecallClient:
             "Authorization": f"Token {settings.recall_api_key}",
             "Content-Type": "application/json",
         }
+        # One pooled client per RecallClient, so calls reuse keep-alive connections instead of a fresh TLS handshake
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            )
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._headers,
+            timeout=30,
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
 
     def _get_bot_image_url(self) -> str | None:
         """Build the public URL for the bot avatar image."""
@@ -46,29 +109,18 @@ class RecallClient:
                     },
                 ],
             }
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self._base_url}/bot",
-                json=payload,
-                headers=self._headers,
-                timeout=30,
-            )
-            resp.raise_for_status()
-            data: dict[str, Any] = resp.json()
-            logger.info("Bot created: id=%s", data.get("id"))
-            return data
+        resp = await self._client.post("/bot", content=_dumps(payload))
+        resp.raise_for_status()
+        data = _loads(resp)
+        logger.info("Bot created: id=%s", data.get("id"))
+        return data
 
     async def get_bot_status(self, bot_id: str) -> dict[str, Any]:
         """Get the current status of a bot."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self._base_url}/bot/{bot_id}",
-                headers=self._headers,
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data: dict[str, Any] = resp.json()
-            return data
+        resp = await self._client.get(f"/bot/{bot_id}", timeout=15)
+        resp.raise_for_status()
+        data = _loads(resp)
+        return data
 
     async def create_bot_with_audio(self, meeting_url: str, bot_name: str) -> dict[str, Any]:
         """Create a bot with Output Audio enabled for bidirectional voice."""
@@ -94,36 +146,28 @@ class RecallClient:
                     },
                 ],
             }
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self._base_url}/bot",
-                json=payload,
-                headers=self._headers,
-                timeout=30,
-            )
-            if resp.status_code >= 400:
-                logger.error("Recall.ai error %s: %s", resp.status_code, resp.text)
-            resp.raise_for_status()
-            data: dict[str, Any] = resp.json()
-            logger.info("Bot created with audio: id=%s name=%s", data.get("id"), bot_name)
-            return data
-
-    async def send_audio(self, bot_id: str, b64_mp3: str) -> dict[str, Any]:
-        """Send base64-encoded MP3 audio to the meeting via Output Audio API."""
-        payload = {"kind": "mp3", "b64_data": b64_mp3}
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self._base_url}/bot/{bot_id}/output_audio",
-                json=payload,
-                headers=self._headers,
-                timeout=30,
-            )
-            if resp.status_code >= 400:
-                logger.error("send_audio error %s: %s", resp.status_code, resp.text)
-            resp.raise_for_status()
-            data: dict[str, Any] = resp.json()
-            logger.info("Audio sent to bot %s", bot_id)
-            return data
+        resp = await self._client.post("/bot", content=_dumps(payload))
+        if resp.status_code >= 400:
+            logger.error("Recall.ai error %s: %s", resp.status_code, resp.text)
+        resp.raise_for_status()
+        data = _loads(resp)
+        logger.info("Bot created with audio: id=%s name=%s", data.get("id"), bot_name)
+        return data
+
+    async def send_audio(self, bot_id: str, mp3_bytes: bytes | bytearray) -> dict[str, Any]:
+        """Send MP3 audio to the meeting via Output Audio API.
+
+        The API takes base64 inside a JSON body; for multi-second clips that
+        encode and serialization is done on a worker thread, off the event loop.
+        """
+        body = await asyncio.to_thread(_output_audio_body, mp3_bytes)
+        resp = await self._client.post(f"/bot/{bot_id}/output_audio", content=body)
+        if resp.status_code >= 400:
+            logger.error("send_audio error %s: %s", resp.status_code, resp.text)
+        resp.raise_for_status()
+        data = _loads(resp)
+        logger.info("Audio sent to bot %s", bot_id)
+        return data
 
     async def create_bot_with_live_audio(self, meeting_url: str, bot_name: str, websocket_url: str) -> dict[str, Any]:
         """Create a bot with audio_mixed_raw streaming and Output Audio for Gemini Live mode.
@@ -157,29 +201,38 @@ class RecallClient:
                 },
             ],
         }
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self._base_url}/bot",
-                json=payload,
-                headers=self._headers,
-                timeout=30,
-            )
-            if resp.status_code >= 400:
-                logger.error("Recall.ai error %s: %s", resp.status_code, resp.text)
-            resp.raise_for_status()
-            data: dict[str, Any] = resp.json()
-            logger.info("Bot created with live audio: id=%s name=%s", data.get("id"), bot_name)
-            return data
+        resp = await self._client.post("/bot", content=_dumps(payload))
+        if resp.status_code >= 400:
+            logger.error("Recall.ai error %s: %s", resp.status_code, resp.text)
+        resp.raise_for_status()
+        data = _loads(resp)
+        logger.info("Bot created with live audio: id=%s name=%s", data.get("id"), bot_name)
+        return data
 
     async def leave_meeting(self, bot_id: str) -> dict[str, Any]:
         """Tell the bot to leave the meeting."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self._base_url}/bot/{bot_id}/leave_call",
-                headers=self._headers,
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data: dict[str, Any] = resp.json()
-            logger.info("Bot %s leaving meeting", bot_id)
-            return data
+        resp = await self._client.post(f"/bot/{bot_id}/leave_call", timeout=15)
+        resp.raise_for_status()
+        data = _loads(resp)
+        logger.info("Bot %s leaving meeting", bot_id)
+        return data
+
+
+# Process-wide client; main.py builds it at startup and close_recall_client() releases it on shutdown
+_shared_client: RecallClient | None = None
+
+
+def get_recall_client() -> RecallClient:
+    """Return the process-wide RecallClient, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = RecallClient()
+    return _shared_client
+
+
+async def close_recall_client() -> None:
+    """Close the shared RecallClient (called on app shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
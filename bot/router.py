@@ -2,16 +2,34 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+import uuid
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from httpx import HTTPStatusError
+from vertexai.generative_models import GenerationConfig, GenerativeModel
 
+from bot import tts
+from bot.context_cache import MeetingContextCache
+from bot.llm_cache import cache_key, get_llm_cache
+from bot.meeting_conversation import MeetingConversationSession
 from config import settings
 
+try:  # Faster JSON parsing of webhook bodies (orjson, in requirements.txt); stdlib json if missing
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("meeting-proxy.bot")
 
+# A sentence: text up to and including a run of terminators (for sentence-by-sentence TTS)
+_SENTENCE_RE = re.compile(r"[^。！？!?]*[。！？!?]+")
+
 router = APIRouter(tags=["bot"])
 
 # Module-level singletons (initialized lazily or at startup)
@@ -22,10 +40,24 @@ _live_manager: Any = None  # GeminiLiveManager, set by main.py
 
 # Mapping of bot_id -> meeting_id for DB persistence
 _bot_meeting_map: dict[str, str] = {}
+# Created lazily per event loop (see _get_restore_lock); an import-time lock binds to the wrong loop on 3.9
+_bot_meeting_restore_lock: asyncio.Lock | None = None
+_bot_meeting_restore_loop: asyncio.AbstractEventLoop | None = None
 
 # Local mode sessions: bot_id -> LocalMeetingSession
 _local_sessions: dict[str, Any] = {}
 
+# Per-bot transcript queues, each drained by a single response worker (see _enqueue_transcript)
+_TRANSCRIPT_QUEUE_SIZE = 4
+_transcript_queues: dict[str, asyncio.Queue[tuple[str, str]]] = {}
+_transcript_workers: dict[str, asyncio.Task[None]] = {}
+
+# Per-bot semantic response caches: bot_id -> SemanticCache (SEMANTIC_CACHE_ENABLED)
+_semantic_caches: dict[str, Any] = {}
+
+# Per-bot Vertex AI cached system instructions (GEMINI_CONTEXT_CACHE_ENABLED)
+_context_cache = MeetingContextCache()
+
 
 def set_live_manager(manager: Any) -> None:
     """Set the module-level GeminiLiveManager reference."""
@@ -41,11 +73,29 @@ def _require_meeting_backend() -> None:
         raise HTTPException(status_code=503, detail="Recall.ai is not configured")
 
 
+async def _request_json(request: Request) -> Any:
+    """Parse the request body as JSON, with orjson when it is installed."""
+    if orjson is None:
+        return await request.json()
+    return orjson.loads(await request.body())
+
+
 def _get_recall_client() -> Any:
-    """Build a RecallClient instance (lazy import to avoid startup errors)."""
-    from bot.recall_client import RecallClient
+    """Return the shared RecallClient (lazy import to avoid startup errors)."""
+    from bot.recall_client import get_recall_client
+
+    return get_recall_client()
+
 
-    return RecallClient()
+@lru_cache(maxsize=1)
+def _gemini_model(model_name: str) -> GenerativeModel:
+    """Build the avatar's GenerativeModel once per configured model name."""
+    return GenerativeModel(model_name)
+
+
+def get_gemini_model() -> GenerativeModel:
+    """Return the shared GenerativeModel for GEMINI_MODEL (rebuilt only if the setting changes)."""
+    return _gemini_model(settings.gemini_model)
 
 
 def get_persona() -> Any:
@@ -80,6 +130,13 @@ def init_avatar_components() -> None:
         _persona.name,
     )
 
+    # Build the shared Gemini model now rather than on the first utterance
+    _gemini_model.cache_clear()
+    try:
+        get_gemini_model()
+    except Exception:
+        logger.warning("Gemini model not available yet; it will be built on first use", exc_info=True)
+
 
 @router.post("/join")
 async def join_meeting(
@@ -87,7 +144,7 @@ async def join_meeting(
     _: None = Depends(_require_meeting_backend),
 ) -> JSONResponse:
     """Send a bot to join a Google Meet meeting (Recall.ai or local browser)."""
-    body = await request.json()
+    body = await _request_json(request)
     meeting_url: str | None = body.get("meeting_url")
     if not meeting_url or not meeting_url.strip():
         raise HTTPException(status_code=400, detail="meeting_url is required")
@@ -157,8 +214,6 @@ async def join_meeting(
     elif enable_avatar and _conversation_manager is not None:
         if meeting_id:
             # Use meeting-aware conversation session
-            from bot.meeting_conversation import MeetingConversationSession
-
             repo = getattr(request.app.state, "repo", None)
             if repo:
                 materials = await repo.list_materials(meeting_id)
@@ -207,8 +262,6 @@ async def _join_local(
     repo = getattr(request.app.state, "repo", None)
     system_instruction = await _build_live_system_instruction(request, meeting_id, bot_name)
 
-    import uuid
-
     bot_id = str(uuid.uuid4())
     session = LocalMeetingSession(
         bot_id=bot_id,
@@ -277,6 +330,9 @@ async def leave_meeting(
         except Exception:
             logger.exception("Error stopping local session (bot=%s)", bot_id)
         _bot_meeting_map.pop(bot_id, None)
+        _stop_transcript_worker(bot_id)
+        await _flush_conversation_log(request.app.state)
+        _semantic_caches.pop(bot_id, None)
         if _conversation_manager is not None:
             _conversation_manager.remove(bot_id)
         return JSONResponse({"bot_id": bot_id, "detail": "Left meeting (local)", "result": {}})
@@ -291,7 +347,8 @@ async def leave_meeting(
         logger.exception("Recall.ai leave_meeting failed")
         raise HTTPException(status_code=502, detail="Failed to leave meeting") from exc
 
-    # Update meeting status in DB
+    # Update meeting status in DB, with the meeting's conversation fully written
+    await _flush_conversation_log(request.app.state)
     meeting_id = _bot_meeting_map.pop(bot_id, None)
     if meeting_id:
         repo = getattr(request.app.state, "repo", None)
@@ -305,12 +362,253 @@ async def leave_meeting(
         except Exception:
             logger.exception("Failed to remove live session for bot %s", bot_id)
 
+    _stop_transcript_worker(bot_id)
+    _semantic_caches.pop(bot_id, None)
+    if settings.gemini_context_cache_enabled:
+        await asyncio.to_thread(_context_cache.drop, bot_id)
     if _conversation_manager is not None:
         _conversation_manager.remove(bot_id)
 
     return JSONResponse({"bot_id": bot_id, "detail": "Leave request sent", "result": result})
 
 
+async def _flush_conversation_log(app_state: Any) -> None:
+    """Write out buffered conversation entries (e.g. before minutes are generated from them)."""
+    conversation_log = getattr(app_state, "conversation_log", None)
+    if conversation_log is not None:
+        await conversation_log.flush()
+
+
+def _get_semantic_cache(bot_id: str) -> Any:
+    """Return the bot's SemanticCache, creating it on first use (one per bot, so meetings never share answers)."""
+    cache = _semantic_caches.get(bot_id)
+    if cache is None:
+        from bot.semantic_cache import SemanticCache
+
+        cache = _semantic_caches[bot_id] = SemanticCache(
+            settings.semantic_cache_threshold, settings.semantic_cache_max_entries
+        )
+    return cache
+
+
+def _get_restore_lock() -> asyncio.Lock:
+    """Return the bot-meeting restore lock for the running event loop, creating it on first use."""
+    global _bot_meeting_restore_lock, _bot_meeting_restore_loop
+    loop = asyncio.get_running_loop()
+    if _bot_meeting_restore_lock is None or _bot_meeting_restore_loop is not loop:
+        _bot_meeting_restore_lock, _bot_meeting_restore_loop = asyncio.Lock(), loop
+    return _bot_meeting_restore_lock
+
+
+async def _restore_bot_meeting(repo: Any, bot_id: str) -> None:
+    """Recover ``bot_id``'s meeting mapping (and its materials-aware session) from the database.
+
+    Serialized so that a burst of webhooks for the same bot triggers a single lookup.
+    """
+    async with _get_restore_lock():
+        if bot_id in _bot_meeting_map:
+            return
+        try:
+            meeting = await repo.get_meeting_by_bot_id(bot_id, ai_enabled_only=True)
+            if meeting is None:
+                return
+            _bot_meeting_map[bot_id] = meeting["id"]
+            # Recreate meeting-aware session with materials
+            materials = await repo.list_materials(meeting["id"])
+            if materials:
+                session = MeetingConversationSession(bot_id, meeting["id"], settings.bot_display_name)
+                session.build_materials_context_from_list(materials)
+                _conversation_manager._sessions[bot_id] = session
+                logger.info(
+                    "Restored meeting session for bot %s (meeting=%s, %d materials)",
+                    bot_id,
+                    meeting["id"],
+                    len(materials),
+                )
+        except Exception:
+            logger.exception("Failed to restore bot-meeting mapping")
+
+
+async def _iter_sentences(chunks: AsyncIterator[str], received: list[str]) -> AsyncIterator[str]:
+    """Regroup streamed text ``chunks`` into sentences (the unterminated tail last), recording each chunk."""
+    buffer = ""
+    async for chunk in chunks:
+        received.append(chunk)
+        buffer += chunk
+        sentences = _SENTENCE_RE.findall(buffer)
+        if sentences:
+            buffer = buffer[sum(map(len, sentences)) :]
+            for sentence in sentences:
+                yield sentence
+    if buffer:
+        yield buffer
+
+
+async def _stream_avatar_reply(session: Any, speaker: str, text: str) -> AsyncIterator[str]:
+    """Build the persona/knowledge prompt for ``text`` and yield Gemini's reply as it streams in.
+
+    A reply found in the response cache is yielded whole.
+    """
+    # Keyword scoring is CPU-bound; keep it off the event loop shared by every bot. Safe against a
+    # concurrent admin reload: KnowledgeBase swaps in a fully built document set atomically
+    knowledge_context = await asyncio.to_thread(_knowledge_base.get_context, text)
+
+    # Static content first (persona, rules, materials, response instruction), then history, then the
+    # per-turn knowledge and latest utterance, so successive prompts share a long cacheable prefix
+    is_meeting = isinstance(session, MeetingConversationSession)
+    if is_meeting:
+        static_prompt = session.build_meeting_system_prompt(
+            _persona.build_meeting_system_prompt("", session.materials_context)
+        )
+        knowledge_section = _persona.build_meeting_knowledge_section(knowledge_context)
+    else:
+        static_prompt = _persona.build_system_prompt()
+        knowledge_section = _persona.build_knowledge_section(knowledge_context)
+    static_prompt = f"{static_prompt}\n\n{session.response_instruction}"
+
+    conversation_prompt = session.build_conversation_prompt(speaker, text, knowledge_section)
+    full_prompt = f"{static_prompt}\n\n{conversation_prompt}"
+
+    # Identical prompts (same history, same utterance) within the TTL reuse the earlier answer
+    llm_cache = get_llm_cache()
+    key = cache_key(settings.gemini_model, full_prompt, max_output_tokens=150, temperature=0.7)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    gen_config = GenerationConfig(max_output_tokens=150, temperature=0.7)
+    model, prompt = None, full_prompt
+    if settings.gemini_context_cache_enabled and is_meeting:
+        # The static part is fixed for the meeting: send it once as cached content
+        model = await run_in_threadpool(_context_cache.get_model, session.bot_id, static_prompt)
+        if model is not None:
+            prompt = conversation_prompt
+    if model is None:
+        model = get_gemini_model()
+
+    parts: list[str] = []
+    async for chunk in await model.generate_content_async(prompt, generation_config=gen_config, stream=True):
+        try:
+            chunk_text = chunk.text
+        except ValueError:  # chunk without text parts (e.g. a bare finish reason)
+            continue
+        if chunk_text:
+            parts.append(chunk_text)
+            yield chunk_text
+    response_text = "".join(parts).strip()
+    if response_text:
+        llm_cache.set(key, response_text)
+
+
+async def _generate_avatar_reply(session: Any, speaker: str, text: str) -> str:
+    """Return Gemini's complete (possibly cached) reply to ``text``."""
+    return "".join([chunk async for chunk in _stream_avatar_reply(session, speaker, text)]).strip()
+
+
+async def _speak_avatar_reply(bot_id: str, session: Any, speaker: str, text: str, audio_parts: list[bytes]) -> str:
+    """Stream Gemini's reply and synthesize/send it sentence by sentence while it is still generating.
+
+    Sentences are spoken in order by a single consumer task; each one's MP3 is appended to
+    ``audio_parts``. Returns the complete reply text (with any category tag still attached).
+    """
+    sentences: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def _speak() -> None:
+        client = _get_recall_client()
+        while (sentence := await sentences.get()) is not None:
+            mp3_audio = await tts.synthesize_japanese(sentence)
+            audio_parts.append(mp3_audio)
+            await client.send_audio(bot_id, mp3_audio)
+
+    speaker_task = asyncio.create_task(_speak())
+    received: list[str] = []
+    first = True
+    try:
+        async for sentence in _iter_sentences(_stream_avatar_reply(session, speaker, text), received):
+            if first:
+                # A category tag can only lead the reply; it must not be read aloud
+                sentence, _ = MeetingConversationSession.classify_response(sentence.strip())
+                first = False
+            sentence = sentence.strip()
+            if sentence:
+                sentences.put_nowait(sentence)
+    finally:
+        sentences.put_nowait(None)
+        await speaker_task
+    return "".join(received).strip()
+
+
+def _enqueue_transcript(bot_id: str, speaker: str, text: str, app_state: Any) -> None:
+    """Queue an utterance for the bot's response worker, starting the worker on first use.
+
+    The queue is bounded; when it is full the oldest utterance goes unanswered, as a reply to it would be
+    stale. Utterances are logged by the webhook before they are queued, so dropping one loses no record.
+    """
+    queue = _transcript_queues.get(bot_id)
+    worker = _transcript_workers.get(bot_id)
+    if queue is None or worker is None or worker.done():
+        queue = _transcript_queues[bot_id] = asyncio.Queue(maxsize=_TRANSCRIPT_QUEUE_SIZE)
+        _transcript_workers[bot_id] = asyncio.create_task(_transcript_worker(bot_id, queue, app_state))
+    if queue.full():
+        dropped_speaker, _ = queue.get_nowait()
+        logger.warning("Transcript queue full for bot %s, dropping oldest utterance (%s)", bot_id, dropped_speaker)
+    queue.put_nowait((speaker, text))
+
+
+def _stop_transcript_worker(bot_id: str) -> None:
+    """Cancel the bot's response worker and discard its queued utterances."""
+    _transcript_queues.pop(bot_id, None)
+    worker = _transcript_workers.pop(bot_id, None)
+    if worker is not None:
+        worker.cancel()
+
+
+async def shutdown_transcript_workers() -> None:
+    """Cancel every bot's response worker and wait for them to finish (called on app shutdown)."""
+    workers = list(_transcript_workers.values())
+    _transcript_workers.clear()
+    _transcript_queues.clear()
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _log_human_utterance(app_state: Any, bot_id: str, speaker: str, text: str) -> None:
+    """Add a participant utterance to the conversation log, if the bot's meeting is known."""
+    conversation_log = getattr(app_state, "conversation_log", None)
+    meeting_id = _bot_meeting_map.get(bot_id)
+    if conversation_log is not None and meeting_id:
+        conversation_log.add(meeting_id, bot_id, speaker, text, "human")
+
+
+def _coalesce_utterances(batch: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Merge consecutive utterances from the same speaker, keeping their order."""
+    merged: list[tuple[str, str]] = []
+    for speaker, text in batch:
+        if merged and merged[-1][0] == speaker:
+            merged[-1] = (speaker, f"{merged[-1][1]} {text}")
+        else:
+            merged.append((speaker, text))
+    return merged
+
+
+async def _transcript_worker(bot_id: str, queue: asyncio.Queue[tuple[str, str]], app_state: Any) -> None:
+    """Answer the bot's utterances one batch at a time, so a burst never runs overlapping pipelines."""
+    while True:
+        batch = [await queue.get()]
+        if settings.avatar_coalesce_seconds > 0:
+            # Speakers pause mid-thought; wait briefly so the fragments get a single reply
+            await asyncio.sleep(settings.avatar_coalesce_seconds)
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        for speaker, text in _coalesce_utterances(batch):
+            try:
+                await _handle_avatar_response(bot_id, speaker, text, app_state)
+            except Exception:
+                logger.exception("Avatar response failed for bot %s", bot_id)
+
+
 async def _handle_avatar_response(bot_id: str, speaker: str, text: str, app_state: Any = None) -> None:
     """Process transcript through conversation pipeline and send audio response."""
     if _conversation_manager is None or _knowledge_base is None or _persona is None:
@@ -320,44 +618,40 @@ async def _handle_avatar_response(bot_id: str, speaker: str, text: str, app_stat
     session = _conversation_manager.get_or_create(bot_id)
     session.add_utterance(speaker, text)
 
-    # Persist conversation to DB
+    # The utterance itself was logged by the webhook; only the reply is persisted here
     meeting_id = _bot_meeting_map.get(bot_id)
-    repo = getattr(app_state, "repo", None) if app_state else None
-    if repo and meeting_id:
-        try:
-            await repo.add_conversation_entry(meeting_id, bot_id, speaker, text, "human")
-        except Exception:
-            logger.exception("Failed to persist conversation entry")
+    conversation_log = getattr(app_state, "conversation_log", None) if app_state else None
 
     if not session.should_respond(speaker, text):
         return
 
     session.is_responding = True
     try:
-        knowledge_context = _knowledge_base.get_context(text)
-
-        # Use meeting-aware prompt if available
-        from bot.meeting_conversation import MeetingConversationSession
+        # Paraphrases of an earlier utterance reuse its answer (and audio), skipping Gemini and TTS
+        semantic_cache = _get_semantic_cache(bot_id) if settings.semantic_cache_enabled else None
+        embedding: list[float] | None = None
+        cached: tuple[str, bytes | None] | None = None
+        if semantic_cache is not None:
+            from bot.semantic_cache import embed_text
 
-        if isinstance(session, MeetingConversationSession):
-            system_prompt = session.build_meeting_system_prompt(
-                _persona.build_meeting_system_prompt(knowledge_context, session.materials_context)
-            )
+            try:
+                embedding = await run_in_threadpool(embed_text, text)
+                cached = semantic_cache.lookup(embedding)
+            except Exception:
+                logger.warning("Semantic cache lookup failed for bot %s", bot_id, exc_info=True)
+
+        tts_ready = tts.is_available()
+        streamed_audio: list[bytes] = []
+        streamed = False
+        if cached is not None:
+            response_text, cached_audio = cached
+            logger.info("Semantic cache hit for bot %s", bot_id)
+        elif settings.avatar_sentence_streaming and tts_ready:
+            # Speak each sentence as soon as Gemini finishes it instead of after the whole reply
+            response_text = await _speak_avatar_reply(bot_id, session, speaker, text, streamed_audio)
+            cached_audio, streamed = b"".join(streamed_audio) or None, True
         else:
-            system_prompt = _persona.build_system_prompt(knowledge_context)
-
-        conversation_prompt = session.build_conversation_prompt(speaker, text)
-        full_prompt = f"{system_prompt}\n\n{conversation_prompt}"
-
-        from fastapi.concurrency import run_in_threadpool
-        from vertexai.generative_models import GenerationConfig, GenerativeModel
-
-        from config import settings as cfg
-
-        model = GenerativeModel(cfg.gemini_model)
-        gen_config = GenerationConfig(max_output_tokens=150, temperature=0.7)
-        response = await run_in_threadpool(model.generate_content, full_prompt, generation_config=gen_config)
-        response_text = (response.text or "").strip()
+            response_text, cached_audio = await _generate_avatar_reply(session, speaker, text), None
 
         if not response_text:
             logger.warning("Gemini returned empty response for bot %s", bot_id)
@@ -370,23 +664,26 @@ async def _handle_avatar_response(bot_id: str, speaker: str, text: str, app_stat
         logger.info("Bot %s response [%s]: %s", bot_id, category or "none", clean_text[:120])
 
         # Persist bot response to DB
-        if repo and meeting_id:
-            try:
-                await repo.add_conversation_entry(meeting_id, bot_id, session.bot_name, clean_text, "bot", category)
-            except Exception:
-                logger.exception("Failed to persist bot response")
+        if conversation_log is not None and meeting_id:
+            conversation_log.add(meeting_id, bot_id, session.bot_name, clean_text, "bot", category)
 
-        from bot.tts import is_available as tts_available
-        from bot.tts import synthesize_to_base64
+        mp3_audio = cached_audio
+        if mp3_audio is None and not streamed and tts_ready:
+            mp3_audio = await tts.synthesize_japanese(clean_text)
 
-        if not tts_available():
-            logger.warning("TTS not available, skipping audio output")
+        if semantic_cache is not None and embedding is not None and cached is None:
+            semantic_cache.add(embedding, response_text, mp3_audio)
+
+        if streamed:
+            logger.info("Audio response streamed to bot %s (%d sentences)", bot_id, len(streamed_audio))
             return
 
-        b64_audio = await run_in_threadpool(synthesize_to_base64, clean_text)
+        if mp3_audio is None:
+            logger.warning("TTS not available, skipping audio output")
+            return
 
         client = _get_recall_client()
-        await client.send_audio(bot_id, b64_audio)
+        await client.send_audio(bot_id, mp3_audio)
         logger.info("Audio response sent to bot %s", bot_id)
 
     except Exception:
@@ -398,15 +695,15 @@ async def _handle_avatar_response(bot_id: str, speaker: str, text: str, app_stat
 @router.post("/webhook/transcript")
 async def webhook_transcript(request: Request) -> JSONResponse:
     """Receive real-time transcription events from Recall.ai."""
-    body = await request.json()
+    body = await _request_json(request)
     logger.info("Webhook received: event=%s", body.get("event"))
 
     data = body.get("data", {})
     inner = data.get("data", {})
 
-    # Build text from words array
-    words = inner.get("words", [])
-    text = "".join(w.get("text", "") for w in words)
+    # Build text from words array (stripped once here; an all-empty batch skips the join)
+    parts = [w["text"] for w in inner.get("words", []) if w.get("text")]
+    text = "".join(parts).strip() if parts else ""
 
     # Speaker from participant
     participant = inner.get("participant", {})
@@ -415,7 +712,7 @@ async def webhook_transcript(request: Request) -> JSONResponse:
     # Bot ID
     bot_id = data.get("bot", {}).get("id", "")
 
-    if not text.strip():
+    if not text:
         return JSONResponse({"status": "ignored", "reason": "empty transcript"})
 
     logger.info("Transcript from %s: %s", speaker, text[:120])
@@ -423,14 +720,7 @@ async def webhook_transcript(request: Request) -> JSONResponse:
     if bot_id:
         # When Gemini Live session is active, persist transcript only — audio goes direct
         if _live_manager is not None and _live_manager.has_session(bot_id):
-            repo = getattr(request.app.state, "repo", None)
-            meeting_id = _bot_meeting_map.get(bot_id)
-            if repo and meeting_id:
-                try:
-                    await repo.add_conversation_entry(meeting_id, bot_id, speaker, text.strip(), "human")
-                except Exception:
-                    logger.exception("Failed to persist transcript during live session")
-
+            _log_human_utterance(request.app.state, bot_id, speaker, text)
             return JSONResponse(
                 {
                     "status": "received_live",
@@ -444,30 +734,11 @@ async def webhook_transcript(request: Request) -> JSONResponse:
             if bot_id not in _bot_meeting_map:
                 repo = getattr(request.app.state, "repo", None)
                 if repo:
-                    try:
-                        meetings = await repo.list_meetings(ai_enabled_only=True)
-                        for m in meetings:
-                            if m.get("bot_id") == bot_id:
-                                _bot_meeting_map[bot_id] = m["id"]
-                                # Recreate meeting-aware session with materials
-                                from bot.meeting_conversation import MeetingConversationSession
-
-                                materials = await repo.list_materials(m["id"])
-                                if materials:
-                                    session = MeetingConversationSession(bot_id, m["id"], settings.bot_display_name)
-                                    session.build_materials_context_from_list(materials)
-                                    _conversation_manager._sessions[bot_id] = session
-                                    logger.info(
-                                        "Restored meeting session for bot %s (meeting=%s, %d materials)",
-                                        bot_id,
-                                        m["id"],
-                                        len(materials),
-                                    )
-                                break
-                    except Exception:
-                        logger.exception("Failed to restore bot-meeting mapping")
-
-            asyncio.create_task(_handle_avatar_response(bot_id, speaker, text.strip(), request.app.state))
+                    await _restore_bot_meeting(repo, bot_id)
+
+            # Log every utterance as spoken, before the reply queue may drop or coalesce it
+            _log_human_utterance(request.app.state, bot_id, speaker, text)
+            _enqueue_transcript(bot_id, speaker, text, request.app.state)
 
     return JSONResponse(
         {
@@ -490,8 +761,6 @@ async def _build_live_system_instruction(request: Request, meeting_id: str | Non
             try:
                 materials = await repo.list_materials(meeting_id)
                 if materials:
-                    from bot.meeting_conversation import MeetingConversationSession
-
                     temp_session = MeetingConversationSession(bot_id="temp", meeting_id=meeting_id, bot_name=bot_name)
                     materials_context = temp_session.build_materials_context_from_list(materials)
             except Exception:
@@ -0,0 +1,86 @@
+"""Embedding-similarity response cache for paraphrased utterances."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from config import settings
+
+logger = logging.getLogger("meeting-proxy.semantic-cache")
+
+
+@lru_cache(maxsize=2)
+def _embedding_model(model_name: str) -> Any:
+    """Load (once per model name) the Vertex AI text embedding model."""
+    from vertexai.language_models import TextEmbeddingModel
+
+    return TextEmbeddingModel.from_pretrained(model_name)
+
+
+def embed_text(text: str) -> list[float]:
+    """Embed ``text`` with the configured embedding model (blocking; run in a thread)."""
+    embedding = _embedding_model(settings.semantic_cache_embedding_model).get_embeddings([text])[0]
+    return list(embedding.values)
+
+
+class SemanticCache:
+    """Reuses a previous response when a new utterance embeds close to an earlier one.
+
+    Embeddings are stored unit-normalized as FP16 rows of a fixed-size ring
+    buffer, so a lookup is one matrix-vector product and the oldest entry is
+    overwritten (FIFO) once the buffer is full.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 2048) -> None:
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._matrix: np.ndarray | None = None  # (max_entries, dim), allocated on first add
+        self._entries: list[tuple[str, bytes | None]] = []  # (response_text, mp3_audio), row-aligned
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
+
+    def lookup(self, embedding: Sequence[float]) -> tuple[str, bytes | None] | None:
+        """Return the cached ``(response_text, mp3_audio)`` most similar to ``embedding`` above the threshold."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if vector is None or self._matrix is None or not self._entries or vector.shape[0] != self._matrix.shape[1]:
+                return None
+            scores = self._matrix[: len(self._entries)] @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self._threshold:
+                return None
+            return self._entries[best]
+
+    def add(self, embedding: Sequence[float], response_text: str, mp3_audio: bytes | None) -> None:
+        """Store a response (and its synthesized audio, if any) under ``embedding``."""
+        vector = self._normalize(embedding)
+        if vector is None or self._max_entries <= 0:
+            return
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                self._matrix = np.zeros((self._max_entries, vector.shape[0]), dtype=np.float16)
+                self._entries.clear()
+                self._next = 0
+            self._matrix[self._next] = vector
+            if self._next < len(self._entries):
+                self._entries[self._next] = (response_text, mp3_audio)
+            else:
+                self._entries.append((response_text, mp3_audio))
+            self._next = (self._next + 1) % self._max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
 import logging
+from collections import OrderedDict
 
 from google.cloud import texttospeech
 
@@ -11,49 +12,68 @@ from config import settings
 
 logger = logging.getLogger("meeting-proxy.tts")
 
-_tts_client: texttospeech.TextToSpeechClient | None = None
+_tts_client: texttospeech.TextToSpeechAsyncClient | None = None
+
+# ~256 short replies of MP3 (tens of KB each) stays within a few MB
+_SYNTH_CACHE_SIZE = 256
+# (text, voice, speaking rate) -> MP3, least recently used first; only touched from the event loop
+_synth_cache: OrderedDict[tuple[str, str, float], bytes] = OrderedDict()
 
 
 def init_tts_client() -> None:
-    """Initialize the TTS client. Called at startup."""
+    """Initialize the TTS client. Called at startup, from within the running event loop."""
     global _tts_client
     try:
-        _tts_client = texttospeech.TextToSpeechClient()
+        _tts_client = texttospeech.TextToSpeechAsyncClient()
+        _synth_cache.clear()
         logger.info("Cloud TTS client initialized")
     except Exception:
         logger.exception("Failed to initialize Cloud TTS client")
         _tts_client = None
 
 
-def synthesize_japanese(text: str) -> bytes:
-    """Synthesize Japanese text to MP3 audio bytes."""
+async def synthesize_japanese(text: str) -> bytes:
+    """Synthesize Japanese text to MP3 audio bytes.
+
+    Results are cached by ``(text, voice, speaking rate)``: greetings and
+    stock replies recur, and synthesis is deterministic for the same input.
+    """
     if _tts_client is None:
         raise RuntimeError("Cloud TTS client is not initialized")
+    key = (text, settings.tts_voice_name, settings.tts_speaking_rate)
+    audio = _synth_cache.get(key)
+    if audio is not None:
+        _synth_cache.move_to_end(key)
+        return audio
 
     synthesis_input = texttospeech.SynthesisInput(text=text)
     voice = texttospeech.VoiceSelectionParams(
         language_code="ja-JP",
-        name=settings.tts_voice_name,
+        name=key[1],
     )
     audio_config = texttospeech.AudioConfig(
         audio_encoding=texttospeech.AudioEncoding.MP3,
-        speaking_rate=settings.tts_speaking_rate,
+        speaking_rate=key[2],
     )
 
-    response = _tts_client.synthesize_speech(
+    response = await _tts_client.synthesize_speech(
         input=synthesis_input,
         voice=voice,
         audio_config=audio_config,
     )
 
-    logger.info("Synthesized %d bytes of audio for %d chars", len(response.audio_content), len(text))
-    return response.audio_content
+    audio = response.audio_content
+    logger.info("Synthesized %d bytes of audio for %d chars", len(audio), len(text))
+    _synth_cache[key] = audio
+    if len(_synth_cache) > _SYNTH_CACHE_SIZE:
+        _synth_cache.popitem(last=False)
+    return audio
 
 
-def synthesize_to_base64(text: str) -> str:
+async def synthesize_to_base64(text: str) -> str:
     """Synthesize Japanese text and return base64-encoded MP3 (for Recall.ai)."""
-    audio_bytes = synthesize_japanese(text)
-    return base64.b64encode(audio_bytes).decode("ascii")
+    audio_bytes = await synthesize_japanese(text)
+    return binascii.b2a_base64(audio_bytes, newline=False).decode("ascii")
 
 
 def is_available() -> bool:
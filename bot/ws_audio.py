@@ -7,14 +7,20 @@ import contextlib
 import json
 import logging
 import re
+from collections import Counter
 from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from bot.audio_utils import decode_b64_pcm, pcm_to_mp3_b64
+from bot.audio_utils import decode_b64_pcm, pcm_to_mp3
 from bot.meeting_conversation import MeetingConversationSession
 from config import settings
 
+try:  # Faster JSON parsing of audio frames (orjson, in requirements.txt); stdlib json if missing
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("meeting-proxy.ws-audio")
 
 router = APIRouter(tags=["bot"])
@@ -22,6 +28,16 @@ router = APIRouter(tags=["bot"])
 # Module-level reference set by main.py during startup
 _live_manager: Any = None
 
+# Turns waiting to be encoded and sent per bot; beyond this the oldest turn's audio is dropped, since a
+# stalled output_audio call would otherwise let whole PCM turns pile up in memory. Its text is kept:
+# turn text is persisted before the audio is queued
+_PENDING_SENDS_MAX = 4
+_dropped_turns: Counter[str] = Counter()
+
+# Received frames buffered ahead of processing (~several seconds of audio); when full the reader
+# waits, so a stuck consumer still pushes back on Recall.ai instead of growing memory
+_FRAME_BUFFER_MAX = 256
+
 
 def set_live_manager(manager: Any) -> None:
     """Set the module-level GeminiLiveManager reference."""
@@ -50,13 +66,29 @@ async def ws_audio_bridge(websocket: WebSocket) -> None:
     sender_task: asyncio.Task[None] | None = None
     original_on_turn_complete: Any = None
     audio_chunk_count = 0
+    # Read on a separate task so frames keep arriving while a Gemini send is awaited;
+    # frames already buffered are then processed back to back without waiting on the socket
+    frames: asyncio.Queue[str | bytes | Exception] = asyncio.Queue(maxsize=_FRAME_BUFFER_MAX)
+    reader_task = asyncio.create_task(_read_frames(websocket, frames))
 
     try:
         while True:
-            raw_message = await websocket.receive_text()
+            raw_message = await frames.get()
+            if isinstance(raw_message, Exception):
+                raise raw_message
+            if isinstance(raw_message, bytes):
+                # Binary frame: raw PCM for the bot identified by an earlier JSON frame,
+                # forwarded without the JSON/base64 wrapper
+                if session is None:
+                    logger.debug("Binary frame before bot identification, skipping (%d bytes)", len(raw_message))
+                    continue
+                audio_chunk_count += 1
+                _log_audio_stats(bot_id, audio_chunk_count, len(raw_message))
+                await session.send_audio(raw_message)
+                continue
             try:
-                message = json.loads(raw_message)
-            except json.JSONDecodeError:
+                message = orjson.loads(raw_message) if orjson is not None else json.loads(raw_message)
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
                 logger.warning("Invalid JSON from WebSocket")
                 continue
 
@@ -75,25 +107,34 @@ async def ws_audio_bridge(websocket: WebSocket) -> None:
                         return
                     logger.info("WebSocket identified bot %s, starting audio bridge", bot_id)
                     # Start the sender task now that we have a session
-                    pending_sends: asyncio.Queue[tuple[bytes, str]] = asyncio.Queue()
+                    pending_sends: asyncio.Queue[tuple[bytes, str]] = asyncio.Queue(maxsize=_PENDING_SENDS_MAX)
                     original_on_turn_complete = session._on_turn_complete
                     _queue = pending_sends  # bind for closure
+                    _bot_id = bot_id
 
                     async def _on_turn_complete_wrapper(
                         audio_data: bytes,
                         text_data: str,
                         q: asyncio.Queue = _queue,  # type: ignore[type-arg]
+                        bid: str = _bot_id,
+                        app: Any = websocket.app,
                     ) -> None:
-                        await q.put((audio_data, text_data))
+                        # Record the reply first, so a dropped or unsent audio turn never loses its text
+                        if text_data:
+                            try:
+                                await _persist_bot_response(bid, text_data, app)
+                            except Exception:
+                                logger.exception("Failed to persist bot response (bot=%s)", bid)
+                        _put_dropping_oldest(q, (audio_data, text_data), bid)
 
                     session._on_turn_complete = _on_turn_complete_wrapper
-                    sender_task = asyncio.create_task(_send_audio_responses(bot_id, pending_sends, websocket.app))
+                    sender_task = asyncio.create_task(_send_audio_responses(bot_id, pending_sends))
                 else:
                     logger.debug("Message without bot_id, skipping")
                     continue
 
             event = message.get("event")
-            if session is None:
+            if session is None and logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Pre-session message: event=%s keys=%s", event, list(message.get("data", {}).keys()))
 
             if event == "audio_mixed_raw.data":
@@ -116,18 +157,7 @@ async def ws_audio_bridge(websocket: WebSocket) -> None:
                         )
                         continue
                     audio_chunk_count += 1
-                    if audio_chunk_count == 1:
-                        logger.info(
-                            "First audio chunk from Recall.ai (bot=%s, %d bytes PCM)",
-                            bot_id,
-                            len(pcm_bytes),
-                        )
-                    elif audio_chunk_count % 100 == 0:
-                        logger.info(
-                            "Audio bridge stats (bot=%s): %d chunks forwarded to Gemini",
-                            bot_id,
-                            audio_chunk_count,
-                        )
+                    _log_audio_stats(bot_id, audio_chunk_count, len(pcm_bytes))
                     await session.send_audio(pcm_bytes)
 
             elif event in ("participant_events.speech_on", "participant_events.speech_off"):
@@ -146,18 +176,64 @@ async def ws_audio_bridge(websocket: WebSocket) -> None:
     except Exception:
         logger.exception("WebSocket error for bot %s", bot_id)
     finally:
+        reader_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reader_task
         if session is not None and sender_task is not None:
             sender_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await sender_task
-            if original_on_turn_complete is not None:
-                session._on_turn_complete = original_on_turn_complete
+            session._on_turn_complete = original_on_turn_complete
+        _dropped_turns.pop(bot_id, None)
+        if session is not None:
+            # Don't strand the tail of the stream in the send coalescing buffer. Last, and guarded,
+            # because the Gemini socket may already be closed
+            try:
+                await session.flush_audio()
+            except Exception:
+                logger.warning("Failed to flush buffered audio to Gemini (bot=%s)", bot_id, exc_info=True)
         logger.info("WebSocket cleanup complete for bot %s", bot_id)
 
 
-async def _send_audio_responses(bot_id: str, pending_sends: asyncio.Queue[tuple[bytes, str]], app: Any) -> None:
-    """Process queued turn-complete events and send audio to Recall.ai."""
-    from bot.recall_client import RecallClient
+async def _read_frames(websocket: WebSocket, frames: asyncio.Queue[str | bytes | Exception]) -> None:
+    """Receive text and binary frames into ``frames``; a disconnect or receive error is queued for the consumer."""
+    while True:
+        try:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+        except Exception as exc:
+            await frames.put(exc)
+            return
+        payload = message.get("bytes")
+        await frames.put(payload if payload is not None else message.get("text", ""))
+
+
+def _log_audio_stats(bot_id: str | None, audio_chunk_count: int, pcm_len: int) -> None:
+    """Log the first forwarded chunk and then every hundredth."""
+    if audio_chunk_count == 1:
+        logger.info("First audio chunk from Recall.ai (bot=%s, %d bytes PCM)", bot_id, pcm_len)
+    elif audio_chunk_count % 100 == 0:
+        logger.info("Audio bridge stats (bot=%s): %d chunks forwarded to Gemini", bot_id, audio_chunk_count)
+
+
+def _put_dropping_oldest(queue: asyncio.Queue[tuple[bytes, str]], turn: tuple[bytes, str], bot_id: str) -> None:
+    """Queue a completed turn's audio, discarding the oldest queued one if the sender has fallen behind."""
+    if queue.full():
+        dropped_audio, _ = queue.get_nowait()
+        _dropped_turns[bot_id] += 1
+        logger.warning(
+            "Audio send backlog full for bot %s, dropped oldest turn's audio (%d bytes PCM, %d dropped so far)",
+            bot_id,
+            len(dropped_audio),
+            _dropped_turns[bot_id],
+        )
+    queue.put_nowait(turn)
+
+
+async def _send_audio_responses(bot_id: str, pending_sends: asyncio.Queue[tuple[bytes, str]]) -> None:
+    """Process queued turn-complete events and send audio to Recall.ai (turn text is already persisted)."""
+    from bot.recall_client import get_recall_client
 
     while True:
         try:
@@ -182,9 +258,9 @@ async def _send_audio_responses(bot_id: str, pending_sends: asyncio.Queue[tuple[
                 # back into Gemini before output_audio API call completes.
                 session.set_mute_duration(0.5)
 
-            b64_mp3 = pcm_to_mp3_b64(audio_data, sample_rate=settings.gemini_live_output_sample_rate)
-            client = RecallClient()
-            await client.send_audio(bot_id, b64_mp3)
+            mp3 = await asyncio.to_thread(pcm_to_mp3, audio_data, settings.gemini_live_output_sample_rate)
+            client = get_recall_client()
+            await client.send_audio(bot_id, mp3)
 
             if session is not None:
                 session.set_mute_duration(mute_seconds)
@@ -199,12 +275,6 @@ async def _send_audio_responses(bot_id: str, pending_sends: asyncio.Queue[tuple[
         except Exception:
             logger.exception("Failed to send audio response to Recall.ai (bot=%s)", bot_id)
 
-        if text_data:
-            try:
-                await _persist_bot_response(bot_id, text_data, app)
-            except Exception:
-                logger.exception("Failed to persist bot response (bot=%s)", bot_id)
-
 
 _TAKEN_BACK_PATTERN = re.compile(r"持ち帰|確認して|検討し|後日|本人に確認")
 
@@ -238,9 +308,9 @@ async def _persist_bot_response(bot_id: str, text: str, app: Any) -> None:
         category = _classify_by_content(clean_text)
 
     meeting_id = _bot_meeting_map.get(bot_id)
-    repo = getattr(getattr(app, "state", None), "repo", None)
-    if not repo or not meeting_id:
+    conversation_log = getattr(getattr(app, "state", None), "conversation_log", None)
+    if conversation_log is None or not meeting_id:
         return
 
-    await repo.add_conversation_entry(meeting_id, bot_id, settings.bot_display_name, clean_text, "bot", category)
+    conversation_log.add(meeting_id, bot_id, settings.bot_display_name, clean_text, "bot", category)
     logger.info("Live bot response persisted [%s]: %s", category or "none", clean_text[:120])
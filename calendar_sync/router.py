@@ -26,7 +26,7 @@ async def _get_credentials(request: Request) -> Any:
         raise HTTPException(status_code=401, detail="Google account not linked. Visit /auth/google/login")
 
     creds = credentials_from_token_row(token_row)
-    refreshed, creds = refresh_if_needed(creds)
+    refreshed, creds = await refresh_if_needed(creds)
     if refreshed:
         await repo.update_token("default", creds.token, token_expiry_iso(creds))
     return creds
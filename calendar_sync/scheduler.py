@@ -139,13 +139,13 @@ async def _join_meeting_local(repo: Any, meeting: dict[str, Any]) -> None:
 async def _join_meeting_recall(repo: Any, meeting: dict[str, Any]) -> None:
     """Join meeting using Recall.ai (existing behavior)."""
     try:
-        from bot.recall_client import RecallClient
+        from bot.recall_client import get_recall_client
 
         if not settings.recall_api_key:
             logger.warning("Recall.ai not configured, cannot auto-join")
             return
 
-        client = RecallClient()
+        client = get_recall_client()
         bot_name = settings.bot_display_name
         result = await client.create_bot_with_audio(meeting["meeting_url"], bot_name)
         bot_id = result.get("id", "")
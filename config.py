@@ -35,6 +35,16 @@ class Settings(BaseSettings):
     response_triggers: str = Field(default="", alias="RESPONSE_TRIGGERS")
     silence_timeout_seconds: int = Field(default=3, alias="SILENCE_TIMEOUT_SECONDS")
     max_conversation_history: int = Field(default=20, alias="MAX_CONVERSATION_HISTORY")
+    avatar_coalesce_seconds: float = Field(default=0.8, alias="AVATAR_COALESCE_SECONDS")  # 0 answers at once
+    avatar_sentence_streaming: bool = Field(default=False, alias="AVATAR_SENTENCE_STREAMING")
+    llm_cache_max_entries: int = Field(default=512, alias="LLM_CACHE_MAX_ENTRIES")  # 0 disables the cache
+    llm_cache_ttl_seconds: float = Field(default=300.0, alias="LLM_CACHE_TTL_SECONDS")
+    semantic_cache_enabled: bool = Field(default=False, alias="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(default=0.92, alias="SEMANTIC_CACHE_THRESHOLD")
+    semantic_cache_max_entries: int = Field(default=2048, alias="SEMANTIC_CACHE_MAX_ENTRIES")
+    semantic_cache_embedding_model: str = Field(default="text-embedding-004", alias="SEMANTIC_CACHE_EMBEDDING_MODEL")
+    gemini_context_cache_enabled: bool = Field(default=False, alias="GEMINI_CONTEXT_CACHE_ENABLED")
+    gemini_context_cache_ttl_seconds: int = Field(default=600, alias="GEMINI_CONTEXT_CACHE_TTL_SECONDS")
 
     # Google OAuth2 settings
     google_client_id: str = Field(default="", alias="GOOGLE_CLIENT_ID")
@@ -56,6 +66,10 @@ class Settings(BaseSettings):
     blackhole_playback_device: str = Field(default="BlackHole 16ch", alias="BLACKHOLE_PLAYBACK_DEVICE")
     local_audio_sample_rate: int = Field(default=16000, alias="LOCAL_AUDIO_SAMPLE_RATE")
     local_audio_chunk_ms: int = Field(default=100, alias="LOCAL_AUDIO_CHUNK_MS")
+    playwright_browsers_path: str = Field(default="", alias="PLAYWRIGHT_BROWSERS_PATH")
+    browser_headless: bool = Field(default=False, alias="BROWSER_HEADLESS")
+    browser_goto_timeout_ms: int = Field(default=10_000, alias="BROWSER_GOTO_TIMEOUT_MS")
+    browser_admission_timeout_ms: int = Field(default=20_000, alias="BROWSER_ADMISSION_TIMEOUT_MS")
 
     # Gemini Live API
     gemini_live_enabled: bool = Field(default=False, alias="GEMINI_LIVE_ENABLED")
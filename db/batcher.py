@@ -0,0 +1,81 @@
+"""Buffered, batched writes to the conversation log."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timezone
+
+from db.repository import ConversationRow, Repository
+
+logger = logging.getLogger("meeting-proxy.db")
+
+
+def _sqlite_now() -> str:
+    """Current UTC time in the format of SQLite's datetime('now')."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ConversationLogBatcher:
+    """Buffers conversation_log rows and writes them in batches.
+
+    Pending rows are written every ``flush_interval`` seconds, or as soon as
+    ``max_batch`` are waiting, in one transaction. Each row keeps the time it
+    was added, so batching does not shift timestamps. Write failures are
+    logged and the batch is dropped, as with a single failed insert.
+    """
+
+    def __init__(self, repo: Repository, flush_interval: float = 0.5, max_batch: int = 32) -> None:
+        self._repo = repo
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._pending: list[ConversationRow] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()  # batches commit in the order they were taken
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+    def add(
+        self,
+        meeting_id: str,
+        bot_id: str,
+        speaker: str,
+        text: str,
+        utterance_type: str = "human",
+        response_category: str | None = None,
+    ) -> None:
+        """Queue one entry; it is written with the next batch."""
+        self._pending.append((meeting_id, bot_id, speaker, text, utterance_type, response_category, _sqlite_now()))
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+        if len(self._pending) >= self._max_batch:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write every pending entry now."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            try:
+                await self._repo.add_conversation_entries(rows)
+            except Exception:
+                logger.exception("Failed to persist %d conversation entries", len(rows))
+
+    async def close(self) -> None:
+        """Stop the background writer and flush what is left (called on shutdown)."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            self._wakeup.clear()
+            await self.flush()
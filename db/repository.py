@@ -6,12 +6,15 @@ import contextlib
 import json
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 import aiosqlite
 
 logger = logging.getLogger("meeting-proxy.db")
 
+# (meeting_id, bot_id, speaker, text, utterance_type, response_category, timestamp)
+ConversationRow = tuple[str, str, str, str, str, Optional[str], str]
+
 
 class Repository:
     """Thin CRUD wrapper around an aiosqlite connection."""
@@ -94,6 +97,15 @@ class Repository:
         row = await cursor.fetchone()
         return dict(row) if row else None
 
+    async def get_meeting_by_bot_id(self, bot_id: str, ai_enabled_only: bool = False) -> dict[str, Any] | None:
+        """Return the most recently updated meeting assigned to ``bot_id`` (indexed lookup)."""
+        sql = "SELECT * FROM meetings WHERE bot_id = ?"
+        if ai_enabled_only:
+            sql += " AND ai_enabled = 1"
+        cursor = await self._db.execute(sql + " ORDER BY updated_at DESC LIMIT 1", (bot_id,))
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
     async def list_meetings(
         self,
         from_time: str | None = None,
@@ -193,9 +205,20 @@ class Repository:
         await self._db.commit()
         return cursor.lastrowid or 0
 
+    async def add_conversation_entries(self, rows: list[ConversationRow]) -> None:
+        """Insert several conversation entries (with explicit timestamps) in one transaction."""
+        await self._db.executemany(
+            """INSERT INTO conversation_log
+               (meeting_id, bot_id, speaker, text, utterance_type, response_category, timestamp)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        await self._db.commit()
+
     async def get_conversation_log(self, meeting_id: str) -> list[dict[str, Any]]:
+        # id breaks ties between entries logged within the same second
         cursor = await self._db.execute(
-            "SELECT * FROM conversation_log WHERE meeting_id = ? ORDER BY timestamp ASC",
+            "SELECT * FROM conversation_log WHERE meeting_id = ? ORDER BY timestamp ASC, id ASC",
             (meeting_id,),
         )
         rows = await cursor.fetchall()
@@ -8,6 +8,12 @@ logger = logging.getLogger("meeting-proxy.db")
 
 SCHEMA_VERSION = 1
 
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+)
+
 _TABLES_SQL = """
 CREATE TABLE IF NOT EXISTS schema_version (
     version INTEGER PRIMARY KEY
@@ -83,6 +89,7 @@ CREATE INDEX IF NOT EXISTS idx_materials_meeting ON materials(meeting_id);
 CREATE INDEX IF NOT EXISTS idx_conversation_meeting ON conversation_log(meeting_id);
 CREATE INDEX IF NOT EXISTS idx_minutes_meeting ON minutes(meeting_id);
 CREATE INDEX IF NOT EXISTS idx_meetings_start ON meetings(start_time);
+CREATE INDEX IF NOT EXISTS idx_meetings_bot ON meetings(bot_id);
 """
 
 
@@ -90,6 +97,9 @@ async def init_db(db_path: str) -> aiosqlite.Connection:
     """Open the database, create tables if needed, and return the connection."""
     db = await aiosqlite.connect(db_path)
     db.row_factory = aiosqlite.Row
+    # WAL + synchronous=NORMAL: commits append to the log without an fsync each; 64 MB page cache
+    for pragma in _CONNECTION_PRAGMAS:
+        await db.execute(pragma)
     await db.executescript(_TABLES_SQL)
 
     cursor = await db.execute("SELECT MAX(version) as v FROM schema_version")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hmac
 import json
 import logging
 import os
@@ -13,6 +12,7 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 import google.auth
+import httpx
 import vertexai
 from fastapi import Depends, FastAPI, File, Form, Header, HTTPException, Request, UploadFile
 from fastapi.concurrency import run_in_threadpool
@@ -24,7 +24,9 @@ from google.cloud import speech
 from vertexai.generative_models import GenerativeModel
 
 from auth.router import router as auth_router
+from bot.admin_router import require_api_key
 from bot.admin_router import router as admin_router
+from bot.llm_cache import get_llm_cache
 from bot.router import router as bot_router
 from calendar_sync.router import router as calendar_router
 from config import settings
@@ -64,6 +66,7 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
 
     # Initialize database
     try:
+        from db.batcher import ConversationLogBatcher
         from db.repository import Repository
         from db.schema import init_db
 
@@ -71,11 +74,20 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
         db = await init_db(settings.db_path)
         app.state.db = db
         app.state.repo = Repository(db)
+        # Transcripts and replies are logged in batches rather than one transaction per utterance
+        app.state.conversation_log = ConversationLogBatcher(app.state.repo)
         logger.info("Database initialized")
     except Exception:
         logger.exception("Failed to initialize database")
         app.state.db = None
         app.state.repo = None
+        app.state.conversation_log = None
+
+    # Shared HTTP client (keeps connections to Google endpoints alive across requests)
+    app.state.http_client = httpx.AsyncClient(
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
 
     # Initialize GCP credentials
     try:
@@ -153,6 +165,17 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
         except Exception:
             logger.exception("Failed to initialize local browser client")
 
+    # Build the pooled Recall.ai client up front so the first /join does not pay for it; handlers
+    # share it through bot.recall_client.get_recall_client(), and close_recall_client() releases it
+    if settings.meeting_mode != "local" and settings.recall_api_key:
+        try:
+            from bot.recall_client import get_recall_client
+
+            get_recall_client()
+            logger.info("Recall.ai client initialized")
+        except Exception:
+            logger.exception("Failed to initialize Recall.ai client")
+
     # Start meeting scheduler
     if app.state.repo:
         try:
@@ -162,6 +185,13 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
         except Exception:
             logger.exception("Failed to start meeting scheduler")
 
+        try:
+            from auth.google_oauth import start_token_refresher
+
+            start_token_refresher(app.state.repo)
+        except Exception:
+            logger.exception("Failed to start OAuth token refresher")
+
     yield
 
     # Shutdown
@@ -179,9 +209,27 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
         except Exception:
             logger.exception("Error shutting down Gemini Live Manager")
 
+    from bot.recall_client import close_recall_client
+
+    try:
+        await close_recall_client()
+    except Exception:
+        logger.exception("Error closing Recall.ai client")
+
+    from bot.router import shutdown_transcript_workers
+
+    await shutdown_transcript_workers()
+
+    from auth.google_oauth import stop_token_refresher
     from calendar_sync.scheduler import stop_scheduler
 
     stop_scheduler()
+    stop_token_refresher()
+
+    await app.state.http_client.aclose()
+
+    if app.state.conversation_log is not None:
+        await app.state.conversation_log.close()
 
     if app.state.db:
         await app.state.db.close()
@@ -357,10 +405,7 @@ async def _read_upload_limited(audio_file: UploadFile) -> bytes:
 
 
 def _auth_guard(x_api_key: str | None = Header(default=None, alias="X-API-Key")) -> None:
-    if not settings.api_key:
-        return
-    if not x_api_key or not hmac.compare_digest(x_api_key, settings.api_key):
-        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+    require_api_key(x_api_key)
 
 
 @app.middleware("http")
@@ -426,6 +471,7 @@ def metrics_snapshot(_: None = Depends(_auth_guard)) -> JSONResponse:
             "average_latency_ms": round(avg_latency_ms, 2),
             "path_count": dict(metrics["path_count"]),
         }
+    data["llm_cache"] = get_llm_cache().stats()
     return JSONResponse(data)
 
 
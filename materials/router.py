@@ -119,7 +119,7 @@ async def link_drive_material(request: Request, meeting_id: str) -> JSONResponse
         raise HTTPException(status_code=401, detail="Google account not linked")
 
     creds = credentials_from_token_row(token_row)
-    refreshed, creds = refresh_if_needed(creds)
+    refreshed, creds = await refresh_if_needed(creds)
     if refreshed:
         await repo.update_token("default", creds.token, token_expiry_iso(creds))
 
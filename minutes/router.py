@@ -102,7 +102,7 @@ async def export_to_google_docs(request: Request, meeting_id: str) -> JSONRespon
         raise HTTPException(status_code=401, detail="Google account not linked")
 
     creds = credentials_from_token_row(token_row)
-    refreshed, creds = refresh_if_needed(creds)
+    refreshed, creds = await refresh_if_needed(creds)
     if refreshed:
         await repo.update_token("default", creds.token, token_expiry_iso(creds))
 
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
@@ -50,6 +51,15 @@ def test_admin_auth_passes_with_key() -> None:
         assert resp.status_code == 200
 
 
+def test_admin_auth_rejects_non_ascii_key() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        _set_admin_test_settings(tmp)
+        settings.api_key = "test-secret-key"
+        client = TestClient(app)
+        resp = client.get("/admin/status", headers={"X-API-Key": "鍵".encode()})
+        assert resp.status_code == 401
+
+
 # --- Profile ---
 
 
@@ -141,6 +151,29 @@ def test_tts_preview_unavailable() -> None:
         assert resp.status_code == 503
 
 
+def test_tts_preview_reuses_cached_audio() -> None:
+    from bot import tts
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _set_admin_test_settings(tmp)
+        settings.tts_voice_name = "ja-JP-Neural2-B"
+        settings.tts_speaking_rate = 1.0
+        tts._synth_cache.clear()
+        mock_client = MagicMock()
+        mock_client.synthesize_speech = AsyncMock(return_value=MagicMock(audio_content=b"mp3-bytes"))
+        with patch.object(tts, "_tts_client", mock_client):
+            client = TestClient(app)
+            first = client.post("/admin/tts/preview", json={"text": "こんにちは"})
+            second = client.post("/admin/tts/preview", json={"text": "こんにちは"})
+            settings.tts_speaking_rate = 1.2
+            third = client.post("/admin/tts/preview", json={"text": "こんにちは"})
+
+        assert first.content == second.content == third.content == b"mp3-bytes"
+        assert mock_client.synthesize_speech.await_count == 2
+        settings.tts_speaking_rate = 1.0
+        tts._synth_cache.clear()
+
+
 # --- Knowledge ---
 
 
@@ -153,6 +186,23 @@ def test_list_knowledge_empty() -> None:
         assert resp.json()["documents"] == []
 
 
+def test_list_knowledge_sorted_and_filtered() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        _set_admin_test_settings(tmp)
+        docs_dir = os.path.join(tmp, "docs")
+        for name, body in [("b.txt", "bb"), ("a.md", "a"), ("image.png", "x"), ("C.MD", "ccc")]:
+            with open(os.path.join(docs_dir, name), "w", encoding="utf-8") as f:
+                f.write(body)
+        os.makedirs(os.path.join(docs_dir, "sub.md"))
+        client = TestClient(app)
+        resp = client.get("/admin/knowledge")
+        assert resp.json()["documents"] == [
+            {"filename": "C.MD", "size": 3},
+            {"filename": "a.md", "size": 1},
+            {"filename": "b.txt", "size": 2},
+        ]
+
+
 def test_knowledge_crud() -> None:
     with tempfile.TemporaryDirectory() as tmp:
         _set_admin_test_settings(tmp)
@@ -190,6 +240,35 @@ def test_knowledge_crud() -> None:
         assert resp.json()["documents"] == []
 
 
+def test_knowledge_get_honours_etag() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        _set_admin_test_settings(tmp)
+        client = TestClient(app)
+        client.put("/admin/knowledge/cached.md", json={"content": "v1"})
+
+        resp = client.get("/admin/knowledge/cached.md")
+        etag = resp.headers["etag"]
+        resp = client.get("/admin/knowledge/cached.md", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+        client.put("/admin/knowledge/cached.md", json={"content": "version 2"})
+        resp = client.get("/admin/knowledge/cached.md", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["content"] == "version 2"
+
+
+def test_get_profile_honours_etag() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        _set_admin_test_settings(tmp)
+        client = TestClient(app)
+        client.put("/admin/profile", json={"content": "# Profile"})
+
+        etag = client.get("/admin/profile").headers["etag"]
+        resp = client.get("/admin/profile", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+
 def test_knowledge_get_not_found() -> None:
     with tempfile.TemporaryDirectory() as tmp:
         _set_admin_test_settings(tmp)
@@ -241,3 +320,17 @@ def test_filename_traversal_slash() -> None:
         # Encoded slashes are decoded by Starlette as path segments → 404
         resp = client.put("/admin/knowledge/sub%2Fpath.md", json={"content": "x"})
         assert resp.status_code in (400, 404, 422)
+
+
+def test_filename_traversal_symlink_to_sibling_prefix() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        _set_admin_test_settings(tmp)
+        # "docs_private" shares the "docs" prefix, which a string-prefix check would accept
+        private_dir = os.path.join(tmp, "docs_private")
+        os.makedirs(private_dir)
+        with open(os.path.join(private_dir, "leak.md"), "w", encoding="utf-8") as f:
+            f.write("secret")
+        os.symlink(os.path.join(private_dir, "leak.md"), os.path.join(tmp, "docs", "leak.md"))
+        client = TestClient(app)
+        resp = client.get("/admin/knowledge/leak.md")
+        assert resp.status_code == 400
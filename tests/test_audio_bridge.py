@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock, call, patch
 
 import numpy as np
 import pytest
@@ -46,6 +49,49 @@ def test_resample_upsample() -> None:
     assert len(result) == 480
 
 
+def test_resample_streaming_matches_batch() -> None:
+    """Chunked resampling is continuous across block boundaries."""
+    from bot.audio_bridge import _PolyphaseResampler, _resample
+
+    t = np.arange(48000) / 48000
+    data = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    resampler = _PolyphaseResampler(48000, 16000, compensate_delay=True)
+    streamed = np.concatenate([resampler.process(data[i : i + 4800]) for i in range(0, len(data), 4800)])
+    streamed = np.concatenate((streamed, resampler.flush()))
+    np.testing.assert_array_almost_equal(streamed, _resample(data, 48000, 16000))
+
+
+def test_resample_suppresses_aliasing() -> None:
+    """Content above the target Nyquist is filtered out rather than folded back."""
+    from bot.audio_bridge import _resample
+
+    t = np.arange(48000) / 48000
+    data = np.sin(2 * np.pi * 20000 * t).astype(np.float32)
+    result = _resample(data, 48000, 16000)
+    assert np.abs(result[100:-100]).max() < 0.01
+
+
+def test_resample_preserves_tail_and_alignment() -> None:
+    """An impulse on the final sample survives and lands at the matching output time."""
+    from bot.audio_bridge import _resample
+
+    data = np.zeros(1000, dtype=np.float32)
+    data[-1] = 1.0
+    result = _resample(data, 16000, 48000)
+    assert len(result) == 3000
+    assert int(np.argmax(result)) == 2997
+    assert result.max() > 0.99
+
+
+def test_polyphase_filter_is_read_only() -> None:
+    """The cached filter bank cannot be mutated through one resampler."""
+    from bot.audio_bridge import _design_polyphase_filter
+
+    _, _, phases = _design_polyphase_filter(48000, 16000)
+    with pytest.raises(ValueError):
+        phases[0, 0] = 1.0
+
+
 def test_find_device_index_found() -> None:
     """_find_device_index returns correct index when device exists."""
     mock_devices = [
@@ -73,6 +119,21 @@ def test_find_device_index_not_found() -> None:
         assert _find_device_index("BlackHole 2ch", "input") is None
 
 
+def test_find_device_index_prefers_exact_match_from_prefetched_list() -> None:
+    """An exact name match beats an earlier substring match, without re-querying."""
+    devices = [
+        {"name": "BlackHole 2ch Aggregate", "max_input_channels": 2, "max_output_channels": 0},
+        {"name": "BlackHole 2ch", "max_input_channels": 2, "max_output_channels": 2},
+    ]
+
+    with patch("bot.audio_bridge.sd.query_devices") as mock_qd:
+        from bot.audio_bridge import _find_device_index
+
+        assert _find_device_index("blackhole 2ch", "input", devices) == 1
+        assert _find_device_index("Aggregate", "output", devices) is None
+        mock_qd.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_audio_bridge_callback() -> None:
     """AudioBridge forwards captured audio to the callback."""
@@ -116,40 +177,219 @@ async def test_audio_bridge_callback() -> None:
             chunk_ms=100,
         )
         await bridge.start(on_chunk)
+        # About one second of 100 ms chunks
+        assert bridge._audio_queue.maxsize == 10
 
         # Verify streams were opened
         mock_input.assert_called_once()
         mock_stream.start.assert_called_once()
         mock_output.assert_called_once()
         mock_out_stream.start.assert_called_once()
+        # Device list is enumerated once and shared by both lookups
+        assert [c for c in mock_qd.call_args_list if not c.args] == [call()]
 
         await bridge.stop()
 
 
 @pytest.mark.asyncio
-async def test_play_audio_sends_to_device() -> None:
-    """play_audio writes audio data to the playback stream."""
+async def test_capture_callback_converts_to_int16() -> None:
+    """The capture callback queues clipped, rounded int16 PCM at the target rate."""
     _set_default_test_settings()
 
-    mock_stream = MagicMock()
     mock_devices = [
+        {"name": "BlackHole 2ch", "max_input_channels": 2, "max_output_channels": 2},
         {"name": "BlackHole 16ch", "max_input_channels": 16, "max_output_channels": 16},
     ]
 
-    with patch("bot.audio_bridge.sd.query_devices") as mock_qd:
-        mock_qd.side_effect = lambda *a, **kw: (
-            (mock_devices[a[0]] | {"default_samplerate": 48000.0}) if a else mock_devices
-        )
+    with (
+        patch("bot.audio_bridge.sd.query_devices") as mock_qd,
+        patch("bot.audio_bridge.sd.InputStream") as mock_input,
+        patch("bot.audio_bridge.sd.OutputStream"),
+    ):
+
+        def _query_side_effect(*args, **kwargs):
+            if args:
+                return mock_devices[args[0]] | {"default_samplerate": 16000.0}
+            return mock_devices
+
+        mock_qd.side_effect = _query_side_effect
 
         from bot.audio_bridge import AudioBridge
 
-        bridge = AudioBridge()
-        bridge._playback_stream = mock_stream
-        bridge._playback_idx = 0
-        bridge._running = True
+        async def on_chunk(data: bytes) -> None:
+            pass
+
+        bridge = AudioBridge(sample_rate=16000, chunk_ms=20)
+        await bridge.start(on_chunk)
+        callback = mock_input.call_args.kwargs["callback"]
+
+        block = np.zeros((320, 1), dtype=np.float32)
+        block[:3, 0] = [2.0, -2.0, 0.5]
+        callback(block, 320, None, None)
+        await asyncio.sleep(0)
+
+        pcm = np.frombuffer(bridge._audio_queue.get_nowait(), dtype=np.int16)
+        assert len(pcm) == 320
+        assert pcm[:3].tolist() == [32767, -32768, 16384]
+        # The PortAudio buffer itself is left untouched
+        assert block[:3, 0].tolist() == [2.0, -2.0, 0.5]
+
+        await bridge.stop()
+
+
+@pytest.mark.asyncio
+async def test_audio_queue_drops_oldest_when_full() -> None:
+    """A stalled consumer bounds the queue and keeps the most recent audio."""
+    _set_default_test_settings()
+
+    from bot.audio_bridge import AudioBridge
+
+    bridge = AudioBridge(chunk_ms=250)
+    bridge._audio_queue = asyncio.Queue(maxsize=4)
+
+    for i in range(6):
+        bridge._enqueue_dropping(bytes([i]))
+
+    assert bridge._audio_queue.qsize() == 4
+    assert [bridge._audio_queue.get_nowait() for _ in range(4)] == [bytes([i]) for i in range(2, 6)]
+    assert bridge._dropped_chunks == 2
+
+
+@pytest.mark.asyncio
+async def test_consumer_forwards_chunks_and_stops_promptly() -> None:
+    """The consumer forwards queued audio and exits on cancel without a polling timeout."""
+    _set_default_test_settings()
+
+    from bot.audio_bridge import AudioBridge
+
+    received: list[bytes] = []
+
+    async def on_chunk(data: bytes) -> None:
+        received.append(data)
+
+    bridge = AudioBridge()
+    bridge._running = True
+    bridge._audio_queue = asyncio.Queue()
+    bridge._consumer_task = asyncio.create_task(bridge._consume_audio(on_chunk))
+
+    bridge._audio_queue.put_nowait(b"chunk")
+    await asyncio.sleep(0.01)
+    assert received == [b"chunk"]
+
+    await asyncio.wait_for(bridge.stop(), timeout=0.5)
+    assert bridge._consumer_task is None
+
+
+def _playback_bridge(stream: MagicMock) -> Any:
+    """AudioBridge wired to a mock playback stream with its writer queue, as start() would leave it."""
+    from bot.audio_bridge import AudioBridge
+
+    bridge = AudioBridge()
+    bridge._playback_stream = stream
+    bridge._playback_idx = 0
+    bridge._playback_rate = 48000
+    bridge._playback_queue = asyncio.Queue()
+    bridge._running = True
+    return bridge
+
+
+@pytest.mark.asyncio
+async def test_play_audio_sends_to_device() -> None:
+    """play_audio hands audio to the writer, which feeds the device in chunk_ms blocks."""
+    _set_default_test_settings()
+
+    mock_stream = MagicMock()
+
+    with patch("bot.audio_bridge.sd.query_devices") as mock_qd:
+        bridge = _playback_bridge(mock_stream)
+        writer = asyncio.create_task(bridge._write_playback())
 
         # Create test PCM data (1 second of silence at 16kHz, 16-bit)
         pcm_data = np.zeros(16000, dtype=np.int16).tobytes()
-        bridge.play_audio(pcm_data, 16000)
+        await bridge.play_audio(pcm_data, 16000)
+        await asyncio.wait_for(bridge._playback_queue.join(), timeout=1.0)
+        writer.cancel()
+
+        # 1 s at 48 kHz written as ten 100 ms blocks
+        assert mock_stream.write.call_count == 10
+        assert sum(c.args[0].shape[0] for c in mock_stream.write.call_args_list) == 48000
+        # Device rate is cached at start(); no PortAudio query per chunk
+        mock_qd.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_play_audio_returns_before_playback_finishes() -> None:
+    """A slow device write does not hold up the caller."""
+    _set_default_test_settings()
+
+    release = threading.Event()
+    mock_stream = MagicMock()
+    mock_stream.write.side_effect = lambda data: release.wait(1.0)
+    bridge = _playback_bridge(mock_stream)
+    writer = asyncio.create_task(bridge._write_playback())
+
+    await asyncio.wait_for(bridge.play_audio(np.zeros(16000, dtype=np.int16).tobytes(), 16000), timeout=0.2)
+
+    release.set()
+    await asyncio.wait_for(bridge._playback_queue.join(), timeout=1.0)
+    writer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_write_before_closing_stream() -> None:
+    """stop() never closes the playback stream while a worker thread is inside write()."""
+    _set_default_test_settings()
+
+    writing, release = threading.Event(), threading.Event()
+    events: list[str] = []
+    mock_stream = MagicMock()
+
+    def _write(data: Any) -> None:
+        writing.set()
+        release.wait(1.0)
+        events.append("write returned")
+
+    mock_stream.write.side_effect = _write
+    mock_stream.close.side_effect = lambda: events.append("close")
+    bridge = _playback_bridge(mock_stream)
+    bridge._playback_task = asyncio.create_task(bridge._write_playback())
+    await bridge.play_audio(np.zeros(4800, dtype=np.int16).tobytes(), 48000)
+    await asyncio.to_thread(writing.wait, 1.0)
+
+    stopping = asyncio.create_task(bridge.stop())
+    await asyncio.sleep(0.05)
+    assert events == []  # still waiting on the in-flight block
+    release.set()
+    await asyncio.wait_for(stopping, timeout=1.0)
+
+    assert events == ["write returned", "close"]
+
+
+@pytest.mark.asyncio
+async def test_play_audio_reuses_resampler_per_rate() -> None:
+    """Consecutive turns at the same source rate share one playback resampler."""
+    _set_default_test_settings()
+
+    bridge = _playback_bridge(MagicMock())
+
+    pcm_data = np.zeros(2400, dtype=np.int16).tobytes()
+    await bridge.play_audio(pcm_data, 24000)
+    resampler = bridge._playback_resamplers[24000]
+    await bridge.play_audio(pcm_data, 24000)
+
+    assert bridge._playback_resamplers[24000] is resampler
+    assert [audio.shape for audio in (bridge._playback_queue.get_nowait() for _ in range(2))] == [(4800,), (4800,)]
+
+
+@pytest.mark.asyncio
+async def test_play_audio_scales_pcm_to_unit_range() -> None:
+    """int16 PCM is converted to float32 in [-1, 1) before playback."""
+    _set_default_test_settings()
+
+    bridge = _playback_bridge(MagicMock())
+    pcm_data = np.array([-32768, 0, 16384, 32767], dtype=np.int16).tobytes()
+    await bridge.play_audio(pcm_data, 48000)
 
-        mock_stream.write.assert_called_once()
+    audio = bridge._playback_queue.get_nowait()
+    assert audio.dtype == np.float32
+    np.testing.assert_array_equal(audio, np.array([-1.0, 0.0, 0.5, 32767 / 32768], dtype=np.float32))
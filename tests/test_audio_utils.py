@@ -5,7 +5,7 @@ from __future__ import annotations
 import base64
 import struct
 
-from bot.audio_utils import decode_b64_pcm, pcm_to_mp3_b64
+from bot.audio_utils import decode_b64_pcm, pcm_to_mp3, pcm_to_mp3_b64
 
 
 def _make_pcm_silence(num_samples: int = 480, channels: int = 1) -> bytes:
@@ -29,6 +29,13 @@ def test_pcm_to_mp3_b64_output_is_mp3() -> None:
     assert mp3_bytes[:3] == b"ID3" or (mp3_bytes[0] == 0xFF and (mp3_bytes[1] & 0xE0) == 0xE0)
 
 
+def test_pcm_to_mp3_returns_raw_bytes() -> None:
+    pcm = _make_pcm_silence(4800)
+    mp3_bytes = pcm_to_mp3(pcm, sample_rate=24000)
+    assert isinstance(mp3_bytes, bytearray)  # the encoder's buffer, returned without a copy
+    assert base64.b64encode(mp3_bytes).decode("ascii") == pcm_to_mp3_b64(pcm, sample_rate=24000)
+
+
 def test_pcm_to_mp3_b64_custom_sample_rate() -> None:
     pcm = _make_pcm_silence(1600)
     result = pcm_to_mp3_b64(pcm, sample_rate=16000)
@@ -36,6 +43,13 @@ def test_pcm_to_mp3_b64_custom_sample_rate() -> None:
     assert len(decoded) > 0
 
 
+def test_pcm_to_mp3_b64_stereo() -> None:
+    pcm = _make_pcm_silence(2400, channels=2)
+    result = pcm_to_mp3_b64(pcm, sample_rate=24000, channels=2)
+    mp3_bytes = base64.b64decode(result)
+    assert mp3_bytes[0] == 0xFF and (mp3_bytes[1] & 0xE0) == 0xE0
+
+
 def test_decode_b64_pcm_roundtrip() -> None:
     original = b"\x00\x01\x02\x03\x04\x05"
     encoded = base64.b64encode(original).decode("ascii")
@@ -0,0 +1,58 @@
+"""Tests for auth/router.py status caching."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from auth.google_oauth import SCOPES
+from main import app
+
+
+@pytest.fixture()
+def repo():
+    """Attach a mock repository holding a token that expires in an hour."""
+    expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+    mock_repo = MagicMock()
+    mock_repo.get_token = AsyncMock(
+        return_value={
+            "access_token": "access",
+            "refresh_token": "refresh",
+            "token_expiry": expiry.isoformat(),
+            "scopes": ",".join(SCOPES),
+        }
+    )
+    mock_repo.delete_token = AsyncMock()
+    app.state.repo = mock_repo
+    app.state.cached_creds = None
+    yield mock_repo
+    app.state.repo = None
+    app.state.cached_creds = None
+    app.state.http_client = None
+
+
+def test_status_served_from_cache(repo: MagicMock) -> None:
+    """Repeated status polls read the token from the DB only once."""
+    client = TestClient(app)
+
+    first = client.get("/auth/google/status").json()
+    second = client.get("/auth/google/status").json()
+
+    assert first["authenticated"] and second == first
+    assert repo.get_token.await_count == 1
+
+
+def test_revoke_invalidates_cached_status(repo: MagicMock) -> None:
+    """After a revoke, the next status check goes back to the DB."""
+    client = TestClient(app)
+    client.get("/auth/google/status")
+
+    app.state.http_client = MagicMock(post=AsyncMock())
+    client.post("/auth/google/revoke")
+    app.state.http_client.post.assert_awaited_once()
+    repo.get_token.return_value = None
+
+    assert client.get("/auth/google/status").json() == {"authenticated": False}
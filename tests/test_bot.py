@@ -1,5 +1,7 @@
-from unittest.mock import AsyncMock, patch
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 from config import settings
@@ -98,7 +100,14 @@ def test_leave_sends_request() -> None:
 # --- /bot/webhook/transcript ---
 
 
-def test_webhook_receives_transcript() -> None:
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_webhook_receives_transcript(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    from bot import router
+
+    if not use_orjson:
+        monkeypatch.setattr(router, "orjson", None)
+    elif router.orjson is None:
+        pytest.skip("orjson not installed")
     _set_bot_test_settings()
     client = TestClient(app)
 
@@ -234,3 +243,283 @@ def test_webhook_without_bot_id_still_works() -> None:
     resp = client.post("/bot/webhook/transcript", json=payload)
     assert resp.status_code == 200
     assert resp.json()["status"] == "received"
+
+
+def _stream_chunks(*texts: str) -> AsyncIterator[MagicMock]:
+    """Mimic the async iterator returned by ``generate_content_async(..., stream=True)``."""
+
+    async def _chunks() -> AsyncIterator[MagicMock]:
+        for text in texts:
+            yield MagicMock(text=text)
+
+    return _chunks()
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_reuses_answer_and_audio_for_paraphrase(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+    from bot.conversation import ConversationManager
+
+    _set_bot_test_settings()
+    monkeypatch.setattr(settings, "semantic_cache_enabled", True)
+    monkeypatch.setattr(router, "_conversation_manager", ConversationManager())
+    monkeypatch.setattr(router, "_knowledge_base", MagicMock())
+    monkeypatch.setattr(router, "_persona", MagicMock())
+    monkeypatch.setattr(router, "_semantic_caches", {})
+    embeddings = iter([[1.0, 0.0], [0.99, 0.05]])
+    monkeypatch.setattr("bot.semantic_cache.embed_text", lambda text: next(embeddings))
+    generate = AsyncMock(return_value="[ANSWERED] 売上は1000万円です。")
+    monkeypatch.setattr(router, "_generate_avatar_reply", generate)
+    synthesize = AsyncMock(return_value=b"mp3")
+    monkeypatch.setattr("bot.tts.is_available", lambda: True)
+    monkeypatch.setattr("bot.tts.synthesize_japanese", synthesize)
+    recall = MagicMock(send_audio=AsyncMock())
+    monkeypatch.setattr(router, "_get_recall_client", lambda: recall)
+
+    await router._handle_avatar_response("bot-sem", "Alice", "売上はいくらですか？")
+    await router._handle_avatar_response("bot-sem", "Alice", "売上を教えてもらえますか？")
+
+    generate.assert_awaited_once()
+    synthesize.assert_awaited_once_with("売上は1000万円です。")
+    assert [c.args for c in recall.send_audio.await_args_list] == [("bot-sem", b"mp3"), ("bot-sem", b"mp3")]
+
+
+@pytest.mark.asyncio
+async def test_context_cache_sends_only_per_turn_prompt(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+    from bot.llm_cache import get_llm_cache
+    from bot.meeting_conversation import MeetingConversationSession
+    from bot.persona import Persona
+
+    _set_bot_test_settings()
+    monkeypatch.setattr(settings, "gemini_context_cache_enabled", True)
+    monkeypatch.setattr(router, "_knowledge_base", MagicMock(get_context=lambda text: "KB snippet"))
+    monkeypatch.setattr(router, "_persona", Persona("/nonexistent/profile.md"))
+    model = MagicMock()
+    model.generate_content_async = AsyncMock(return_value=_stream_chunks("[ANSWERED] ", "はい。"))
+    get_model = MagicMock(return_value=model)
+    monkeypatch.setattr(router._context_cache, "get_model", get_model)
+    get_llm_cache().clear()
+
+    session = MeetingConversationSession("bot-ctx", "meeting-1", materials_context="資料本文")
+    reply = await router._generate_avatar_reply(session, "Alice", "資料について教えてください？")
+
+    assert reply == "[ANSWERED] はい。"
+    bot_id, static_instruction = get_model.call_args.args
+    assert bot_id == "bot-ctx"
+    assert "資料本文" in static_instruction and "KB snippet" not in static_instruction
+    prompt = model.generate_content_async.await_args.args[0]
+    assert prompt.startswith("--- ナレッジベース ---\nKB snippet\n\n")
+    assert "資料本文" not in prompt
+    get_llm_cache().clear()
+
+
+@pytest.mark.asyncio
+async def test_generate_avatar_reply_awaits_native_async_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+    from bot.conversation import ConversationSession
+    from bot.llm_cache import get_llm_cache
+    from bot.persona import Persona
+
+    _set_bot_test_settings()
+    monkeypatch.setattr(settings, "gemini_context_cache_enabled", False)
+    monkeypatch.setattr(router, "_knowledge_base", MagicMock(get_context=lambda text: ""))
+    monkeypatch.setattr(router, "_persona", Persona("/nonexistent/profile.md"))
+    model = MagicMock()
+    model.generate_content_async = AsyncMock(return_value=_stream_chunks(" こんにちは。 "))
+    monkeypatch.setattr(router, "GenerativeModel", MagicMock(return_value=model))
+    router._gemini_model.cache_clear()
+    get_llm_cache().clear()
+
+    reply = await router._generate_avatar_reply(ConversationSession("bot-async"), "Alice", "やあ？")
+
+    assert reply == "こんにちは。"
+    model.generate_content_async.assert_awaited_once()
+    assert model.generate_content_async.await_args.kwargs["stream"] is True
+    model.generate_content.assert_not_called()
+    get_llm_cache().clear()
+    router._gemini_model.cache_clear()
+
+
+def test_gemini_model_is_built_once_per_model_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+
+    factory = MagicMock(side_effect=lambda name: MagicMock(name=name))
+    monkeypatch.setattr(router, "GenerativeModel", factory)
+    monkeypatch.setattr(settings, "gemini_model", "gemini-a")
+    router._gemini_model.cache_clear()
+
+    first = router.get_gemini_model()
+    assert router.get_gemini_model() is first
+    monkeypatch.setattr(settings, "gemini_model", "gemini-b")
+    assert router.get_gemini_model() is not first
+    assert [c.args for c in factory.call_args_list] == [("gemini-a",), ("gemini-b",)]
+    router._gemini_model.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_sentence_streaming_speaks_each_sentence_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+    from bot.conversation import ConversationManager
+
+    _set_bot_test_settings()
+    monkeypatch.setattr(settings, "avatar_sentence_streaming", True)
+    monkeypatch.setattr(router, "_conversation_manager", ConversationManager())
+    monkeypatch.setattr(router, "_knowledge_base", MagicMock())
+    monkeypatch.setattr(router, "_persona", MagicMock())
+
+    async def fake_stream(session, speaker, text):
+        for chunk in ("[ANSWERED] 売上は", "1000万円です。来期も", "伸びる見込みです！補足", "は後ほど"):
+            yield chunk
+
+    monkeypatch.setattr(router, "_stream_avatar_reply", fake_stream)
+    monkeypatch.setattr("bot.tts.is_available", lambda: True)
+    monkeypatch.setattr("bot.tts.synthesize_japanese", AsyncMock(side_effect=lambda sentence: sentence.encode()))
+    recall = MagicMock(send_audio=AsyncMock())
+    monkeypatch.setattr(router, "_get_recall_client", lambda: recall)
+
+    await router._handle_avatar_response("bot-stream", "Alice", "売上はいくらですか？")
+
+    assert [c.args for c in recall.send_audio.await_args_list] == [
+        ("bot-stream", "売上は1000万円です。".encode()),
+        ("bot-stream", "来期も伸びる見込みです！".encode()),
+        ("bot-stream", "補足は後ほど".encode()),
+    ]
+    session = router._conversation_manager.get_or_create("bot-stream")
+    assert session.history[-1].text == "売上は1000万円です。来期も伸びる見込みです！補足は後ほど"
+
+
+@pytest.mark.asyncio
+async def test_restore_bot_meeting_looks_up_once_for_concurrent_webhooks(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    from bot import router
+    from bot.conversation import ConversationManager
+
+    monkeypatch.setattr(router, "_bot_meeting_map", {})
+    monkeypatch.setattr(router, "_conversation_manager", ConversationManager())
+    repo = MagicMock()
+    repo.get_meeting_by_bot_id = AsyncMock(return_value={"id": "meeting-9"})
+    repo.list_materials = AsyncMock(return_value=[])
+
+    await asyncio.gather(*(router._restore_bot_meeting(repo, "bot-9") for _ in range(5)))
+
+    assert router._bot_meeting_map == {"bot-9": "meeting-9"}
+    repo.get_meeting_by_bot_id.assert_awaited_once_with("bot-9", ai_enabled_only=True)
+
+
+@pytest.mark.asyncio
+async def test_avatar_response_logs_utterance_and_reply_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    from types import SimpleNamespace
+
+    from bot import router
+    from bot.conversation import ConversationManager
+
+    _set_bot_test_settings()
+    monkeypatch.setattr(settings, "semantic_cache_enabled", False)
+    monkeypatch.setattr(settings, "avatar_sentence_streaming", False)
+    monkeypatch.setattr(router, "_conversation_manager", ConversationManager())
+    monkeypatch.setattr(router, "_knowledge_base", MagicMock())
+    monkeypatch.setattr(router, "_persona", MagicMock())
+    monkeypatch.setattr(router, "_bot_meeting_map", {"bot-log": "meeting-log"})
+    monkeypatch.setattr(router, "_generate_avatar_reply", AsyncMock(return_value="[ANSWERED] はい。"))
+    monkeypatch.setattr("bot.tts.is_available", lambda: True)
+    monkeypatch.setattr("bot.tts.synthesize_japanese", AsyncMock(return_value=b"mp3"))
+    recall = MagicMock(send_audio=AsyncMock())
+    monkeypatch.setattr(router, "_get_recall_client", lambda: recall)
+    state = SimpleNamespace(conversation_log=MagicMock())
+
+    await router._handle_avatar_response("bot-log", "Alice", "売上は？", state)
+
+    # The human utterance is logged by the webhook before queueing, not here
+    assert [c.args for c in state.conversation_log.add.call_args_list] == [
+        ("meeting-log", "bot-log", settings.bot_display_name, "はい。", "bot", "answered"),
+    ]
+    recall.send_audio.assert_awaited_once_with("bot-log", b"mp3")
+
+
+@pytest.mark.asyncio
+async def test_transcript_worker_coalesces_same_speaker_bursts(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    from bot import router
+
+    monkeypatch.setattr(settings, "avatar_coalesce_seconds", 0.05)
+    monkeypatch.setattr(router, "_transcript_queues", {})
+    monkeypatch.setattr(router, "_transcript_workers", {})
+    handled: list[tuple[str, str]] = []
+
+    async def handle(bot_id, speaker, text, app_state=None):
+        handled.append((speaker, text))
+
+    monkeypatch.setattr(router, "_handle_avatar_response", handle)
+
+    router._enqueue_transcript("bot-q", "Alice", "売上について", None)
+    router._enqueue_transcript("bot-q", "Alice", "教えてください", None)
+    router._enqueue_transcript("bot-q", "Bob", "私も知りたいです", None)
+    await asyncio.sleep(0.2)
+
+    assert handled == [("Alice", "売上について 教えてください"), ("Bob", "私も知りたいです")]
+    worker = router._transcript_workers["bot-q"]
+    router._stop_transcript_worker("bot-q")
+    await asyncio.sleep(0)
+    assert worker.cancelled() and "bot-q" not in router._transcript_queues
+
+
+@pytest.mark.asyncio
+async def test_transcript_queue_drops_oldest_on_overflow(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+
+    monkeypatch.setattr(router, "_transcript_queues", {})
+    monkeypatch.setattr(router, "_transcript_workers", {})
+
+    for i in range(router._TRANSCRIPT_QUEUE_SIZE + 2):
+        router._enqueue_transcript("bot-full", "Alice", f"発言{i}", None)
+
+    queue = router._transcript_queues["bot-full"]
+    assert queue.qsize() == router._TRANSCRIPT_QUEUE_SIZE
+    assert queue.get_nowait() == ("Alice", "発言2")
+    router._stop_transcript_worker("bot-full")
+
+
+def test_webhook_logs_utterance_before_queueing(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+    from bot.conversation import ConversationManager
+
+    monkeypatch.setattr(router, "_conversation_manager", ConversationManager())
+    monkeypatch.setattr(router, "_live_manager", None)
+    monkeypatch.setattr(router, "_bot_meeting_map", {"bot-wh": "meeting-wh"})
+    conversation_log = MagicMock()
+    monkeypatch.setattr(app.state, "conversation_log", conversation_log, raising=False)
+    events: list[str] = []
+    conversation_log.add.side_effect = lambda *args: events.append("log")
+    # The reply queue may later drop or coalesce the utterance; the log already has it verbatim
+    monkeypatch.setattr(router, "_enqueue_transcript", lambda *args: events.append("enqueue"))
+    _set_bot_test_settings()
+    client = TestClient(app)
+
+    payload = {
+        "data": {"bot": {"id": "bot-wh"}, "data": {"words": [{"text": "売上は？"}], "participant": {"name": "A"}}}
+    }
+    assert client.post("/bot/webhook/transcript", json=payload).status_code == 200
+
+    conversation_log.add.assert_called_once_with("meeting-wh", "bot-wh", "A", "売上は？", "human")
+    assert events == ["log", "enqueue"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_transcript_workers_cancels_every_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    from bot import router
+
+    monkeypatch.setattr(settings, "avatar_coalesce_seconds", 60.0)
+    monkeypatch.setattr(router, "_transcript_queues", {})
+    monkeypatch.setattr(router, "_transcript_workers", {})
+    monkeypatch.setattr(router, "_handle_avatar_response", AsyncMock())
+    router._enqueue_transcript("bot-a", "Alice", "売上は？", None)
+    router._enqueue_transcript("bot-b", "Bob", "予算は？", None)
+    workers = list(router._transcript_workers.values())
+
+    await router.shutdown_transcript_workers()
+
+    assert all(worker.cancelled() for worker in workers)
+    assert router._transcript_workers == {} and router._transcript_queues == {}
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
+import os
+import sys
+import types
 import uuid
 from unittest.mock import AsyncMock, MagicMock
 
@@ -14,6 +19,10 @@ def _set_default_test_settings() -> None:
     settings.meeting_mode = "local"
     settings.chrome_profile_dir = ""
     settings.api_key = None
+    settings.browser_headless = False
+    settings.playwright_browsers_path = ""
+    settings.browser_goto_timeout_ms = 10_000
+    settings.browser_admission_timeout_ms = 20_000
 
 
 def _mock_locator(count: int = 0) -> MagicMock:
@@ -21,8 +30,10 @@ def _mock_locator(count: int = 0) -> MagicMock:
     locator = MagicMock()
     locator.count = AsyncMock(return_value=count)
     locator.first = MagicMock()
+    locator.first.count = AsyncMock(return_value=count)
     locator.first.click = AsyncMock()
     locator.first.fill = AsyncMock()
+    locator.first.wait_for = AsyncMock()
     return locator
 
 
@@ -60,6 +71,137 @@ async def test_browser_client_generates_bot_id() -> None:
     assert bot_id in client._pages
 
 
+@pytest.mark.asyncio
+async def test_join_meeting_waits_for_meet_ui_not_fixed_sleep() -> None:
+    """join_meeting gates on the Meet UI selectors rather than a blind timeout."""
+    _set_default_test_settings()
+
+    mock_page = _make_mock_page()
+    mock_context = MagicMock()
+    mock_context.new_page = AsyncMock(return_value=mock_page)
+
+    from bot.browser_client import _SEL_JOIN_BTN, _SEL_NAME_INPUT, BrowserClient
+
+    client = BrowserClient()
+    client._context = mock_context
+    await client.join_meeting("https://meet.google.com/abc-defg-hij", "Test Bot")
+
+    ready_selector = mock_page.wait_for_selector.await_args_list[0].args[0]
+    assert _SEL_NAME_INPUT in ready_selector and _SEL_JOIN_BTN in ready_selector
+    mock_page.wait_for_timeout.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_join_meeting_probes_ui_then_acts_on_counts() -> None:
+    """join_meeting issues every pre-join probe up front and clicks only what exists."""
+    _set_default_test_settings()
+
+    from bot.browser_client import _SEL_ASK_JOIN, _SEL_CAMERA_OFF, _SEL_JOIN_BTN, _SEL_NAME_INPUT, BrowserClient
+
+    locators = {
+        _SEL_NAME_INPUT: _mock_locator(count=1),
+        _SEL_CAMERA_OFF: _mock_locator(count=1),
+        _SEL_JOIN_BTN: _mock_locator(count=0),
+        _SEL_ASK_JOIN: _mock_locator(count=1),
+    }
+    mock_page = _make_mock_page()
+    mock_page.locator = MagicMock(side_effect=lambda sel: locators.get(sel, _mock_locator(count=1)))
+    mock_context = MagicMock()
+    mock_context.new_page = AsyncMock(return_value=mock_page)
+
+    client = BrowserClient()
+    client._context = mock_context
+    await client.join_meeting("https://meet.google.com/abc-defg-hij", "Test Bot")
+
+    for locator in locators.values():
+        locator.count.assert_awaited_once()
+    locators[_SEL_NAME_INPUT].first.fill.assert_awaited_once_with("Test Bot")
+    locators[_SEL_JOIN_BTN].first.click.assert_not_awaited()
+    locators[_SEL_ASK_JOIN].first.click.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headless", [False, True])
+async def test_launch_honours_headless_setting(monkeypatch: pytest.MonkeyPatch, headless: bool) -> None:
+    """launch() passes BROWSER_HEADLESS through and keeps audio unmuted."""
+    _set_default_test_settings()
+    settings.browser_headless = headless
+
+    chromium = MagicMock()
+    browser = MagicMock()
+    browser.new_context = AsyncMock(return_value=MagicMock())
+    chromium.launch = AsyncMock(return_value=browser)
+    playwright = MagicMock(chromium=chromium)
+    starter = MagicMock()
+    starter.start = AsyncMock(return_value=playwright)
+    fake_module = types.ModuleType("playwright.async_api")
+    fake_module.async_playwright = MagicMock(return_value=starter)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.async_api", fake_module)
+
+    from bot.browser_client import BrowserClient
+
+    client = BrowserClient()
+    await client.launch()
+
+    kwargs = chromium.launch.await_args.kwargs
+    assert kwargs["headless"] is headless
+    assert kwargs["ignore_default_args"] == ["--mute-audio"]
+    assert "--disable-blink-features=AutomationControlled" in kwargs["args"]
+    assert ("--disable-gpu" in kwargs["args"]) is headless
+    settings.browser_headless = False
+
+
+@pytest.mark.asyncio
+async def test_launch_exports_playwright_browsers_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """PLAYWRIGHT_BROWSERS_PATH from settings is visible to the Playwright driver."""
+    _set_default_test_settings()
+    settings.playwright_browsers_path = "/opt/ms-playwright"
+    monkeypatch.delenv("PLAYWRIGHT_BROWSERS_PATH", raising=False)
+
+    seen: list[str | None] = []
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=MagicMock(new_context=AsyncMock()))
+    starter = MagicMock()
+
+    async def _start() -> MagicMock:
+        seen.append(os.environ.get("PLAYWRIGHT_BROWSERS_PATH"))
+        return playwright
+
+    starter.start = _start
+    fake_module = types.ModuleType("playwright.async_api")
+    fake_module.async_playwright = MagicMock(return_value=starter)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.async_api", fake_module)
+
+    from bot.browser_client import BrowserClient
+
+    await BrowserClient().launch()
+    assert seen == ["/opt/ms-playwright"]
+    settings.playwright_browsers_path = ""
+
+
+@pytest.mark.asyncio
+async def test_failed_join_unregisters_and_closes_page() -> None:
+    """A join that raises does not leave its page tracked or open."""
+    _set_default_test_settings()
+
+    mock_page = _make_mock_page()
+    mock_page.goto = AsyncMock(side_effect=TimeoutError("navigation timed out"))
+    mock_context = MagicMock()
+    mock_context.new_page = AsyncMock(return_value=mock_page)
+
+    from bot.browser_client import BrowserClient
+
+    client = BrowserClient()
+    client._context = mock_context
+    with pytest.raises(TimeoutError):
+        await client.join_meeting("https://meet.google.com/abc-defg-hij", "Test Bot")
+
+    assert client.active_bots == []
+    mock_page.close.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_browser_client_leave() -> None:
     """leave_meeting removes the page and cleans up state."""
@@ -79,6 +221,116 @@ async def test_browser_client_leave() -> None:
     mock_page.close.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_join_meeting_uses_configured_timeouts() -> None:
+    """Navigation and admission waits honour the browser timeout settings."""
+    _set_default_test_settings()
+    settings.browser_goto_timeout_ms = 1234
+    settings.browser_admission_timeout_ms = 5678
+
+    mock_page = _make_mock_page()
+    mock_context = MagicMock()
+    mock_context.new_page = AsyncMock(return_value=mock_page)
+
+    from bot.browser_client import _SEL_IN_MEETING, BrowserClient
+
+    client = BrowserClient()
+    client._context = mock_context
+    await client.join_meeting("https://meet.google.com/abc-defg-hij", "Test Bot")
+
+    assert mock_page.goto.await_args.kwargs["timeout"] == 1234
+    assert mock_page.goto.await_args.kwargs["wait_until"] == "commit"
+    admission = mock_page.wait_for_selector.await_args_list[-1]
+    assert admission.args[0] == _SEL_IN_MEETING
+    assert admission.kwargs["timeout"] == 5678
+
+
+@pytest.mark.asyncio
+async def test_browser_client_leave_confirms_dialog_without_fixed_sleep() -> None:
+    """leave_meeting waits for the confirmation button instead of sleeping."""
+    _set_default_test_settings()
+
+    from bot.browser_client import _SEL_END_FOR_ALL, _SEL_LEAVE_BTN, BrowserClient
+
+    locators = {_SEL_LEAVE_BTN: _mock_locator(count=1), _SEL_END_FOR_ALL: _mock_locator(count=1)}
+    mock_page = _make_mock_page()
+    mock_page.locator = MagicMock(side_effect=locators.__getitem__)
+
+    client = BrowserClient()
+    client._pages["bot-1"] = mock_page
+    await client.leave_meeting("bot-1")
+
+    end_btn = locators[_SEL_END_FOR_ALL].first
+    end_btn.wait_for.assert_awaited_once_with(state="visible", timeout=1000)
+    end_btn.click.assert_awaited_once()
+    mock_page.wait_for_timeout.assert_not_awaited()
+
+
+def test_selectors_are_is_unions() -> None:
+    """Each multi-alternative selector is a single :is() union."""
+    from bot import browser_client
+
+    for name in ("_SEL_CAMERA_OFF", "_SEL_JOIN_BTN", "_SEL_ASK_JOIN", "_SEL_IN_MEETING", "_SEL_MEET_READY"):
+        selector = getattr(browser_client, name)
+        assert selector.startswith(":is(") and selector.endswith(")")
+    assert browser_client._SEL_JOIN_BTN in browser_client._SEL_JOIN_UNION
+    assert browser_client._SEL_ASK_JOIN in browser_client._SEL_JOIN_UNION
+
+
+def test_loc_memoizes_locator_per_page() -> None:
+    """_loc builds each (page, selector) Locator once and forgets closed pages."""
+    from bot.browser_client import _SEL_JOIN_BTN, _SEL_NAME_INPUT, BrowserClient
+
+    client = BrowserClient()
+    page = _make_mock_page()
+    page.locator = MagicMock(side_effect=lambda sel: _mock_locator())
+
+    first = client._loc(page, _SEL_JOIN_BTN)
+    assert client._loc(page, _SEL_JOIN_BTN) is first
+    assert client._loc(page, _SEL_NAME_INPUT) is not first
+    assert page.locator.call_count == 2
+
+    other_page = _make_mock_page()
+    assert client._loc(other_page, _SEL_JOIN_BTN) is not first
+
+    del page, first
+    gc.collect()
+    assert len(client._locator_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_leaves_all_meetings_concurrently() -> None:
+    """shutdown() runs every leave at once, so total time doesn't scale with bot count."""
+    _set_default_test_settings()
+
+    from bot.browser_client import BrowserClient
+
+    client = BrowserClient()
+    in_flight = 0
+    peak = 0
+
+    async def _slow_close() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    pages = []
+    for i in range(4):
+        page = _make_mock_page()
+        page.close = AsyncMock(side_effect=_slow_close)
+        client._pages[f"bot-{i}"] = page
+        pages.append(page)
+
+    await client.shutdown()
+
+    assert client.active_bots == []
+    assert peak == 4
+    for page in pages:
+        page.close.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_browser_client_leave_nonexistent() -> None:
     """leave_meeting with unknown bot_id does not raise."""
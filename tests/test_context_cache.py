@@ -0,0 +1,113 @@
+"""Tests for bot.context_cache.MeetingContextCache."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from bot import context_cache
+from bot.context_cache import MeetingContextCache
+from config import settings
+
+
+def _set_default_test_settings() -> None:
+    settings.gemini_model = "gemini-1.5-pro"
+    settings.gemini_context_cache_ttl_seconds = 600
+
+
+@pytest.fixture
+def created(monkeypatch: pytest.MonkeyPatch) -> list[MagicMock]:
+    """Record CachedContent creations; models are ("model", cached_content) tuples."""
+    contents: list[MagicMock] = []
+
+    def _create(model_name: str, system_instruction: str, ttl_seconds: int) -> Any:
+        cached = MagicMock(name=f"cached-{len(contents)}")
+        cached.system_instruction = system_instruction
+        contents.append(cached)
+        return cached
+
+    monkeypatch.setattr(context_cache, "_create_cached_content", _create)
+    monkeypatch.setattr(context_cache, "_model_from_cached_content", lambda cached: ("model", cached))
+    return contents
+
+
+def test_same_instruction_reuses_cached_content(created: list[MagicMock]) -> None:
+    _set_default_test_settings()
+    cache = MeetingContextCache()
+
+    first = cache.get_model("bot-1", "persona + materials")
+    second = cache.get_model("bot-1", "persona + materials")
+
+    assert first == second == ("model", created[0])
+    assert first is second
+    assert len(created) == 1
+    created[0].update.assert_not_called()
+
+
+def test_changed_instruction_replaces_and_drop_deletes(created: list[MagicMock]) -> None:
+    _set_default_test_settings()
+    cache = MeetingContextCache()
+
+    cache.get_model("bot-1", "v1")
+    assert cache.get_model("bot-1", "v2") == ("model", created[1])
+    created[0].delete.assert_called_once()
+
+    cache.drop("bot-1")
+    created[1].delete.assert_called_once()
+    cache.drop("bot-1")  # no-op once dropped
+
+
+def test_ttl_is_extended_after_half_elapsed(created: list[MagicMock], monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_default_test_settings()
+    now = [1000.0]
+    monkeypatch.setattr(context_cache.time, "monotonic", lambda: now[0])
+    cache = MeetingContextCache()
+
+    cache.get_model("bot-1", "static")
+    now[0] += 200
+    cache.get_model("bot-1", "static")
+    created[0].update.assert_not_called()
+    now[0] += 150
+    cache.get_model("bot-1", "static")
+    created[0].update.assert_called_once()
+
+
+def test_uncacheable_instruction_falls_back_without_retrying(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_default_test_settings()
+    create = MagicMock(side_effect=ValueError("below minimum token count"))
+    monkeypatch.setattr(context_cache, "_create_cached_content", create)
+    cache = MeetingContextCache()
+
+    assert cache.get_model("bot-1", "short") is None
+    assert cache.get_model("bot-1", "short") is None
+    assert create.call_count == 1
+
+
+def test_slow_create_for_one_bot_does_not_block_another(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    _set_default_test_settings()
+    entered, release = threading.Event(), threading.Event()
+
+    def _create(model_name: str, system_instruction: str, ttl_seconds: int) -> Any:
+        if system_instruction == "slow":
+            entered.set()
+            assert release.wait(5)
+        return MagicMock(name=system_instruction)
+
+    monkeypatch.setattr(context_cache, "_create_cached_content", _create)
+    monkeypatch.setattr(context_cache, "_model_from_cached_content", lambda cached: ("model", cached))
+    cache = MeetingContextCache()
+
+    slow = threading.Thread(target=cache.get_model, args=("bot-slow", "slow"))
+    slow.start()
+    try:
+        assert entered.wait(5)
+        # Returns while bot-slow is still inside its CachedContent.create call
+        assert cache.get_model("bot-fast", "fast")[0] == "model"
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join()
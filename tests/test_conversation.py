@@ -24,6 +24,24 @@ def test_history_trimmed_to_max() -> None:
     assert session.history_length == 3
 
 
+def test_history_keeps_most_recent_entries_in_order() -> None:
+    session = _make_session()
+    settings.max_conversation_history = 3
+    for i in range(5):
+        session.add_utterance("Speaker", f"Message {i}")
+    assert [u.text for u in session.history] == ["Message 2", "Message 3", "Message 4"]
+    assert isinstance(session.history, list)
+
+
+def test_build_conversation_prompt_uses_last_ten_entries() -> None:
+    session = _make_session()
+    for i in range(15):
+        session.add_utterance("Speaker", f"Message {i}")
+    prompt = session.build_conversation_prompt("Bob", "hi")
+    assert "Message 4\n" not in prompt
+    assert "Message 5" in prompt and "Message 14" in prompt
+
+
 def test_should_respond_when_name_called() -> None:
     session = _make_session(bot_name="Avatar")
     assert session.should_respond("Alice", "Avatar、この件どう思う？") is True
@@ -44,6 +62,21 @@ def test_should_respond_to_custom_trigger() -> None:
     assert session.should_respond("Alice", "keyword1について教えて") is True
 
 
+def test_should_respond_to_trigger_case_insensitively() -> None:
+    session = _make_session(bot_name="Avatar", triggers="C++,Q&A")
+    assert session.should_respond("Alice", "AVATAR hello") is True
+    assert session.should_respond("Alice", "c++ the build is broken") is True
+    assert session.should_respond("Alice", "then q&a session") is True
+    assert session.should_respond("Alice", "c+ only") is False
+
+
+def test_should_respond_to_question_ending_and_request() -> None:
+    session = _make_session(bot_name="Avatar")
+    assert session.should_respond("Alice", "  それは本当ですか。 ") is True
+    assert session.should_respond("Alice", "資料を説明") is True
+    assert session.should_respond("Alice", "いい天気ですね") is False
+
+
 def test_should_not_respond_while_responding() -> None:
     session = _make_session(bot_name="Avatar")
     session.is_responding = True
@@ -59,6 +92,29 @@ def test_build_conversation_prompt_includes_history() -> None:
     assert "Avatar" in prompt
 
 
+def test_build_conversation_prompt_layout() -> None:
+    session = _make_session(bot_name="Avatar")
+    assert session.build_conversation_prompt("Bob", "こんにちは") == "--- 最新の発言 ---\nBob: こんにちは"
+    assert session.response_instruction == "上記の発言に対して、Avatarとして簡潔に応答してください。"
+    session.add_utterance("Alice", "前回の件")
+    assert session.build_conversation_prompt("Bob", "どう？", "--- 参考資料 ---\nKB") == (
+        "--- 会話履歴 ---\nAlice: 前回の件\n\n--- 参考資料 ---\nKB\n\n--- 最新の発言 ---\nBob: どう？"
+    )
+
+
+def test_successive_prompts_only_grow_after_the_history() -> None:
+    """Everything before the per-turn knowledge/latest section is stable as the meeting goes on."""
+    session = _make_session(bot_name="Avatar")
+    session.add_utterance("Alice", "一つ目")
+    first = session.build_conversation_prompt("Alice", "一つ目", "KB-1")
+    session.add_utterance("Bob", "二つ目")
+    second = session.build_conversation_prompt("Bob", "二つ目", "KB-2")
+
+    stable_prefix = "--- 会話履歴 ---\nAlice: 一つ目\n"
+    assert first.startswith(stable_prefix)
+    assert second.startswith(stable_prefix)
+
+
 # --- ConversationManager ---
 
 
@@ -6,6 +6,7 @@ import tempfile
 
 import pytest
 
+from db.batcher import ConversationLogBatcher
 from db.repository import Repository
 from db.schema import init_db
 
@@ -46,6 +47,16 @@ def test_schema_creates_tables(repo: Repository) -> None:
     _run(check())
 
 
+def test_connection_uses_wal_journal(repo: Repository) -> None:
+    async def check():
+        cursor = await repo._db.execute("PRAGMA journal_mode")
+        assert (await cursor.fetchone())[0] == "wal"
+        cursor = await repo._db.execute("PRAGMA synchronous")
+        assert (await cursor.fetchone())[0] == 1  # NORMAL
+
+    _run(check())
+
+
 def test_save_and_get_token(repo: Repository) -> None:
     async def check():
         await repo.save_token("access123", "refresh456", "2025-01-01T00:00:00", "calendar,drive")
@@ -111,6 +122,32 @@ def test_set_ai_enabled(repo: Repository) -> None:
     _run(check())
 
 
+def test_get_meeting_by_bot_id(repo: Repository) -> None:
+    async def check():
+        meeting = {
+            "id": "ev-bot",
+            "title": "M",
+            "description": "",
+            "start_time": "2025-01-01T10:00:00",
+            "end_time": "2025-01-01T11:00:00",
+            "meeting_url": "url",
+            "calendar_id": "primary",
+            "ai_enabled": 0,
+            "bot_id": None,
+            "bot_status": "idle",
+        }
+        await repo.upsert_meeting(meeting)
+        await repo.update_bot_status("ev-bot", "bot-42", "joining")
+
+        assert (await repo.get_meeting_by_bot_id("bot-42"))["id"] == "ev-bot"
+        assert await repo.get_meeting_by_bot_id("bot-42", ai_enabled_only=True) is None
+        await repo.set_ai_enabled("ev-bot", True)
+        assert (await repo.get_meeting_by_bot_id("bot-42", ai_enabled_only=True))["id"] == "ev-bot"
+        assert await repo.get_meeting_by_bot_id("unknown") is None
+
+    _run(check())
+
+
 def test_add_and_list_materials(repo: Repository) -> None:
     async def check():
         meeting = {
@@ -172,6 +209,56 @@ def test_conversation_log(repo: Repository) -> None:
     _run(check())
 
 
+def _meeting(meeting_id: str) -> dict:
+    return {
+        "id": meeting_id,
+        "title": "M",
+        "description": "",
+        "start_time": "2025-01-01T10:00:00",
+        "end_time": "2025-01-01T11:00:00",
+        "meeting_url": "url",
+        "calendar_id": "primary",
+        "ai_enabled": 0,
+        "bot_id": None,
+        "bot_status": "idle",
+    }
+
+
+def test_batcher_writes_on_flush_in_order(repo: Repository) -> None:
+    async def check():
+        await repo.upsert_meeting(_meeting("ev-batch"))
+        batcher = ConversationLogBatcher(repo, flush_interval=60)
+        batcher.add("ev-batch", "bot1", "Alice", "質問です", "human")
+        batcher.add("ev-batch", "bot1", "Bot", "回答です", "bot", "answered")
+        assert await repo.get_conversation_log("ev-batch") == []
+
+        await batcher.flush()
+        log = await repo.get_conversation_log("ev-batch")
+        assert [(e["speaker"], e["utterance_type"], e["response_category"]) for e in log] == [
+            ("Alice", "human", None),
+            ("Bot", "bot", "answered"),
+        ]
+        await batcher.close()
+
+    _run(check())
+
+
+def test_batcher_flushes_full_batch_and_on_close(repo: Repository) -> None:
+    async def check():
+        await repo.upsert_meeting(_meeting("ev-full"))
+        batcher = ConversationLogBatcher(repo, flush_interval=60, max_batch=2)
+        batcher.add("ev-full", "bot1", "Alice", "一", "human")
+        batcher.add("ev-full", "bot1", "Alice", "二", "human")
+        await asyncio.sleep(0.05)
+        assert len(await repo.get_conversation_log("ev-full")) == 2
+
+        batcher.add("ev-full", "bot1", "Alice", "三", "human")
+        await batcher.close()
+        assert [e["text"] for e in await repo.get_conversation_log("ev-full")] == ["一", "二", "三"]
+
+    _run(check())
+
+
 def test_save_and_get_minutes(repo: Repository) -> None:
     async def check():
         meeting = {
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -42,6 +43,39 @@ def _make_mock_client(mock_session: AsyncMock) -> MagicMock:
     return mock_client
 
 
+def _make_receiving_session(messages: list[object]) -> AsyncMock:
+    """Create a mock live session whose receive() yields the given server messages."""
+
+    async def _receive():  # type: ignore[no-untyped-def]
+        for message in messages:
+            yield message
+
+    mock_session = AsyncMock()
+    mock_session.receive = _receive
+    return mock_session
+
+
+def _audio_message(data: bytes) -> object:
+    from google.genai import types
+
+    part = types.Part(inline_data=types.Blob(data=data, mime_type="audio/pcm;rate=24000"))
+    return types.LiveServerMessage(server_content=types.LiveServerContent(model_turn=types.Content(parts=[part])))
+
+
+def _transcript_message(text: str) -> object:
+    from google.genai import types
+
+    return types.LiveServerMessage(
+        server_content=types.LiveServerContent(output_transcription=types.Transcription(text=text))
+    )
+
+
+def _turn_complete_message() -> object:
+    from google.genai import types
+
+    return types.LiveServerMessage(server_content=types.LiveServerContent(turn_complete=True))
+
+
 # --- GeminiLiveSession ---
 
 
@@ -108,8 +142,223 @@ async def test_session_send_audio_forwards_to_gemini() -> None:
         )
         await session.connect()
         await session.send_audio(b"\x00\x01\x02\x03")
+        mock_session.send_realtime_input.assert_not_awaited()
+        await session.flush_audio()
 
     mock_session.send_realtime_input.assert_awaited_once()
+    assert mock_session.send_realtime_input.await_args.kwargs["audio"].data == b"\x00\x01\x02\x03"
+
+
+@pytest.mark.asyncio
+async def test_session_send_audio_coalesces_into_100ms_frames() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import _SEND_FLUSH_BYTES, GeminiLiveSession
+
+    mock_session = AsyncMock()
+    session = GeminiLiveSession(
+        bot_id="test-bot",
+        system_instruction="Test",
+        on_audio_chunk=lambda d: None,
+        on_turn_complete=lambda a, t: None,
+        on_text_chunk=lambda t: None,
+    )
+    session._session = mock_session
+    session._connected = True
+
+    frame = b"\x01\x00" * 160  # 10 ms at 16 kHz
+    for _ in range(25):
+        await session.send_audio(frame)
+
+    sent = [c.kwargs["audio"].data for c in mock_session.send_realtime_input.await_args_list]
+    assert sent == [frame * 10, frame * 10]
+    assert session._send_accum_size == 5 * len(frame) < _SEND_FLUSH_BYTES
+
+    await session.send_text("hello")
+    assert mock_session.send_realtime_input.await_args.kwargs["audio"].data == frame * 5
+    assert session._send_accum == []
+
+
+@pytest.mark.asyncio
+async def test_receive_loop_joins_audio_chunks_on_turn_complete() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import GeminiLiveSession
+
+    turns: list[tuple[bytes, str]] = []
+    chunks: list[bytes] = []
+    session = GeminiLiveSession(
+        bot_id="test-bot",
+        system_instruction="Test",
+        on_audio_chunk=chunks.append,
+        on_turn_complete=lambda a, t: turns.append((a, t)),
+        on_text_chunk=lambda t: None,
+    )
+    session._session = _make_receiving_session(
+        [
+            _audio_message(b"\x01\x02"),
+            _transcript_message("こんにちは"),
+            _audio_message(b"\x03\x04"),
+            _turn_complete_message(),
+            _audio_message(b"\x05\x06"),
+            _turn_complete_message(),
+        ]
+    )
+    await session._receive_loop()
+
+    assert chunks == [b"\x01\x02", b"\x03\x04", b"\x05\x06"]
+    assert turns == [(b"\x01\x02\x03\x04", "こんにちは"), (b"\x05\x06", "")]
+    assert session._audio_buffer == []
+
+
+def test_classify_flattens_server_message_in_dispatch_order() -> None:
+    from google.genai import types
+
+    from bot.gemini_live import _KIND_AUDIO, _KIND_RESUME, _KIND_TRANSCRIPT, _KIND_TURN_END, _classify
+
+    parts = [
+        types.Part(inline_data=types.Blob(data=b"\x01", mime_type="audio/pcm")),
+        types.Part(text="ignored"),
+        types.Part(inline_data=types.Blob(data=b"\x02", mime_type="audio/pcm")),
+    ]
+    message = types.LiveServerMessage(
+        server_content=types.LiveServerContent(
+            model_turn=types.Content(parts=parts),
+            output_transcription=types.Transcription(text="hi"),
+            turn_complete=True,
+        )
+    )
+    assert _classify(message) == [
+        (_KIND_AUDIO, b"\x01"),
+        (_KIND_AUDIO, b"\x02"),
+        (_KIND_TRANSCRIPT, "hi"),
+        (_KIND_TURN_END, None),
+    ]
+
+    update = types.LiveServerSessionResumptionUpdate(new_handle="h")
+    assert _classify(types.LiveServerMessage(session_resumption_update=update)) == [(_KIND_RESUME, "h")]
+    assert _classify(types.LiveServerMessage()) == []
+
+
+@pytest.mark.asyncio
+async def test_receive_loop_stores_resumption_handle() -> None:
+    _set_default_test_settings()
+    from google.genai import types
+
+    from bot.gemini_live import GeminiLiveSession
+
+    session = GeminiLiveSession(
+        bot_id="test-bot",
+        system_instruction="Test",
+        on_audio_chunk=lambda d: None,
+        on_turn_complete=lambda a, t: None,
+        on_text_chunk=lambda t: None,
+    )
+    update = types.LiveServerSessionResumptionUpdate(new_handle="handle-123", resumable=True)
+    session._session = _make_receiving_session(
+        [types.LiveServerMessage(session_resumption_update=update), types.LiveServerMessage()]
+    )
+    await session._receive_loop()
+
+    assert session._resumption_handle == "handle-123"
+    assert session._build_config().session_resumption.handle == "handle-123"
+
+
+@pytest.mark.asyncio
+async def test_receive_loop_reads_turn_callback_per_turn() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import GeminiLiveSession
+
+    swapped: list[bytes] = []
+    session = GeminiLiveSession(
+        bot_id="test-bot",
+        system_instruction="Test",
+        on_audio_chunk=lambda d: None,
+        on_turn_complete=lambda a, t: pytest.fail("original callback should have been replaced"),
+        on_text_chunk=lambda t: None,
+    )
+
+    async def _receive():  # type: ignore[no-untyped-def]
+        yield _audio_message(b"\x01\x02")
+        session._on_turn_complete = lambda a, t: swapped.append(a)
+        yield _turn_complete_message()
+
+    session._session = MagicMock(receive=_receive)
+    await session._receive_loop()
+
+    assert swapped == [b"\x01\x02"]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_opens_new_session_before_closing_old() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import GeminiLiveSession
+
+    events: list[str] = []
+    counter = iter(range(1, 10))
+
+    @asynccontextmanager
+    async def _connect(**kwargs):  # type: ignore[no-untyped-def]
+        n = next(counter)
+        events.append(f"open-{n}")
+        try:
+            yield _make_receiving_session([])
+        finally:
+            await asyncio.sleep(0)
+            events.append(f"close-{n}")
+
+    mock_client = MagicMock()
+    mock_client.aio.live.connect = _connect
+    session = GeminiLiveSession(
+        bot_id="test-bot",
+        system_instruction="Test",
+        on_audio_chunk=lambda d: None,
+        on_turn_complete=lambda a, t: None,
+        on_text_chunk=lambda t: None,
+        client=mock_client,
+    )
+    await session.connect()
+    await session._reconnect()
+
+    assert session.connected is True
+    assert events == ["open-1", "open-2"]
+
+    await session.disconnect()
+    assert sorted(events[2:]) == ["close-1", "close-2"]
+    assert not session._teardown_tasks
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reconnects_are_single_flight() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import GeminiLiveSession
+
+    opened: list[int] = []
+
+    @asynccontextmanager
+    async def _connect(**kwargs):  # type: ignore[no-untyped-def]
+        opened.append(len(opened))
+        await asyncio.sleep(0.01)
+        yield _make_receiving_session([])
+
+    mock_client = MagicMock()
+    mock_client.aio.live.connect = _connect
+    session = GeminiLiveSession(
+        bot_id="test-bot",
+        system_instruction="Test",
+        on_audio_chunk=lambda d: None,
+        on_turn_complete=lambda a, t: None,
+        on_text_chunk=lambda t: None,
+        client=mock_client,
+    )
+    await session.connect()
+    await asyncio.gather(session._reconnect(), session._reconnect(), session._reconnect())
+
+    assert opened == [0, 1]
+    assert session.connected is True
+    assert session._reconnect_in_progress is False
+
+    await session._reconnect()
+    assert opened == [0, 1, 2]
+    await session.disconnect()
 
 
 # --- GeminiLiveManager ---
@@ -224,6 +473,63 @@ async def test_manager_create_replaces_existing() -> None:
     await manager.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_manager_concurrent_create_does_not_orphan_sessions() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import GeminiLiveManager, GeminiLiveSession
+
+    connected: list[GeminiLiveSession] = []
+    disconnected: list[GeminiLiveSession] = []
+
+    async def _slow_connect(self: GeminiLiveSession) -> None:
+        await asyncio.sleep(0.01)
+        self._connected = True
+        connected.append(self)
+
+    async def _disconnect(self: GeminiLiveSession) -> None:
+        self._connected = False
+        disconnected.append(self)
+
+    manager = GeminiLiveManager()
+    with (
+        patch.object(GeminiLiveSession, "connect", _slow_connect),
+        patch.object(GeminiLiveSession, "disconnect", _disconnect),
+        patch("bot.gemini_live.genai.Client"),
+    ):
+        await asyncio.gather(
+            *(
+                manager.create_session("bot-1", "Test", lambda d: None, lambda a, t: None, lambda t: None)
+                for _ in range(3)
+            )
+        )
+        live = manager.get_session("bot-1")
+        assert len(connected) == 3
+        assert [s for s in connected if s not in disconnected] == [live]
+
+        await manager.shutdown()
+    assert not manager.has_session("bot-1")
+
+
+@pytest.mark.asyncio
+async def test_manager_shares_one_client_across_sessions() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import GeminiLiveManager
+
+    mock_session = AsyncMock()
+    mock_session.receive = AsyncMock(return_value=_make_mock_async_iter())
+    mock_client = _make_mock_client(mock_session)
+
+    manager = GeminiLiveManager()
+    with patch("bot.gemini_live.genai.Client", return_value=mock_client) as client_cls:
+        session1 = await manager.create_session("bot-1", "Test", lambda d: None, lambda a, t: None, lambda t: None)
+        session2 = await manager.create_session("bot-2", "Test", lambda d: None, lambda a, t: None, lambda t: None)
+        await session1._reconnect()
+
+    client_cls.assert_called_once()
+    assert session1._client is session2._client is mock_client
+    await manager.shutdown()
+
+
 # --- _build_config ---
 
 
@@ -249,3 +555,24 @@ def test_build_config_uses_settings() -> None:
     assert config.speech_config.language_code == "ja-JP"
     assert config.generation_config.temperature == 0.5
     assert config.enable_affective_dialog is True
+
+
+def test_build_config_is_reused_with_fresh_resumption_handle() -> None:
+    _set_default_test_settings()
+    from bot.gemini_live import GeminiLiveSession
+
+    session = GeminiLiveSession(
+        bot_id="cfg-test",
+        system_instruction="Test instruction",
+        on_audio_chunk=lambda d: None,
+        on_turn_complete=lambda a, t: None,
+        on_text_chunk=lambda t: None,
+    )
+    first = session._build_config()
+    assert first.session_resumption.handle is None
+
+    session._resumption_handle = "handle-1"
+    second = session._build_config()
+    assert second is first
+    assert second.session_resumption.handle == "handle-1"
+    assert second.system_instruction.parts[0].text == "Test instruction"
@@ -0,0 +1,167 @@
+"""Tests for auth/google_oauth.py token refresh helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import auth.google_oauth as google_oauth
+from auth.google_oauth import build_flow, credentials_from_token_row, refresh_if_needed, refresh_stored_token
+from config import settings
+
+
+@pytest.fixture(autouse=True)
+def _reset_cached_creds():
+    """Isolate tests from credentials cached by earlier refreshes."""
+    google_oauth._cached_creds = None
+    yield
+    google_oauth._cached_creds = None
+
+
+def _token_row(expires_in: timedelta) -> dict[str, str]:
+    expiry = datetime.now(timezone.utc) + expires_in
+    return {
+        "access_token": "access",
+        "refresh_token": "refresh",
+        "token_expiry": expiry.isoformat(),
+        "scopes": ",".join(google_oauth.SCOPES),
+    }
+
+
+def test_credentials_from_token_row_reads_expiry() -> None:
+    """Stored expiry is restored as naive UTC so validity checks work."""
+    creds = credentials_from_token_row(_token_row(timedelta(minutes=30)))
+    assert creds.expiry is not None and creds.expiry.tzinfo is None
+    assert creds.valid
+
+    expired = credentials_from_token_row(_token_row(timedelta(minutes=-1)))
+    assert not expired.valid
+
+
+@pytest.mark.asyncio
+async def test_refresh_if_needed_skips_valid_token() -> None:
+    """Valid credentials are returned without contacting the token endpoint."""
+    creds = MagicMock(valid=True)
+
+    refreshed, result = await refresh_if_needed(creds)
+
+    assert refreshed is False
+    assert result is creds
+    creds.refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_if_needed_refreshes_off_event_loop() -> None:
+    """Expired credentials are refreshed in a worker thread, not on the loop thread."""
+    loop_thread = threading.get_ident()
+    refresh_threads: list[int] = []
+    creds = MagicMock(valid=False, refresh_token="refresh")  # noqa: S106
+    creds.refresh.side_effect = lambda request: refresh_threads.append(threading.get_ident())
+
+    refreshed, result = await refresh_if_needed(creds)
+
+    assert refreshed is True
+    assert result is creds
+    assert refresh_threads and refresh_threads[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_refresh_if_needed_without_refresh_token_raises() -> None:
+    """Expired credentials without a refresh token cannot be recovered."""
+    creds = MagicMock(valid=False, refresh_token=None)
+
+    with pytest.raises(ValueError):
+        await refresh_if_needed(creds)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_upstream_call() -> None:
+    """Concurrent callers with the same expired token trigger a single refresh."""
+    calls: list[int] = []
+
+    def _make_creds() -> MagicMock:
+        creds = MagicMock(valid=False, refresh_token="shared")  # noqa: S106
+
+        def _refresh(request: object) -> None:
+            calls.append(1)
+            time.sleep(0.05)
+            creds.valid = True
+
+        creds.refresh.side_effect = _refresh
+        return creds
+
+    results = await asyncio.gather(*(refresh_if_needed(_make_creds()) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert [refreshed for refreshed, _ in results].count(True) == 1
+    refreshed_creds = next(creds for refreshed, creds in results if refreshed)
+    assert all(creds is refreshed_creds for _, creds in results)
+
+
+@pytest.mark.asyncio
+async def test_refresh_stored_token_waits_until_close_to_expiry() -> None:
+    """A token with plenty of lifetime left is not refreshed."""
+    repo = MagicMock()
+    repo.get_token = AsyncMock(return_value=_token_row(timedelta(hours=1)))
+    repo.update_token = AsyncMock()
+
+    with patch("auth.google_oauth.Credentials.refresh") as mock_refresh:
+        delay = await refresh_stored_token(repo)
+
+    assert 0 < delay <= google_oauth._REFRESH_POLL_SECONDS
+    mock_refresh.assert_not_called()
+    repo.update_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_stored_token_refreshes_ahead_of_expiry() -> None:
+    """A token within the lead window is refreshed and persisted before it expires."""
+    repo = MagicMock()
+    repo.get_token = AsyncMock(return_value=_token_row(timedelta(minutes=4)))
+    repo.update_token = AsyncMock()
+
+    with patch("auth.google_oauth.Credentials.refresh") as mock_refresh:
+        await refresh_stored_token(repo)
+
+    mock_refresh.assert_called_once()
+    repo.update_token.assert_awaited_once()
+
+
+def test_refresh_lock_is_created_per_event_loop() -> None:
+    async def _lock() -> asyncio.Lock:
+        lock = google_oauth._get_refresh_lock()
+        assert google_oauth._get_refresh_lock() is lock
+        async with lock:
+            return lock
+
+    # A lock left over from another loop (another test, or uvicorn vs. import) is replaced, not reused
+    assert asyncio.run(_lock()) is not asyncio.run(_lock())
+
+
+def test_build_flow_reuses_client_config() -> None:
+    """The client config is built once per settings combination."""
+    settings.google_redirect_uri = "http://localhost:8000/auth/google/callback"
+    google_oauth._client_config.cache_clear()
+
+    first = build_flow()
+    second = build_flow(state="abc")
+
+    assert first.client_config == second.client_config
+    assert google_oauth._client_config.cache_info().misses == 1
+    assert first.redirect_uri == settings.google_redirect_uri
+
+
+def test_build_flow_rejects_invalid_redirect_uri() -> None:
+    """A malformed redirect URI is reported instead of producing a broken login URL."""
+    original = settings.google_redirect_uri
+    settings.google_redirect_uri = "localhost/callback"
+    try:
+        with pytest.raises(ValueError):
+            build_flow()
+    finally:
+        settings.google_redirect_uri = original
@@ -70,3 +70,169 @@ def test_empty_directory_returns_zero_docs() -> None:
     kb = KnowledgeBase(tmpdir)
     assert kb.document_count == 0
     assert kb.search("anything") == []
+
+
+def test_search_ranks_by_weighted_keyword_counts() -> None:
+    tmpdir = _create_temp_knowledge(
+        {
+            "a.md": "Gemini Gemini Gemini live audio",
+            "b.md": "Recall bot audio audio",
+            "c.md": "Unrelated content",
+        }
+    )
+    kb = KnowledgeBase(tmpdir)
+    assert [d["filename"] for d in kb.search("gemini audio audio")] == ["a.md", "b.md"]
+
+
+def test_documents_store_lowercased_content_at_load() -> None:
+    tmpdir = _create_temp_knowledge({"doc.md": "FastAPI And GCP"})
+    kb = KnowledgeBase(tmpdir)
+    assert kb._documents.contents_lower[0] == "fastapi and gcp"
+    assert kb.search("FASTAPI") == [
+        {"filename": "doc.md", "path": str(Path(tmpdir) / "doc.md"), "content": "FastAPI And GCP"}
+    ]
+
+    (Path(tmpdir) / "doc.md").write_text("Now About Vertex", encoding="utf-8")
+    kb.reload()
+    assert kb._documents.contents_lower[0] == "now about vertex"
+
+
+def test_search_results_are_cached_until_reload() -> None:
+    tmpdir = _create_temp_knowledge({"doc.md": "Python and FastAPI"})
+    kb = KnowledgeBase(tmpdir)
+
+    first = kb.search("fastapi python")
+    assert kb.search("Python  FastAPI") == first
+    assert kb._documents.search_cached.cache_info().hits == 1
+    assert kb.get_context("python fastapi") == kb.get_context("FastAPI Python")
+    assert kb._documents.context_cached.cache_info().hits == 1
+
+    (Path(tmpdir) / "doc.md").write_text("Only Java here", encoding="utf-8")
+    kb.reload()
+    assert kb.search("fastapi python") == []
+    assert kb.get_context("java") == "[doc.md]\nOnly Java here"
+
+
+def test_search_prefilters_candidates_without_changing_substring_matching() -> None:
+    tmpdir = _create_temp_knowledge(
+        {
+            "api.md": "FastAPI makes building an API easy.",
+            "meeting.md": "明日の会議は午後です。会議室はA。",
+            "other.md": "Nothing relevant",
+        }
+    )
+    kb = KnowledgeBase(tmpdir)
+
+    assert kb._documents.candidates("api") == {0}
+    assert kb._documents.candidates("会議") == {1}
+    assert kb._documents.candidates("zz") == set()
+    assert [d["filename"] for d in kb.search("api")] == ["api.md"]
+    assert [d["filename"] for d in kb.search("会議 api")] == ["api.md", "meeting.md"]
+
+
+def test_search_counts_each_keyword_independently() -> None:
+    docs = {
+        "a.md": "会議室 会議室",  # 会議 x2 + 会議室 x2
+        "b.md": "会議 会議 会議",  # 会議 x3
+        "c.md": "ああああ abcabc",
+    }
+    kb = KnowledgeBase(_create_temp_knowledge(docs))
+
+    def baseline(query: str) -> list[str]:
+        keywords = query.lower().split()
+        scores = {name: sum(text.lower().count(kw) for kw in keywords) for name, text in docs.items()}
+        return sorted((name for name, score in scores.items() if score), key=lambda name: -scores[name])
+
+    for query in ("会議 会議室", "ああ", "abc bca cab", "会議 会議"):
+        assert [d["filename"] for d in kb.search(query)] == baseline(query), query
+
+
+def test_load_skips_unreadable_files_and_keeps_order() -> None:
+    tmpdir = _create_temp_knowledge({f"doc{i:02d}.md": f"document {i}" for i in range(20)})
+    (Path(tmpdir) / "broken.md").write_bytes(b"\xff\xfe invalid utf-8 \xff")
+    (Path(tmpdir) / "empty.md").write_text("   ", encoding="utf-8")
+
+    kb = KnowledgeBase(tmpdir)
+
+    assert kb._documents.filenames == [f"doc{i:02d}.md" for i in range(20)]
+
+
+def test_load_walks_subdirectories_in_path_order() -> None:
+    tmpdir = _create_temp_knowledge({"b.md": "root b", "NOTES.TXT": "upper suffix", "skip.pdf": "no"})
+    nested = Path(tmpdir) / "a" / "deep"
+    nested.mkdir(parents=True)
+    (nested / "c.md").write_text("nested c", encoding="utf-8")
+    (Path(tmpdir) / "dir.md").mkdir()  # a directory with a document suffix is not a document
+
+    kb = KnowledgeBase(tmpdir)
+
+    assert kb._documents.filenames == ["NOTES.TXT", "c.md", "b.md"]
+
+
+def test_search_top_k_keeps_load_order_on_ties() -> None:
+    tmpdir = _create_temp_knowledge({f"doc{i}.md": "api " * (2 if i in (1, 3) else 1) for i in range(6)})
+    kb = KnowledgeBase(tmpdir)
+    assert [d["filename"] for d in kb.search("api", max_results=4)] == ["doc1.md", "doc3.md", "doc0.md", "doc2.md"]
+    assert kb.search("api", max_results=0) == []
+
+
+def test_reload_skips_work_when_files_are_unchanged() -> None:
+    tmpdir = _create_temp_knowledge({"doc.md": "Python and FastAPI"})
+    kb = KnowledgeBase(tmpdir)
+    first = kb.search("python")
+
+    kb.reload()
+    assert kb.search("python") == first
+    assert kb._documents.search_cached.cache_info().hits == 1  # caches kept: nothing was reloaded
+
+    (Path(tmpdir) / "new.txt").write_text("More Python", encoding="utf-8")
+    kb.reload()
+    assert kb.document_count == 2
+    assert kb._documents.search_cached.cache_info().currsize == 0
+
+
+def test_reload_after_directory_removed_drops_documents() -> None:
+    tmpdir = _create_temp_knowledge({"doc.md": "Python"})
+    kb = KnowledgeBase(tmpdir)
+    (Path(tmpdir) / "doc.md").unlink()
+    Path(tmpdir).rmdir()
+
+    kb.reload()
+    assert kb.document_count == 0
+    kb.reload()
+    assert kb.document_count == 0
+
+
+def test_search_during_reload_never_caches_a_partial_document_set() -> None:
+    import threading
+
+    tmpdir = _create_temp_knowledge({f"doc{i:03d}.md": f"shared topic {i}" for i in range(200)})
+    kb = KnowledgeBase(tmpdir)
+    stop = threading.Event()
+    partial: list[int] = []
+
+    def _search() -> None:
+        while not stop.is_set():
+            count = len(kb.search("shared", max_results=1000))
+            if count not in (200, 201):
+                partial.append(count)
+
+    reader = threading.Thread(target=_search)
+    reader.start()
+    try:
+        for i in range(5):
+            (Path(tmpdir) / "extra.md").write_text(f"shared extra {i}" * (i + 1), encoding="utf-8")
+            kb.reload()
+    finally:
+        stop.set()
+        reader.join()
+
+    assert partial == []
+    assert len(kb.search("shared", max_results=1000)) == 201
+
+
+def test_query_tokens_ignore_attached_punctuation() -> None:
+    tmpdir = _create_temp_knowledge({"doc.md": "FastAPI と Gemini の連携", "other.md": "unrelated"})
+    kb = KnowledgeBase(tmpdir)
+    assert [d["filename"] for d in kb.search("「FastAPI」、gemini?")] == ["doc.md"]
+    assert kb.search("a , . ?") == []
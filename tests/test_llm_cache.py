@@ -0,0 +1,51 @@
+"""Tests for bot.llm_cache.LLMCache."""
+
+from __future__ import annotations
+
+import pytest
+
+from bot import llm_cache
+from bot.llm_cache import LLMCache, cache_key
+
+
+def test_cache_key_is_stable_and_parameter_sensitive() -> None:
+    assert cache_key("gemini", "prompt", temperature=0.7) == cache_key("gemini", "prompt", temperature=0.7)
+    assert cache_key("gemini", "prompt", temperature=0.7) != cache_key("gemini", "prompt", temperature=0.2)
+    assert cache_key("gemini", "prompt") != cache_key("other", "prompt")
+
+
+def test_get_counts_hits_and_misses() -> None:
+    cache = LLMCache(max_entries=4, ttl_seconds=60)
+    assert cache.get("k") is None
+    cache.set("k", "answer")
+    assert cache.get("k") == "answer"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_lru_eviction_keeps_recently_used() -> None:
+    cache = LLMCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "a" becomes most recent
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_expired_entries_are_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now[0])
+    cache = LLMCache(max_entries=4, ttl_seconds=10)
+    cache.set("k", "answer")
+    now[0] = 109.0
+    assert cache.get("k") == "answer"
+    now[0] = 110.0
+    assert cache.get("k") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_zero_capacity_disables_cache() -> None:
+    cache = LLMCache(max_entries=0, ttl_seconds=60)
+    cache.set("k", "answer")
+    assert cache.get("k") is None
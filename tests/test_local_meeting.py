@@ -85,7 +85,7 @@ async def test_handle_turn_plays_audio() -> None:
     mock_gemini_session.set_mute_duration = MagicMock()
 
     mock_bridge = MagicMock()
-    mock_bridge.play_audio = MagicMock()
+    mock_bridge.play_audio = AsyncMock()
 
     mock_repo = AsyncMock()
     mock_repo.add_conversation_entry = AsyncMock()
@@ -111,10 +111,11 @@ async def test_handle_turn_plays_audio() -> None:
     await session._handle_turn(audio_data, text_data)
 
     # Verify audio was played
-    mock_bridge.play_audio.assert_called_once_with(audio_data, settings.gemini_live_output_sample_rate)
+    mock_bridge.play_audio.assert_awaited_once_with(audio_data, settings.gemini_live_output_sample_rate)
 
     # Verify echo suppression
     assert mock_gemini_session.set_mute_duration.call_count == 2  # pre-mute + post-mute
+    assert mock_gemini_session.set_mute_duration.call_args_list[-1].args[0] == pytest.approx(1.6)
 
     # Verify response was persisted
     mock_repo.add_conversation_entry.assert_awaited_once()
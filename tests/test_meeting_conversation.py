@@ -21,6 +21,16 @@ def test_classify_none() -> None:
     assert text == "通常の応答です。"
 
 
+def test_classify_tag_is_case_insensitive_and_anchored() -> None:
+    text, cat = MeetingConversationSession.classify_response("[Taken_Back]確認します。")
+    assert cat == "taken_back"
+    assert text == "確認します。"
+
+    text, cat = MeetingConversationSession.classify_response("回答です [ANSWERED]")
+    assert cat is None
+    assert text == "回答です [ANSWERED]"
+
+
 def test_build_materials_context() -> None:
     session = MeetingConversationSession("bot1", "meeting1")
     materials = [
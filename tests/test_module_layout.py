@@ -0,0 +1,36 @@
+"""Static checks on module layout that ruff does not cover."""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+_PACKAGES = ("auth", "bot", "calendar_sync", "db", "materials", "minutes")
+
+
+def _source_files() -> list[Path]:
+    files = [_ROOT / "main.py", _ROOT / "config.py"]
+    for package in _PACKAGES:
+        files.extend(sorted((_ROOT / package).rglob("*.py")))
+    return files
+
+
+def _top_level_names(tree: ast.Module) -> list[str]:
+    """Names bound by top-level defs/classes and by module-level ``router = ...`` assignments."""
+    names: list[str] = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names.extend(t.id for t in node.targets if isinstance(t, ast.Name) and t.id == "router")
+    return names
+
+
+def test_no_module_defines_a_top_level_name_twice() -> None:
+    duplicates = {}
+    for path in _source_files():
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        repeated = sorted(name for name, count in Counter(_top_level_names(tree)).items() if count > 1)
+        if repeated:
+            duplicates[str(path.relative_to(_ROOT))] = repeated
+    assert duplicates == {}
@@ -16,6 +16,12 @@ def test_loads_profile_with_name() -> None:
     assert persona.name == "Taro"
 
 
+def test_loads_profile_with_lowercase_name_key() -> None:
+    path = _write_profile("# Profile\n- Role: Engineer\n  - name: Hanako \n- Name: Ignored\n")
+    persona = Persona(path)
+    assert persona.name == "Hanako"
+
+
 def test_default_profile_when_file_missing() -> None:
     persona = Persona("/nonexistent/profile.md")
     assert persona.name == "AI Avatar"
@@ -71,3 +77,24 @@ def test_build_live_system_prompt_with_materials() -> None:
     assert "Q3の売上は1000万円です" in prompt
     assert "添付資料" in prompt
     assert "ナレッジベース" in prompt
+
+
+def test_build_live_system_prompt_is_cached_until_reload() -> None:
+    path = _write_profile("# Profile\n- Name: Taro\n")
+    persona = Persona(path)
+    first = persona.build_live_system_prompt("KB", "doc")
+    assert persona.build_live_system_prompt("KB", "doc") is first
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Profile\n- Name: Jiro\n")
+    persona.reload()
+    prompt = persona.build_live_system_prompt("KB", "doc")
+    assert "Jiro" in prompt
+    assert "Taro" not in prompt
+
+
+def test_knowledge_sections_match_inline_prompt_sections() -> None:
+    persona = Persona("/nonexistent/profile.md")
+    assert persona.build_knowledge_section("") == ""
+    assert persona.build_knowledge_section("KB") in persona.build_system_prompt("KB")
+    assert persona.build_meeting_knowledge_section("KB") in persona.build_meeting_system_prompt("KB")
@@ -0,0 +1,122 @@
+"""Tests for bot.recall_client.RecallClient."""
+
+from __future__ import annotations
+
+import base64
+import json
+
+import httpx
+import pytest
+
+from bot.recall_client import RecallClient
+from config import settings
+
+
+def _set_default_test_settings() -> None:
+    settings.recall_api_key = "test-recall-key"
+    settings.recall_base_url = "https://test.recall.ai/api/v1"
+    settings.webhook_base_url = None
+
+
+def _client_with_transport(transport: httpx.MockTransport) -> RecallClient:
+    """Build a RecallClient whose pooled client talks to ``transport``."""
+    return RecallClient(transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_pooled_client() -> None:
+    """Every method goes through the same AsyncClient with the base URL and auth header applied."""
+    _set_default_test_settings()
+    seen: list[tuple[str, str, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url), request.headers["Authorization"]))
+        return httpx.Response(200, json={"id": "bot-1"})
+
+    client = _client_with_transport(httpx.MockTransport(_handler))
+    pool = client._client
+
+    await client.create_bot("https://meet.google.com/abc")
+    await client.get_bot_status("bot-1")
+    await client.send_audio("bot-1", b"\x00\x00\x00")
+    await client.leave_meeting("bot-1")
+
+    assert client._client is pool
+    assert seen == [
+        ("POST", "https://test.recall.ai/api/v1/bot", "Token test-recall-key"),
+        ("GET", "https://test.recall.ai/api/v1/bot/bot-1", "Token test-recall-key"),
+        ("POST", "https://test.recall.ai/api/v1/bot/bot-1/output_audio", "Token test-recall-key"),
+        ("POST", "https://test.recall.ai/api/v1/bot/bot-1/leave_call", "Token test-recall-key"),
+    ]
+    await client.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_send_audio_payload() -> None:
+    _set_default_test_settings()
+    bodies: list[dict[str, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/json"
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={})
+
+    client = _client_with_transport(httpx.MockTransport(_handler))
+    await client.send_audio("bot-1", b"mp3")
+    assert bodies == [{"kind": "mp3", "b64_data": "bXAz"}]
+    await client.aclose()
+
+
+def test_output_audio_body_is_valid_json_for_any_bytes() -> None:
+    from bot.recall_client import _output_audio_body
+
+    mp3 = bytes(range(256)) * 40
+    body = json.loads(_output_audio_body(mp3))
+    assert body == {"kind": "mp3", "b64_data": base64.b64encode(mp3).decode("ascii")}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_json_round_trip_with_and_without_orjson(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Request bodies and responses are handled the same whether or not orjson is installed."""
+    _set_default_test_settings()
+    import bot.recall_client as recall_client
+
+    if not use_orjson:
+        monkeypatch.setattr(recall_client, "orjson", None)
+    elif recall_client.orjson is None:
+        pytest.skip("orjson not installed")
+    bodies: list[dict[str, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"id": "bot-1", "bot_name": "アバター"})
+
+    client = _client_with_transport(httpx.MockTransport(_handler))
+    data = await client.create_bot_with_audio("https://meet.google.com/abc", "アバター")
+    assert data == {"id": "bot-1", "bot_name": "アバター"}
+    assert bodies[0]["bot_name"] == "アバター"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_until_closed() -> None:
+    _set_default_test_settings()
+    from bot.recall_client import close_recall_client, get_recall_client
+
+    first = get_recall_client()
+    assert get_recall_client() is first
+
+    await close_recall_client()
+    assert first.is_closed
+    second = get_recall_client()
+    assert second is not first
+    await close_recall_client()
+
+
+def test_recall_client_requires_api_key() -> None:
+    settings.recall_api_key = None
+    with pytest.raises(RuntimeError):
+        RecallClient()
+    _set_default_test_settings()
@@ -0,0 +1,41 @@
+"""Tests for bot.semantic_cache.SemanticCache."""
+
+from __future__ import annotations
+
+from bot.semantic_cache import SemanticCache
+
+
+def test_lookup_returns_entry_above_threshold() -> None:
+    cache = SemanticCache(threshold=0.92, max_entries=8)
+    cache.add([1.0, 0.0, 0.0], "[ANSWERED] 売上は1000万円です。", b"mp3")
+
+    assert cache.lookup([0.98, 0.1, 0.0]) == ("[ANSWERED] 売上は1000万円です。", b"mp3")
+    assert cache.lookup([0.5, 0.5, 0.5]) is None
+
+
+def test_lookup_picks_most_similar_entry() -> None:
+    cache = SemanticCache(threshold=0.5, max_entries=8)
+    cache.add([1.0, 0.0], "x", None)
+    cache.add([0.0, 1.0], "y", None)
+    assert cache.lookup([0.2, 0.9]) == ("y", None)
+
+
+def test_fifo_eviction_overwrites_oldest() -> None:
+    cache = SemanticCache(threshold=0.99, max_entries=2)
+    cache.add([1.0, 0.0, 0.0], "a", None)
+    cache.add([0.0, 1.0, 0.0], "b", None)
+    cache.add([0.0, 0.0, 1.0], "c", None)
+
+    assert len(cache) == 2
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
+    assert cache.lookup([0.0, 1.0, 0.0]) == ("b", None)
+    assert cache.lookup([0.0, 0.0, 1.0]) == ("c", None)
+
+
+def test_empty_zero_and_mismatched_vectors_miss() -> None:
+    cache = SemanticCache()
+    assert cache.lookup([1.0, 0.0]) is None
+    cache.add([0.0, 0.0], "zero", None)
+    assert len(cache) == 0
+    cache.add([1.0, 0.0], "ok", None)
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
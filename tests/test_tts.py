@@ -1,35 +1,75 @@
 import base64
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from bot import tts
 
 
-def test_synthesize_japanese_calls_client() -> None:
+def _mock_client(audio_content: bytes) -> MagicMock:
     mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.audio_content = b"fake-mp3-data"
-    mock_client.synthesize_speech.return_value = mock_response
+    mock_client.synthesize_speech = AsyncMock(return_value=MagicMock(audio_content=audio_content))
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_synthesize_japanese_calls_client() -> None:
+    mock_client = _mock_client(b"fake-mp3-data")
+    tts._synth_cache.clear()
 
     with patch.object(tts, "_tts_client", mock_client):
-        result = tts.synthesize_japanese("テスト音声")
+        result = await tts.synthesize_japanese("テスト音声")
 
     assert result == b"fake-mp3-data"
-    mock_client.synthesize_speech.assert_called_once()
+    mock_client.synthesize_speech.assert_awaited_once()
+    tts._synth_cache.clear()
 
 
-def test_synthesize_to_base64_returns_encoded() -> None:
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.audio_content = b"fake-mp3-data"
-    mock_client.synthesize_speech.return_value = mock_response
+@pytest.mark.asyncio
+async def test_synthesize_to_base64_returns_encoded() -> None:
+    mock_client = _mock_client(b"fake-mp3-data")
+    tts._synth_cache.clear()
 
     with patch.object(tts, "_tts_client", mock_client):
-        result = tts.synthesize_to_base64("テスト")
+        result = await tts.synthesize_to_base64("テスト")
 
     decoded = base64.b64decode(result)
     assert decoded == b"fake-mp3-data"
+    tts._synth_cache.clear()
 
 
 def test_is_available_false_when_not_initialized() -> None:
     with patch.object(tts, "_tts_client", None):
         assert tts.is_available() is False
+
+
+@pytest.mark.asyncio
+async def test_synthesize_japanese_caches_by_text_and_voice() -> None:
+    mock_client = _mock_client(b"cached-mp3")
+    tts._synth_cache.clear()
+
+    with patch.object(tts, "_tts_client", mock_client):
+        assert await tts.synthesize_japanese("よろしくお願いします") == b"cached-mp3"
+        assert await tts.synthesize_japanese("よろしくお願いします") == b"cached-mp3"
+        assert mock_client.synthesize_speech.await_count == 1
+
+        with patch.object(tts.settings, "tts_voice_name", "ja-JP-Neural2-C"):
+            await tts.synthesize_japanese("よろしくお願いします")
+        assert mock_client.synthesize_speech.await_count == 2
+
+    tts._synth_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_synthesize_cache_evicts_least_recently_used() -> None:
+    mock_client = _mock_client(b"mp3")
+    tts._synth_cache.clear()
+
+    with patch.object(tts, "_tts_client", mock_client), patch.object(tts, "_SYNTH_CACHE_SIZE", 2):
+        await tts.synthesize_japanese("一")
+        await tts.synthesize_japanese("二")
+        await tts.synthesize_japanese("一")
+        await tts.synthesize_japanese("三")
+
+    assert [key[0] for key in tts._synth_cache] == ["一", "三"]
+    tts._synth_cache.clear()
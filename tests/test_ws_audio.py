@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import contextlib
+import json
 from unittest.mock import MagicMock
 
+import pytest
 from fastapi.testclient import TestClient
 
 import bot.router as router_mod
@@ -56,6 +60,62 @@ def test_ws_audio_rejects_when_no_session() -> None:
         ws_audio_mod._live_manager = old_manager
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_ws_audio_forwards_frames_in_order(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(ws_audio_mod, "orjson", None)
+    elif ws_audio_mod.orjson is None:
+        pytest.skip("orjson not installed")
+    _set_ws_test_settings()
+    from unittest.mock import AsyncMock
+
+    session = MagicMock(send_audio=AsyncMock(), flush_audio=AsyncMock())
+    mock_manager = MagicMock()
+    mock_manager.get_session.return_value = session
+
+    old_manager = ws_audio_mod._live_manager
+    ws_audio_mod._live_manager = mock_manager
+    try:
+        client = TestClient(app)
+        with client.websocket_connect("/bot/ws/audio") as ws:
+            ws.send_text("not json")  # skipped, not fatal
+            for chunk in (b"one", b"two", b"three"):
+                frame = {
+                    "event": "audio_mixed_raw.data",
+                    "data": {"bot": {"id": "bot-ws"}, "data": {"buffer": base64.b64encode(chunk).decode()}},
+                }
+                ws.send_text(json.dumps(frame))
+    finally:
+        ws_audio_mod._live_manager = old_manager
+
+    assert [c.args[0] for c in session.send_audio.await_args_list] == [b"one", b"two", b"three"]
+    session.flush_audio.assert_awaited()
+
+
+def test_ws_audio_forwards_binary_pcm_frames() -> None:
+    _set_ws_test_settings()
+    from unittest.mock import AsyncMock
+
+    session = MagicMock(send_audio=AsyncMock(), flush_audio=AsyncMock())
+    mock_manager = MagicMock()
+    mock_manager.get_session.return_value = session
+
+    old_manager = ws_audio_mod._live_manager
+    ws_audio_mod._live_manager = mock_manager
+    try:
+        client = TestClient(app)
+        with client.websocket_connect("/bot/ws/audio") as ws:
+            ws.send_bytes(b"early")  # bot not identified yet: dropped
+            ws.send_text(json.dumps({"event": "participant_events.speech_on", "data": {"bot": {"id": "bot-ws"}}}))
+            ws.send_bytes(b"\x01\x02")
+            ws.send_bytes(b"\x03\x04")
+    finally:
+        ws_audio_mod._live_manager = old_manager
+
+    mock_manager.get_session.assert_called_once_with("bot-ws")
+    assert [c.args[0] for c in session.send_audio.await_args_list] == [b"\x01\x02", b"\x03\x04"]
+
+
 def test_set_live_manager() -> None:
     _set_ws_test_settings()
 
@@ -128,6 +188,91 @@ def test_classify_by_content_empty() -> None:
     assert _classify_by_content("abc") is None
 
 
+def test_pending_sends_drop_oldest_turn_when_full() -> None:
+    queue: asyncio.Queue[tuple[bytes, str]] = asyncio.Queue(maxsize=ws_audio_mod._PENDING_SENDS_MAX)
+
+    for i in range(ws_audio_mod._PENDING_SENDS_MAX + 2):
+        ws_audio_mod._put_dropping_oldest(queue, (b"pcm", f"turn {i}"), "bot-backlog")
+
+    assert queue.qsize() == ws_audio_mod._PENDING_SENDS_MAX
+    assert queue.get_nowait() == (b"pcm", "turn 2")
+    assert ws_audio_mod._dropped_turns.pop("bot-backlog") == 2
+
+
+@pytest.mark.asyncio
+async def test_turn_text_is_persisted_even_when_its_audio_is_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_ws_test_settings()
+    from unittest.mock import AsyncMock
+
+    session = MagicMock(send_audio=AsyncMock(), flush_audio=AsyncMock(), _on_turn_complete=None)
+    mock_manager = MagicMock()
+    mock_manager.get_session.return_value = session
+    monkeypatch.setattr(ws_audio_mod, "_live_manager", mock_manager)
+    # Recall.ai never accepts the audio, so every turn after the first backs up in the queue
+    monkeypatch.setattr(ws_audio_mod, "pcm_to_mp3", lambda pcm, rate: b"mp3")
+
+    async def stalled_send(bot_id: str, mp3: bytes) -> None:
+        await asyncio.Event().wait()
+
+    recall = MagicMock(send_audio=AsyncMock(side_effect=stalled_send))
+    monkeypatch.setattr("bot.recall_client.get_recall_client", lambda: recall)
+    monkeypatch.setattr(router_mod, "_bot_meeting_map", {"bot-drop": "meeting-drop"})
+    conversation_log = MagicMock()
+    websocket = MagicMock(app=MagicMock(state=MagicMock(conversation_log=conversation_log)))
+    frames = [{"type": "websocket.receive", "text": json.dumps({"data": {"bot": {"id": "bot-drop"}}})}]
+
+    async def receive() -> dict:
+        if frames:
+            return frames.pop()
+        await asyncio.Event().wait()  # connection stays open with no more frames
+        return {}
+
+    websocket.receive = receive
+    websocket.accept = AsyncMock()
+
+    bridge = asyncio.create_task(ws_audio_mod.ws_audio_bridge(websocket))
+    while session._on_turn_complete is None:
+        await asyncio.sleep(0)
+    turns = ws_audio_mod._PENDING_SENDS_MAX + 3
+    for i in range(turns):
+        await session._on_turn_complete(b"pcm", f"返答{i}です。")
+        await asyncio.sleep(0)
+    assert not bridge.done()
+    bridge.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await bridge
+
+    assert recall.send_audio.await_count == 1
+    assert [c.args[3] for c in conversation_log.add.call_args_list] == [f"返答{i}です。" for i in range(turns)]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_completes_when_final_flush_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_ws_test_settings()
+    from unittest.mock import AsyncMock
+
+    original_callback = MagicMock()
+    session = MagicMock(
+        send_audio=AsyncMock(),
+        flush_audio=AsyncMock(side_effect=ConnectionError("gemini closed")),
+        _on_turn_complete=original_callback,
+    )
+    mock_manager = MagicMock()
+    mock_manager.get_session.return_value = session
+    monkeypatch.setattr(ws_audio_mod, "_live_manager", mock_manager)
+    frames = [
+        {"type": "websocket.disconnect", "code": 1000},
+        {"type": "websocket.receive", "text": json.dumps({"data": {"bot": {"id": "bot-flush"}}})},
+    ]
+    websocket = MagicMock(accept=AsyncMock(), receive=AsyncMock(side_effect=lambda: frames.pop()))
+
+    await ws_audio_mod.ws_audio_bridge(websocket)
+
+    session.flush_audio.assert_awaited_once()
+    assert session._on_turn_complete is original_callback
+    assert asyncio.all_tasks() == {asyncio.current_task()}  # reader and sender tasks were not leaked
+
+
 def test_compute_mute_seconds_bounds() -> None:
     from bot.ws_audio import _compute_mute_seconds
 